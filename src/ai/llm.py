@@ -13,11 +13,16 @@ from src.core.config import OllamaConfig
 from dataclasses import dataclass, field
 from typing import Sequence, Callable, Any
 import json
+import time
 import ollama
 from ollama import ChatResponse
 
 from src.core.config import OllamaConfig
 
+# Model lists per Ollama host, reused for this long: host -> (fetched_at, models)
+MODELS_CACHE_TTL_S = 30.0
+_models_cache: dict[str, tuple[float, list[str]]] = {}
+
 
 @dataclass
 class Message:
@@ -229,10 +234,21 @@ class OllamaLLM:
         except Exception:
             return False
 
-    def list_models(self) -> list[str]:
-        """List available models."""
+    def list_models(self, refresh: bool = False) -> list[str]:
+        """List available models, reusing a recent listing from the same host."""
+        host = self.config.host
+        cached = _models_cache.get(host)
+        if (
+            not refresh
+            and cached is not None
+            and time.monotonic() - cached[0] < MODELS_CACHE_TTL_S
+        ):
+            return list(cached[1])
+
         try:
             response = self.client.list()
-            return [model.model for model in response.models]
         except Exception:
             return []
+        models = [model.model for model in response.models]
+        _models_cache[host] = (time.monotonic(), models)
+        return list(models)
@@ -207,7 +207,9 @@ class AidaAssistant(QObject):
             from src.memory.manager import MemoryManager
             self._memory = MemoryManager(
                 data_dir=self.config.memory.data_dir,
-                cache_dir=self.config.memory.cache_dir
+                cache_dir=self.config.memory.cache_dir,
+                embedding_device=self.config.memory.embedding_device,
+                embedding_fp16=self.config.memory.embedding_fp16
             )
             self._memory.get_or_create_session()
         return self._memory
@@ -1183,6 +1185,8 @@ Instructions:
     def cleanup(self) -> None:
         """Clean up resources."""
         self.stop_wake_word_listener()
+        if self._tts:
+            self._tts.cleanup()
         if self._browser:
             self._browser.stop()
         if self._tasks:
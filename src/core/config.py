@@ -13,6 +13,8 @@ class MemoryConfig:
     data_dir: Path = field(default_factory=lambda: Path.home() / ".local/share/aida")
     cache_dir: Path = field(default_factory=lambda: Path.home() / ".cache/aida")
     embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"
+    embedding_device: str = "auto"  # auto, cpu, cuda, mps
+    embedding_fp16: bool = False  # Half precision weights, CUDA only
     max_semantic_results: int = 3
     auto_extract_facts: bool = True
     include_semantic_context: bool = True
@@ -202,6 +204,8 @@ class AidaConfig:
                 "data_dir": str(self.memory.data_dir),
                 "cache_dir": str(self.memory.cache_dir),
                 "embedding_model": self.memory.embedding_model,
+                "embedding_device": self.memory.embedding_device,
+                "embedding_fp16": self.memory.embedding_fp16,
                 "max_semantic_results": self.memory.max_semantic_results,
                 "auto_extract_facts": self.memory.auto_extract_facts,
                 "include_semantic_context": self.memory.include_semantic_context,
@@ -61,6 +61,8 @@ class AidaApp:
 
         self.main_window = MainWindow()
         self.tray = TrayIcon()
+        # Built on first open, then reused
+        self._settings_dialog: SettingsDialog | None = None
 
         self._connect_signals()
 
@@ -133,7 +135,13 @@ class AidaApp:
     @Slot()
     def _show_settings(self) -> None:
         """Show the settings dialog."""
-        dialog = SettingsDialog(self.config, self.main_window)
+        dialog = self._settings_dialog
+        if dialog is None:
+            dialog = SettingsDialog(self.config, self.main_window)
+            dialog.settings_changed.connect(self._on_settings_changed)
+            self._settings_dialog = dialog
+        else:
+            dialog.reload(self.config)
 
         # Load available models
         try:
@@ -142,9 +150,6 @@ class AidaApp:
         except Exception:
             pass
 
-        # Connect settings changed signal
-        dialog.settings_changed.connect(self._on_settings_changed)
-
         dialog.exec()
 
     @Slot()
@@ -174,8 +179,11 @@ class AidaApp:
         # Clear LLM to pick up new model/prompt
         self.assistant._llm = None
 
-        # Clear STT and TTS to pick up new audio devices
+        # Clear STT and TTS to pick up new audio devices; cleanup() also
+        # ends the TTS's preloaded piper process
         self.assistant._stt = None
+        if self.assistant._tts is not None:
+            self.assistant._tts.cleanup()
         self.assistant._tts = None
 
         # Restart wake word listener with new microphone
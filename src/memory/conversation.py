@@ -1,6 +1,8 @@
 """Conversation history storage for AIDA."""
 
 import json
+import re
+import sqlite3
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -137,10 +139,21 @@ class ConversationStore(QObject):
             for row in rows
         ]
 
+    def count_sessions(self) -> int:
+        """Get the total number of sessions."""
+        row = self.db.fetchone("SELECT COUNT(*) as count FROM sessions")
+        return row["count"] if row else 0
+
     def delete_session(self, session_id: str) -> None:
         """Delete a session and all its messages."""
         self.db.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
 
+    def clear_all(self) -> None:
+        """Delete every session and message in one transaction."""
+        with self.db.connection() as conn:
+            conn.execute("DELETE FROM messages")
+            conn.execute("DELETE FROM sessions")
+
     def update_session_title(self, session_id: str, title: str) -> None:
         """Update a session's title."""
         self.db.execute(
@@ -249,25 +262,36 @@ class ConversationStore(QObject):
         query: str,
         session_id: str | None = None
     ) -> list[StoredMessage]:
-        """Full-text search across messages."""
-        search_pattern = f"%{query}%"
-
-        if session_id:
-            rows = self.db.fetchall(
-                """SELECT * FROM messages
-                   WHERE session_id = ? AND content LIKE ?
-                   ORDER BY timestamp DESC
-                   LIMIT 50""",
-                (session_id, search_pattern)
-            )
-        else:
-            rows = self.db.fetchall(
-                """SELECT * FROM messages
-                   WHERE content LIKE ?
-                   ORDER BY timestamp DESC
-                   LIMIT 50""",
-                (search_pattern,)
-            )
+        """Full-text search across messages, best matches first."""
+        # Every word in the query must appear, as a word or word prefix
+        terms = re.findall(r"\w+", query)
+        match_expr = " ".join(f'"{term}"*' for term in terms)
+
+        try:
+            if not match_expr:
+                raise sqlite3.OperationalError("no searchable terms")
+
+            if session_id:
+                rows = self.db.fetchall(
+                    """SELECT m.* FROM messages_fts
+                       JOIN messages m ON m.id = messages_fts.rowid
+                       WHERE messages_fts MATCH ? AND m.session_id = ?
+                       ORDER BY messages_fts.rank
+                       LIMIT 50""",
+                    (match_expr, session_id)
+                )
+            else:
+                rows = self.db.fetchall(
+                    """SELECT m.* FROM messages_fts
+                       JOIN messages m ON m.id = messages_fts.rowid
+                       WHERE messages_fts MATCH ?
+                       ORDER BY messages_fts.rank
+                       LIMIT 50""",
+                    (match_expr,)
+                )
+        except sqlite3.OperationalError:
+            # No FTS5 support, or nothing tokenizable in the query
+            rows = self._search_messages_like(query, session_id)
 
         return [
             StoredMessage(
@@ -282,6 +306,31 @@ class ConversationStore(QObject):
             for row in rows
         ]
 
+    def _search_messages_like(
+        self,
+        query: str,
+        session_id: str | None
+    ) -> list["sqlite3.Row"]:
+        """Substring search over message content, newest first."""
+        search_pattern = f"%{query}%"
+
+        if session_id:
+            return self.db.fetchall(
+                """SELECT * FROM messages
+                   WHERE session_id = ? AND content LIKE ?
+                   ORDER BY timestamp DESC
+                   LIMIT 50""",
+                (session_id, search_pattern)
+            )
+
+        return self.db.fetchall(
+            """SELECT * FROM messages
+               WHERE content LIKE ?
+               ORDER BY timestamp DESC
+               LIMIT 50""",
+            (search_pattern,)
+        )
+
     def update_embedding_id(self, message_id: int, embedding_id: int) -> None:
         """Update the embedding ID for a message."""
         self.db.execute(
@@ -289,6 +338,13 @@ class ConversationStore(QObject):
             (embedding_id, message_id)
         )
 
+    def update_embedding_ids(self, pairs: list[tuple[int, int]]) -> None:
+        """Update embedding IDs for several messages, as (message_id, embedding_id) pairs."""
+        self.db.executemany(
+            "UPDATE messages SET embedding_id = ? WHERE id = ?",
+            [(embedding_id, message_id) for message_id, embedding_id in pairs]
+        )
+
     def get_message_count(self, session_id: str) -> int:
         """Get the number of messages in a session."""
         row = self.db.fetchone(
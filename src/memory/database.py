@@ -3,10 +3,19 @@
 import sqlite3
 import threading
 from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
 from typing import Iterator
 
-SCHEMA_VERSION = 2
+SCHEMA_VERSION = 7
+
+# TIMESTAMP columns hold "YYYY-MM-DD HH:MM:SS[.ffffff]" text. Parse them with
+# the C fromisoformat rather than sqlite3's pure-Python default converter;
+# the adapter writes the same format the default one did.
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(" "))
+sqlite3.register_converter(
+    "timestamp", lambda value: datetime.fromisoformat(value.decode())
+)
 
 SCHEMA = """
 -- Schema version tracking
@@ -115,6 +124,91 @@ CREATE INDEX IF NOT EXISTS idx_reminders_task ON task_reminders(task_id);
 CREATE INDEX IF NOT EXISTS idx_reminders_time ON task_reminders(remind_at, sent);
 """
 
+MESSAGE_INDEX_SCHEMA = """
+-- Per-session message listing in timestamp order
+CREATE INDEX IF NOT EXISTS idx_messages_session_ts ON messages(session_id, timestamp DESC);
+"""
+
+MESSAGE_FTS_SCHEMA = """
+-- Full-text index over message content, kept in sync by triggers
+CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+    content, content='messages', content_rowid='id'
+);
+
+CREATE TRIGGER IF NOT EXISTS messages_fts_insert AFTER INSERT ON messages BEGIN
+    INSERT INTO messages_fts(rowid, content) VALUES (new.id, new.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS messages_fts_delete AFTER DELETE ON messages BEGIN
+    INSERT INTO messages_fts(messages_fts, rowid, content) VALUES ('delete', old.id, old.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS messages_fts_update AFTER UPDATE OF content ON messages BEGIN
+    INSERT INTO messages_fts(messages_fts, rowid, content) VALUES ('delete', old.id, old.content);
+    INSERT INTO messages_fts(rowid, content) VALUES (new.id, new.content);
+END;
+"""
+
+TASK_FTS_SCHEMA = """
+-- Full-text index over task titles and descriptions, kept in sync by triggers
+CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+    title, description, content='tasks', content_rowid='id'
+);
+
+CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+    INSERT INTO tasks_fts(rowid, title, description)
+    VALUES (new.id, new.title, new.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+    INSERT INTO tasks_fts(tasks_fts, rowid, title, description)
+    VALUES ('delete', old.id, old.title, old.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN
+    INSERT INTO tasks_fts(tasks_fts, rowid, title, description)
+    VALUES ('delete', old.id, old.title, old.description);
+    INSERT INTO tasks_fts(rowid, title, description)
+    VALUES (new.id, new.title, new.description);
+END;
+"""
+
+
+TASK_RANK_SCHEMA = """
+-- Sortable priority, so pending tasks can be read in order from an index.
+-- The priority_rank column itself is added by _init_schema when missing.
+UPDATE tasks SET priority_rank =
+    CASE priority WHEN 'high' THEN 1 WHEN 'medium' THEN 2 ELSE 3 END;
+
+CREATE INDEX IF NOT EXISTS idx_tasks_pending
+    ON tasks(priority_rank, due_date IS NULL, due_date, created_at)
+    WHERE status = 'pending';
+
+CREATE INDEX IF NOT EXISTS idx_tasks_pending_due
+    ON tasks(due_date)
+    WHERE status = 'pending' AND due_date IS NOT NULL;
+"""
+
+REMINDER_INDEX_SCHEMA = """
+-- Only unsent reminders matter to the scheduler; sent ones accumulate forever
+CREATE INDEX IF NOT EXISTS idx_reminders_pending
+    ON task_reminders(remind_at, task_id)
+    WHERE sent = 0;
+"""
+
+NOCASE_INDEX_SCHEMA = """
+-- Case-insensitive lookups by task title and project name
+CREATE INDEX IF NOT EXISTS idx_tasks_title_nocase
+    ON tasks(title COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_projects_name_nocase
+    ON projects(name COLLATE NOCASE);
+"""
+
+
+def _unicode_lower(value):
+    """Lowercase text values with Python's Unicode-aware str.lower()."""
+    return value.lower() if isinstance(value, str) else value
+
 
 class MemoryDatabase:
     """Thread-safe SQLite database for AIDA memory."""
@@ -136,15 +230,27 @@ class MemoryDatabase:
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get thread-local database connection."""
-        if not hasattr(self._local, "connection"):
-            self._local.connection = sqlite3.connect(
-                self.db_path,
-                detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
-                check_same_thread=False,
-            )
-            self._local.connection.row_factory = sqlite3.Row
-            self._local.connection.execute("PRAGMA foreign_keys = ON")
-        return self._local.connection
+        return getattr(self._local, "connection", None) or self._open()
+
+    def _open(self) -> sqlite3.Connection:
+        """Open and register this thread's database connection."""
+        conn = sqlite3.connect(
+            self.db_path,
+            detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON")
+        # WAL lets the embedding worker write while the UI thread reads
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA mmap_size = 268435456")
+        conn.execute("PRAGMA cache_size = -64000")
+        # SQLite's lower() and LIKE only fold ASCII; this folds æ/Æ, ø/Ø too
+        conn.create_function("unicode_lower", 1, _unicode_lower, deterministic=True)
+        self._local.connection = conn
+        return conn
 
     @contextmanager
     def connection(self) -> Iterator[sqlite3.Connection]:
@@ -157,14 +263,37 @@ class MemoryDatabase:
             conn.rollback()
             raise
 
+    def _peek_schema_version(self) -> int:
+        """Read the schema version over a short-lived read-only connection."""
+        if not self.db_path.exists():
+            return 0
+
+        try:
+            conn = sqlite3.connect(f"{self.db_path.as_uri()}?mode=ro", uri=True)
+        except sqlite3.Error:
+            return 0
+
+        try:
+            row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+            return row[0] if row and row[0] is not None else 0
+        except sqlite3.Error:
+            return 0
+        finally:
+            conn.close()
+
     def _init_schema(self) -> None:
         """Initialize database schema."""
+        # Up-to-date databases never take the write lock at startup
+        if self._peek_schema_version() >= SCHEMA_VERSION:
+            return
+
         with self.connection() as conn:
-            # Check current schema version
+            # Re-check under the write connection; another process may have
+            # migrated in the meantime
             try:
-                cursor = conn.execute("SELECT version FROM schema_version")
-                row = cursor.fetchone()
-                current_version = row["version"] if row else 0
+                # Older databases keep one row per applied version
+                row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+                current_version = row[0] if row and row[0] is not None else 0
             except sqlite3.OperationalError:
                 current_version = 0
 
@@ -176,6 +305,45 @@ class MemoryDatabase:
                 if current_version < 2:
                     conn.executescript(TASK_SCHEMA)
 
+                # Version 3: Message search indexes
+                if current_version < 3:
+                    conn.executescript(MESSAGE_INDEX_SCHEMA)
+                    try:
+                        conn.executescript(MESSAGE_FTS_SCHEMA)
+                        # Index messages stored before the table existed
+                        conn.execute("INSERT INTO messages_fts(messages_fts) VALUES ('rebuild')")
+                    except sqlite3.OperationalError:
+                        pass  # SQLite built without FTS5; search falls back to LIKE
+
+                # Version 4: Task search index
+                if current_version < 4:
+                    try:
+                        conn.executescript(TASK_FTS_SCHEMA)
+                        conn.execute("INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')")
+                    except sqlite3.OperationalError:
+                        pass  # SQLite built without FTS5; search falls back to LIKE
+
+                # Version 5: Pending task ordering indexes
+                if current_version < 5:
+                    columns = {
+                        row["name"]
+                        for row in conn.execute("PRAGMA table_info(tasks)")
+                    }
+                    if "priority_rank" not in columns:
+                        conn.execute(
+                            "ALTER TABLE tasks ADD COLUMN "
+                            "priority_rank INTEGER NOT NULL DEFAULT 2"
+                        )
+                    conn.executescript(TASK_RANK_SCHEMA)
+
+                # Version 6: Unsent reminder index
+                if current_version < 6:
+                    conn.executescript(REMINDER_INDEX_SCHEMA)
+
+                # Version 7: Case-insensitive title/name indexes
+                if current_version < 7:
+                    conn.executescript(NOCASE_INDEX_SCHEMA)
+
                 conn.execute(
                     "INSERT OR REPLACE INTO schema_version (version) VALUES (?)",
                     (SCHEMA_VERSION,)
@@ -219,8 +387,24 @@ class MemoryDatabase:
             cursor = conn.execute(query, params)
             return cursor.fetchall()
 
+    def fetchall_tuples(
+        self,
+        query: str,
+        params: tuple = ()
+    ) -> list[tuple]:
+        """Execute query and fetch all results as plain tuples.
+
+        Skips the sqlite3.Row wrapper for hot loops that read columns by index.
+        """
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(query, params)
+            return cursor.fetchall()
+
     def close(self) -> None:
         """Close the database connection."""
-        if hasattr(self._local, "connection"):
-            self._local.connection.close()
+        conn = getattr(self._local, "connection", None)
+        if conn is not None:
+            conn.close()
             del self._local.connection
@@ -1,7 +1,9 @@
 """Vector store for semantic memory using sentence-transformers and FAISS."""
 
 import json
+import pickle
 import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -34,15 +36,37 @@ class EmbeddingStore(QObject):
     MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
     EMBEDDING_DIM = 384
 
+    # Seconds to wait after the last insert before writing the index to disk
+    FLUSH_DELAY_S = 2.0
+
+    # Below this many vectors an exhaustive scan is as fast as HNSW
+    HNSW_MIN_VECTORS = 10_000
+    HNSW_M = 32
+    HNSW_EF_CONSTRUCTION = 200
+    HNSW_EF_SEARCH = 64
+
+    # Vectors used to fit the int8 scalar quantizer's per-dimension ranges
+    SQ_TRAIN_SIZE = 10_000
+
+    # Recent query embeddings kept for repeated searches
+    QUERY_CACHE_SIZE = 512
+
+    # Fold the metadata journal into the snapshot once it grows past this
+    JOURNAL_COMPACT_BYTES = 4 * 1024 * 1024
+
     def __init__(
         self,
         db: "MemoryDatabase",
         data_dir: Path | None = None,
-        cache_dir: Path | None = None
+        cache_dir: Path | None = None,
+        device: str = "auto",
+        fp16: bool = False
     ):
         super().__init__()
 
         self.db = db
+        self.device = device
+        self.fp16 = fp16
 
         if data_dir is None:
             data_dir = Path.home() / ".local/share/aida/embeddings"
@@ -55,13 +79,26 @@ class EmbeddingStore(QObject):
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
         self.index_path = self.data_dir / "index.bin"
-        self.metadata_path = self.data_dir / "metadata.json"
+        self.metadata_path = self.data_dir / "metadata.pkl"
+        self._journal_path = self.data_dir / "metadata.jsonl"
+        self._legacy_metadata_path = self.data_dir / "metadata.json"
 
         self._model = None
+        self._model_version = 0
         self._index = None
+        self._index_mapped = False
         self._metadata: dict[int, dict] = {}
+        self._session_to_ids: dict[str, list[int]] = {}
         self._lock = threading.Lock()
 
+        # (model version, query text) -> embedding, least recently used first
+        self._query_cache: OrderedDict[tuple[int, str], np.ndarray] = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+
+        # Debounced index persistence
+        self._dirty = False
+        self._flush_timer: threading.Timer | None = None
+
         self._load_metadata()
 
     def _load_model(self):
@@ -72,19 +109,49 @@ class EmbeddingStore(QObject):
         try:
             from sentence_transformers import SentenceTransformer
 
+            device = self._resolve_device()
             self._model = SentenceTransformer(
                 self.MODEL_NAME,
-                cache_folder=str(self.cache_dir)
+                cache_folder=str(self.cache_dir),
+                device=device
             )
+            # Half precision only pays off (and is only reliable) on CUDA
+            if self.fp16 and device == "cuda":
+                self._model.half()
+            # Cached query embeddings from an earlier model no longer apply
+            self._model_version += 1
         except ImportError:
             raise ImportError(
                 "sentence-transformers is required for semantic memory. "
                 "Install with: pip install sentence-transformers"
             )
 
-    def _load_index(self):
-        """Load or create the FAISS index."""
+    def _resolve_device(self) -> str:
+        """Pick the torch device for the embedding model."""
+        if self.device != "auto":
+            return self.device
+
+        try:
+            import torch
+        except ImportError:
+            return "cpu"
+
+        if torch.cuda.is_available():
+            return "cuda"
+        mps = getattr(torch.backends, "mps", None)
+        if mps is not None and mps.is_available():
+            return "mps"
+        return "cpu"
+
+    def _load_index(self, writable: bool = False):
+        """Load or create the FAISS index.
+
+        Read paths get a read-only memory-mapped index; pass writable=True
+        before mutating it to swap in an owned copy.
+        """
         if self._index is not None:
+            if writable and self._index_mapped:
+                self._index = self._read_index(writable=True)
             return
 
         try:
@@ -96,36 +163,209 @@ class EmbeddingStore(QObject):
             )
 
         if self.index_path.exists():
-            self._index = faiss.read_index(str(self.index_path))
+            self._index = self._read_index(writable)
         else:
-            self._index = faiss.IndexFlatIP(self.EMBEDDING_DIM)
+            self._index = self._new_index(0)
+
+        # Drop journal entries whose vectors never made it into the saved index
+        # (e.g. the process died before a debounced flush)
+        stale = [k for k in self._metadata if k >= self._index.ntotal]
+        for embedding_id in stale:
+            del self._metadata[embedding_id]
+        if stale:
+            self._rebuild_session_map()
+
+    def _read_index(self, writable: bool):
+        """Read the index file, memory-mapped unless it will be mutated."""
+        import faiss
+
+        if not writable:
+            try:
+                index = faiss.read_index(
+                    str(self.index_path),
+                    faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+                )
+                self._index_mapped = True
+                return index
+            except (AttributeError, RuntimeError):
+                pass  # Older faiss or an index type without mmap support
+
+        self._index_mapped = False
+        return faiss.read_index(str(self.index_path))
+
+    def _new_index(self, expected_size: int):
+        """Create an empty index suited to the expected number of vectors.
+
+        Vectors are L2-normalized, so inner product equals cosine similarity
+        for both the flat and the HNSW index. Large indexes store int8
+        codes (4x smaller than float32) and must be trained before use.
+        """
+        import faiss
+
+        if expected_size < self.HNSW_MIN_VECTORS:
+            return faiss.IndexFlatIP(self.EMBEDDING_DIM)
+
+        index = faiss.IndexHNSWSQ(
+            self.EMBEDDING_DIM,
+            faiss.ScalarQuantizer.QT_8bit,
+            self.HNSW_M,
+            faiss.METRIC_INNER_PRODUCT,
+        )
+        index.hnsw.efConstruction = self.HNSW_EF_CONSTRUCTION
+        return index
+
+    def _maybe_upgrade_index(self) -> None:
+        """Switch a flat index to HNSW once it crosses the size threshold."""
+        import faiss
+
+        if not isinstance(self._index, faiss.IndexFlat):
+            return
+        if self._index.ntotal < self.HNSW_MIN_VECTORS:
+            return
+
+        vectors = self._index.reconstruct_n(0, self._index.ntotal)
+        index = self._new_index(self._index.ntotal)
+        index.train(vectors[:self.SQ_TRAIN_SIZE])
+        index.add(vectors)
+        self._index = index
 
     def _load_metadata(self):
-        """Load metadata mapping."""
+        """Load the metadata snapshot, then replay the journal on top of it."""
         if self.metadata_path.exists():
-            with open(self.metadata_path) as f:
+            with open(self.metadata_path, "rb") as f:
+                self._metadata = pickle.load(f)
+
+        if self._journal_path.exists():
+            with open(self._journal_path) as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Torn final line after a crash
+
+                    for k, v in entry.items():
+                        if v is None:
+                            self._metadata.pop(int(k), None)
+                        else:
+                            self._metadata[int(k)] = v
+
+        if not self._metadata and self._legacy_metadata_path.exists():
+            # One-shot migration from the old single JSON document
+            with open(self._legacy_metadata_path) as f:
                 data = json.load(f)
                 self._metadata = {int(k): v for k, v in data.items()}
+            self._save_metadata()
+            self._legacy_metadata_path.unlink()
+
+        self._rebuild_session_map()
+
+    def _rebuild_session_map(self) -> None:
+        """Recompute the session -> embedding ids lookup from metadata."""
+        self._session_to_ids = {}
+        for embedding_id, meta in self._metadata.items():
+            self._session_to_ids.setdefault(meta["session_id"], []).append(embedding_id)
 
     def _save_metadata(self):
-        """Save metadata mapping."""
-        with open(self.metadata_path, "w") as f:
-            json.dump(self._metadata, f)
+        """Write a full metadata snapshot and reset the journal."""
+        tmp_path = self.metadata_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(self._metadata, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(self.metadata_path)
+        self._journal_path.unlink(missing_ok=True)
+
+    def _append_metadata(self, entries: dict[int, dict | None]) -> None:
+        """Append entries to the metadata journal (None marks a deletion)."""
+        with open(self._journal_path, "a") as f:
+            for embedding_id, meta in entries.items():
+                f.write(json.dumps({embedding_id: meta}) + "\n")
 
     def _save_index(self):
         """Save FAISS index to disk."""
         if self._index is not None:
             try:
                 import faiss
-                faiss.write_index(self._index, str(self.index_path))
+                # Write beside and rename so a mapped reader keeps its file
+                tmp_path = self.index_path.with_suffix(".tmp")
+                faiss.write_index(self._index, str(tmp_path))
+                tmp_path.replace(self.index_path)
             except Exception:
                 pass
 
+    def _schedule_flush(self) -> None:
+        """Mark the index dirty and arm the flush timer. Caller holds the lock."""
+        self._dirty = True
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.FLUSH_DELAY_S, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _flush_locked(self) -> None:
+        """Write the index if dirty and compact the journal. Caller holds the lock."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        if self._dirty:
+            self._save_index()
+            self._dirty = False
+
+        try:
+            if self._journal_path.stat().st_size > self.JOURNAL_COMPACT_BYTES:
+                self._save_metadata()
+        except FileNotFoundError:
+            pass
+
+    def flush(self) -> None:
+        """Write pending index changes to disk immediately."""
+        with self._lock:
+            self._flush_locked()
+
     def embed_text(self, text: str) -> np.ndarray:
         """Generate embedding for text."""
         self._load_model()
-        embedding = self._model.encode(text, normalize_embeddings=True)
-        return embedding.astype(np.float32)
+        embedding = self._model.encode(
+            text, convert_to_numpy=True, normalize_embeddings=True
+        )
+        # Normalized output is already float32, so this is normally a no-op
+        return np.asarray(embedding, dtype=np.float32)
+
+    def embed_query_cached(self, text: str) -> np.ndarray:
+        """Embed a search query, reusing recent results for the same text.
+
+        The returned array is shared with the cache and is read-only.
+        """
+        self._load_model()
+        key = (self._model_version, text)
+
+        with self._query_cache_lock:
+            embedding = self._query_cache.get(key)
+            if embedding is not None:
+                self._query_cache.move_to_end(key)
+                return embedding
+
+        embedding = self.embed_text(text)
+        embedding.setflags(write=False)
+
+        with self._query_cache_lock:
+            self._query_cache[key] = embedding
+            if len(self._query_cache) > self.QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+
+        return embedding
+
+    def embed_texts(self, texts: list[str], batch_size: int = 32) -> np.ndarray:
+        """Generate embeddings for several texts as an (N, dim) FAISS-ready array."""
+        self._load_model()
+        embeddings = self._model.encode(
+            texts,
+            batch_size=batch_size,
+            show_progress_bar=False,
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+        return np.ascontiguousarray(embeddings, dtype=np.float32)
 
     def add_embedding(
         self,
@@ -135,28 +375,48 @@ class EmbeddingStore(QObject):
         timestamp: datetime | None = None
     ) -> int:
         """Add embedding for a message."""
-        with self._lock:
-            self._load_model()
-            self._load_index()
-
-            embedding = self.embed_text(content)
-            embedding = embedding.reshape(1, -1)
-
-            embedding_id = self._index.ntotal
-            self._index.add(embedding)
+        return self.add_embeddings([(message_id, session_id, content, timestamp)])[0]
 
-            self._metadata[embedding_id] = {
-                "message_id": message_id,
-                "session_id": session_id,
-                "content": content[:500],
-                "timestamp": timestamp.isoformat() if timestamp else None
-            }
+    def add_embeddings(
+        self,
+        items: list[tuple[int, str, str, datetime | None]]
+    ) -> list[int]:
+        """Add embeddings for several messages in one encode and index pass.
 
-            self._save_metadata()
-            self._save_index()
+        Items are (message_id, session_id, content, timestamp) tuples.
+        Returns the embedding ids in the same order.
+        """
+        if not items:
+            return []
 
+        with self._lock:
+            self._load_model()
+            self._load_index(writable=True)
+
+            embeddings = self.embed_texts([content for _, _, content, _ in items])
+
+            first_id = self._index.ntotal
+            self._index.add(embeddings)
+            self._maybe_upgrade_index()
+
+            entries: dict[int, dict] = {}
+            for offset, (message_id, session_id, content, timestamp) in enumerate(items):
+                meta = {
+                    "message_id": message_id,
+                    "session_id": session_id,
+                    "content": content[:500],
+                    "timestamp": timestamp.isoformat() if timestamp else None
+                }
+                entries[first_id + offset] = meta
+                self._session_to_ids.setdefault(session_id, []).append(first_id + offset)
+
+            self._metadata.update(entries)
+            self._append_metadata(entries)
+            self._schedule_flush()
+
+        for message_id, _, _, _ in items:
             self.embedding_added.emit(message_id)
-            return embedding_id
+        return list(entries)
 
     def search(
         self,
@@ -172,37 +432,51 @@ class EmbeddingStore(QObject):
             if self._index.ntotal == 0:
                 return []
 
-            query_embedding = self.embed_text(query)
+            query_embedding = self.embed_query_cached(query)
             query_embedding = query_embedding.reshape(1, -1)
 
+            import faiss
+            if isinstance(self._index, faiss.IndexHNSW):
+                self._index.hnsw.efSearch = max(self.HNSW_EF_SEARCH, k)
+
             actual_k = min(k, self._index.ntotal)
             scores, indices = self._index.search(query_embedding, actual_k)
 
-            results = []
-            for score, idx in zip(scores[0], indices[0]):
-                if idx < 0 or score < min_score:
-                    continue
-
-                if idx not in self._metadata:
-                    continue
-
-                meta = self._metadata[idx]
-                timestamp = None
-                if meta.get("timestamp"):
-                    try:
-                        timestamp = datetime.fromisoformat(meta["timestamp"])
-                    except (ValueError, TypeError):
-                        pass
-
-                results.append(SearchResult(
-                    message_id=meta["message_id"],
-                    session_id=meta["session_id"],
-                    content=meta["content"],
-                    score=float(score),
-                    timestamp=timestamp
-                ))
+            return self._to_results(scores[0], indices[0], min_score)
 
-            return results
+    def _to_results(
+        self,
+        scores: np.ndarray,
+        indices: np.ndarray,
+        min_score: float
+    ) -> list[SearchResult]:
+        """Map raw (score, embedding id) pairs to search results."""
+        results = []
+        for score, idx in zip(scores, indices):
+            idx = int(idx)
+            if idx < 0 or score < min_score:
+                continue
+
+            if idx not in self._metadata:
+                continue
+
+            meta = self._metadata[idx]
+            timestamp = None
+            if meta.get("timestamp"):
+                try:
+                    timestamp = datetime.fromisoformat(meta["timestamp"])
+                except (ValueError, TypeError):
+                    pass
+
+            results.append(SearchResult(
+                message_id=meta["message_id"],
+                session_id=meta["session_id"],
+                content=meta["content"],
+                score=float(score),
+                timestamp=timestamp
+            ))
+
+        return results
 
     def search_in_session(
         self,
@@ -211,20 +485,53 @@ class EmbeddingStore(QObject):
         k: int = 5,
         min_score: float = 0.3
     ) -> list[SearchResult]:
-        """Search within a specific session."""
-        all_results = self.search(query, k=k * 3, min_score=min_score)
+        """Search within a specific session.
 
-        session_results = [
-            r for r in all_results
-            if r.session_id == session_id
-        ]
+        Only the session's own vectors are scored, so a rare session still
+        gets up to k hits instead of whatever survives a global top-k.
+        """
+        with self._lock:
+            ids = self._session_to_ids.get(session_id)
+            if not ids:
+                return []
 
-        return session_results[:k]
+            self._load_model()
+            self._load_index()
+
+            query_embedding = self.embed_query_cached(query)
+            query_embedding = query_embedding.reshape(1, -1)
+            id_array = np.asarray(ids, dtype=np.int64)
+            actual_k = min(k, len(id_array))
+
+            import faiss
+            if isinstance(self._index, faiss.IndexHNSW):
+                # Graph traversal under a narrow filter misses most of the
+                # session, so score the session's vectors directly instead
+                if hasattr(self._index, "reconstruct_batch"):
+                    vectors = self._index.reconstruct_batch(id_array)
+                else:
+                    vectors = np.vstack([self._index.reconstruct(int(i)) for i in ids])
+                session_scores = vectors @ query_embedding[0]
+                top = np.argsort(-session_scores)[:actual_k]
+                return self._to_results(session_scores[top], id_array[top], min_score)
+
+            if not hasattr(faiss, "SearchParameters"):
+                # faiss-cpu before 1.7.3 has no search-time ID filter; take a
+                # wider global top-k and keep the session's hits
+                fetch_k = min(k * 3, self._index.ntotal)
+                scores, indices = self._index.search(query_embedding, fetch_k)
+                results = self._to_results(scores[0], indices[0], min_score)
+                return [r for r in results if r.session_id == session_id][:k]
+
+            params = faiss.SearchParameters(sel=faiss.IDSelectorBatch(id_array))
+            scores, indices = self._index.search(query_embedding, actual_k, params=params)
+
+            return self._to_results(scores[0], indices[0], min_score)
 
     def delete_embeddings(self, message_ids: list[int]) -> None:
         """Remove embeddings for deleted messages.
 
-        Note: FAISS IndexFlatIP doesn't support deletion,
+        Note: neither the flat nor the HNSW index supports deletion,
         so we just remove from metadata. The orphaned vectors
         will be cleaned up on next rebuild.
         """
@@ -237,7 +544,9 @@ class EmbeddingStore(QObject):
             for embedding_id in ids_to_remove:
                 del self._metadata[embedding_id]
 
-            self._save_metadata()
+            if ids_to_remove:
+                self._append_metadata({embedding_id: None for embedding_id in ids_to_remove})
+                self._rebuild_session_map()
 
     def rebuild_index(self) -> None:
         """Rebuild the entire index from database."""
@@ -249,7 +558,15 @@ class EmbeddingStore(QObject):
 
             self._load_model()
 
-            rows = self.db.fetchall(
+            # The rebuilt index is written below; drop any pending flush
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._dirty = False
+            # Both branches below replace the index with a fresh, owned one
+            self._index_mapped = False
+
+            rows = self.db.fetchall_tuples(
                 """SELECT m.id, m.session_id, m.content, m.timestamp
                    FROM messages m
                    WHERE m.role IN ('user', 'assistant')
@@ -257,34 +574,47 @@ class EmbeddingStore(QObject):
             )
 
             if not rows:
-                self._index = faiss.IndexFlatIP(self.EMBEDDING_DIM)
+                self._index = self._new_index(0)
                 self._metadata = {}
+                self._session_to_ids = {}
                 self._save_index()
                 self._save_metadata()
                 return
 
-            self._index = faiss.IndexFlatIP(self.EMBEDDING_DIM)
+            self._index = self._new_index(len(rows))
             self._metadata = {}
 
-            batch_size = 32
+            # Batches held back until the quantizer has enough training data
+            untrained: list[np.ndarray] = []
+
+            batch_size = 512
             for i in range(0, len(rows), batch_size):
                 batch = rows[i:i + batch_size]
-                texts = [row["content"] for row in batch]
-                embeddings = self._model.encode(texts, normalize_embeddings=True)
-                embeddings = embeddings.astype(np.float32)
-
-                for j, row in enumerate(batch):
-                    embedding_id = self._index.ntotal
-                    self._index.add(embeddings[j:j+1])
-
-                    timestamp = row["timestamp"]
-                    self._metadata[embedding_id] = {
-                        "message_id": row["id"],
-                        "session_id": row["session_id"],
-                        "content": row["content"][:500],
+                texts = [row[2] for row in batch]
+                embeddings = self.embed_texts(texts, batch_size=batch_size)
+
+                if self._index.is_trained:
+                    # One FAISS call per batch instead of one per row
+                    self._index.add(embeddings)
+                else:
+                    untrained.append(embeddings)
+                    pending = sum(len(e) for e in untrained)
+                    if pending >= self.SQ_TRAIN_SIZE or i + batch_size >= len(rows):
+                        sample = np.concatenate(untrained)
+                        self._index.train(sample)
+                        self._index.add(sample)
+                        untrained.clear()
+
+                # Rows are added in order, so the embedding id is the row position
+                for j, (message_id, session_id, content, timestamp) in enumerate(batch):
+                    self._metadata[i + j] = {
+                        "message_id": message_id,
+                        "session_id": session_id,
+                        "content": content[:500],
                         "timestamp": timestamp.isoformat() if timestamp else None
                     }
 
+            self._rebuild_session_map()
             self._save_index()
             self._save_metadata()
             self.index_rebuilt.emit()
@@ -304,5 +634,4 @@ class EmbeddingStore(QObject):
 
     def cleanup(self) -> None:
         """Clean up resources."""
-        self._save_index()
-        self._save_metadata()
+        self.flush()
@@ -1,5 +1,7 @@
 """User facts and preferences storage for AIDA."""
 
+import functools
+import io
 import re
 from dataclasses import dataclass
 from datetime import datetime
@@ -11,6 +13,39 @@ if TYPE_CHECKING:
     from src.memory.database import MemoryDatabase
 
 
+# Column order matches the UserFact fields, so a raw row maps to UserFact(*row)
+_FACT_COLUMNS = (
+    "id, category, key, value, confidence, source_message_id, created_at, updated_at"
+)
+
+
+# Fact extraction patterns. Name and location run case-insensitively on the
+# original message; the rest run on the lowercased message.
+_NAME_PATTERNS = (
+    re.compile(r"(?:my name is|i'm|i am|call me) ([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)(?:\s+and|\s*[,.]|$)", re.IGNORECASE),
+    re.compile(r"(?:jeg heter|kall meg) ([A-ZÆØÅ][a-zæøå]+(?:\s+[A-ZÆØÅ][a-zæøå]+)?)(?:\s+og|\s*[,.]|$)", re.IGNORECASE),
+)
+_LOCATION_PATTERNS = (
+    re.compile(r"(?:i live in|i'm from|i am from) ([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)", re.IGNORECASE),
+    re.compile(r"(?:jeg bor i|jeg er fra) ([A-ZÆØÅ][a-zæøå]+(?:\s+[A-ZÆØÅ][a-zæøå]+)*)", re.IGNORECASE),
+)
+_JOB_PATTERNS = (
+    re.compile(r"(?:i work as|i am a|i'm a|my job is) (?:a |an )?([a-z]+(?:\s+[a-z]+)*)"),
+    re.compile(r"(?:jeg jobber som|jeg er) (?:en )?([a-zæøå]+(?:\s+[a-zæøå]+)*)"),
+)
+_LIKE_PATTERNS = (
+    re.compile(r"(?:i (?:really )?(?:like|love|enjoy|prefer)) ([a-z]+(?:\s+[a-z]+)*)"),
+    re.compile(r"(?:jeg (?:liker|elsker)) ([a-zæøå]+(?:\s+[a-zæøå]+)*)"),
+)
+_DISLIKE_PATTERNS = (
+    re.compile(r"(?:i (?:don't|do not|hate|dislike)) ([a-z]+(?:\s+[a-z]+)*)"),
+    re.compile(r"(?:jeg (?:liker ikke|hater)) ([a-zæøå]+(?:\s+[a-zæøå]+)*)"),
+)
+_ALL_PATTERNS = (
+    _NAME_PATTERNS + _LOCATION_PATTERNS + _JOB_PATTERNS + _LIKE_PATTERNS + _DISLIKE_PATTERNS
+)
+
+
 @dataclass
 class UserFact:
     """A fact about the user."""
@@ -38,9 +73,42 @@ class UserFactsStore(QObject):
     CATEGORY_CONTEXT = "context"
     CATEGORY_WORK = "work"
 
+    # (category, header) sections of format_facts_for_context, in prompt order
+    _CONTEXT_SECTIONS = (
+        (CATEGORY_PERSONAL, "About the user:"),
+        (CATEGORY_PREFERENCE, "\nPreferences:"),
+        (CATEGORY_HABIT, "\nHabits and routines:"),
+        (CATEGORY_WORK, "\nWork and projects:"),
+        (CATEGORY_CONTEXT, "\nContext:"),
+    )
+    _CONTEXT_HEADERS = dict(_CONTEXT_SECTIONS)
+    _CONTEXT_QUERY = (
+        "SELECT category, key, value FROM user_facts"
+        " WHERE category IN ({categories})"
+        " ORDER BY CASE category {order} END, key"
+    ).format(
+        categories=", ".join(f"'{category}'" for category, _ in _CONTEXT_SECTIONS),
+        order=" ".join(
+            f"WHEN '{category}' THEN {rank}"
+            for rank, (category, _) in enumerate(_CONTEXT_SECTIONS)
+        ),
+    )
+
+    # Compiled hyperscan database for extract_from_batch (False if unavailable)
+    _hyperscan_db = None
+
     def __init__(self, db: "MemoryDatabase"):
         super().__init__()
         self.db = db
+        self._context_cache: tuple[tuple, str] | None = None
+        # Per-instance read caches; SQLite is only written through this store
+        self._get_fact_cached = functools.lru_cache(maxsize=2048)(self._load_fact)
+        self._category_cache: dict[str, list[UserFact]] = {}
+
+    def _invalidate_caches(self) -> None:
+        """Drop cached reads after a write."""
+        self._get_fact_cached.cache_clear()
+        self._category_cache.clear()
 
     def set_fact(
         self,
@@ -63,6 +131,7 @@ class UserFactsStore(QObject):
                    WHERE category = ? AND key = ?""",
                 (value, confidence, source_message_id, now, category, key)
             )
+            self._invalidate_caches()
             self.fact_updated.emit(category, key)
 
             return UserFact(
@@ -86,6 +155,7 @@ class UserFactsStore(QObject):
                 )
                 fact_id = cursor.lastrowid
 
+            self._invalidate_caches()
             self.fact_added.emit(category, key)
 
             return UserFact(
@@ -101,6 +171,10 @@ class UserFactsStore(QObject):
 
     def get_fact(self, category: str, key: str) -> UserFact | None:
         """Get a specific fact."""
+        return self._get_fact_cached(category, key)
+
+    def _load_fact(self, category: str, key: str) -> UserFact | None:
+        """Read a single fact from the database."""
         row = self.db.fetchone(
             "SELECT * FROM user_facts WHERE category = ? AND key = ?",
             (category, key)
@@ -122,49 +196,54 @@ class UserFactsStore(QObject):
 
     def get_facts_by_category(self, category: str) -> list[UserFact]:
         """Get all facts in a category."""
-        rows = self.db.fetchall(
-            "SELECT * FROM user_facts WHERE category = ? ORDER BY key",
+        cached = self._category_cache.get(category)
+        if cached is None:
+            cached = self._load_facts_by_category(category)
+            self._category_cache[category] = cached
+        return list(cached)
+
+    def _load_facts_by_category(self, category: str) -> list[UserFact]:
+        """Read all facts in a category from the database."""
+        rows = self.db.fetchall_tuples(
+            f"SELECT {_FACT_COLUMNS} FROM user_facts WHERE category = ? ORDER BY key",
             (category,)
         )
 
-        return [
-            UserFact(
-                id=row["id"],
-                category=row["category"],
-                key=row["key"],
-                value=row["value"],
-                confidence=row["confidence"],
-                source_message_id=row["source_message_id"],
-                created_at=row["created_at"],
-                updated_at=row["updated_at"]
-            )
-            for row in rows
-        ]
+        return [UserFact(*row) for row in rows]
 
     def get_all_facts(self) -> dict[str, list[UserFact]]:
         """Get all facts grouped by category."""
-        rows = self.db.fetchall(
-            "SELECT * FROM user_facts ORDER BY category, key"
+        rows = self.db.fetchall_tuples(
+            f"SELECT {_FACT_COLUMNS} FROM user_facts ORDER BY category, key"
         )
 
         facts: dict[str, list[UserFact]] = {}
         for row in rows:
-            fact = UserFact(
-                id=row["id"],
-                category=row["category"],
-                key=row["key"],
-                value=row["value"],
-                confidence=row["confidence"],
-                source_message_id=row["source_message_id"],
-                created_at=row["created_at"],
-                updated_at=row["updated_at"]
-            )
+            fact = UserFact(*row)
             if fact.category not in facts:
                 facts[fact.category] = []
             facts[fact.category].append(fact)
 
         return facts
 
+    def search_facts(self, query: str) -> dict[str, list[UserFact]]:
+        """Find facts whose key or value contains query, grouped by category."""
+        needle = query.lower()
+        rows = self.db.fetchall_tuples(
+            f"""SELECT {_FACT_COLUMNS} FROM user_facts
+                WHERE instr(unicode_lower(value), ?) > 0
+                   OR instr(unicode_lower(key), ?) > 0
+                ORDER BY category, key""",
+            (needle, needle)
+        )
+
+        facts: dict[str, list[UserFact]] = {}
+        for row in rows:
+            fact = UserFact(*row)
+            facts.setdefault(fact.category, []).append(fact)
+
+        return facts
+
     def delete_fact(self, category: str, key: str) -> bool:
         """Delete a fact."""
         with self.db.connection() as conn:
@@ -172,62 +251,46 @@ class UserFactsStore(QObject):
                 "DELETE FROM user_facts WHERE category = ? AND key = ?",
                 (category, key)
             )
-            return cursor.rowcount > 0
+            deleted = cursor.rowcount > 0
+
+        if deleted:
+            self._invalidate_caches()
+        return deleted
 
     def clear_all_facts(self) -> None:
         """Delete all facts."""
         self.db.execute("DELETE FROM user_facts")
+        self._invalidate_caches()
 
     def format_facts_for_context(self) -> str:
         """Format all facts as text for LLM system prompt injection."""
-        facts = self.get_all_facts()
-
-        if not facts:
-            return ""
-
-        lines = []
-
-        # Personal info
-        if self.CATEGORY_PERSONAL in facts:
-            personal = facts[self.CATEGORY_PERSONAL]
-            if personal:
-                lines.append("About the user:")
-                for fact in personal:
-                    lines.append(f"- {fact.key}: {fact.value}")
-
-        # Preferences
-        if self.CATEGORY_PREFERENCE in facts:
-            prefs = facts[self.CATEGORY_PREFERENCE]
-            if prefs:
-                lines.append("\nPreferences:")
-                for fact in prefs:
-                    lines.append(f"- {fact.key}: {fact.value}")
-
-        # Habits
-        if self.CATEGORY_HABIT in facts:
-            habits = facts[self.CATEGORY_HABIT]
-            if habits:
-                lines.append("\nHabits and routines:")
-                for fact in habits:
-                    lines.append(f"- {fact.key}: {fact.value}")
-
-        # Work/projects
-        if self.CATEGORY_WORK in facts:
-            work = facts[self.CATEGORY_WORK]
-            if work:
-                lines.append("\nWork and projects:")
-                for fact in work:
-                    lines.append(f"- {fact.key}: {fact.value}")
-
-        # Context
-        if self.CATEGORY_CONTEXT in facts:
-            context = facts[self.CATEGORY_CONTEXT]
-            if context:
-                lines.append("\nContext:")
-                for fact in context:
-                    lines.append(f"- {fact.key}: {fact.value}")
-
-        return "\n".join(lines)
+        stamp = self.db.fetchone(
+            "SELECT MAX(updated_at) AS latest, COUNT(*) AS count FROM user_facts"
+        )
+        cache_key = (stamp["latest"], stamp["count"]) if stamp else None
+
+        if self._context_cache is not None and self._context_cache[0] == cache_key:
+            return self._context_cache[1]
+
+        text = self._render_context_rows()
+        self._context_cache = (cache_key, text)
+        return text
+
+    def _render_context_rows(self) -> str:
+        """Render context facts straight from ordered rows, skipping UserFact."""
+        rows = self.db.fetchall_tuples(self._CONTEXT_QUERY)
+
+        buffer = io.StringIO()
+        current = None
+        for category, key, value in rows:
+            if category != current:
+                if current is not None:
+                    buffer.write("\n")
+                buffer.write(self._CONTEXT_HEADERS[category])
+                current = category
+            buffer.write(f"\n- {key}: {value}")
+
+        return buffer.getvalue()
 
     def extract_facts_from_message(
         self,
@@ -239,84 +302,128 @@ class UserFactsStore(QObject):
 
         Returns list of (category, key, value) tuples.
         """
+        extracted = self._match_facts(message)
+
+        # Store extracted facts
+        for category, key, value in extracted:
+            self.set_fact(
+                category=category,
+                key=key,
+                value=value,
+                confidence=0.8,
+                source_message_id=source_message_id
+            )
+
+        return extracted
+
+    @classmethod
+    def extract_from_batch(cls, messages: list[str]) -> list[list[tuple[str, str, str]]]:
+        """
+        Extract potential facts from many messages without storing them.
+
+        With hyperscan installed, all patterns are matched against each
+        message in one pass and only the patterns that hit are re-run with
+        `re` to pull out the captured value.
+        """
+        hs_db = cls._get_hyperscan_db()
+        if hs_db is None:
+            return [cls._match_facts(message) for message in messages]
+
+        def on_match(pattern_id, start, end, flags, hits):
+            hits.add(_ALL_PATTERNS[pattern_id])
+
+        results = []
+        for message in messages:
+            hits: set[re.Pattern] = set()
+            hs_db.scan(message.encode("utf-8"), match_event_handler=on_match, context=hits)
+            results.append(cls._match_facts(message, hits) if hits else [])
+        return results
+
+    @classmethod
+    def _get_hyperscan_db(cls):
+        """Compile the extraction patterns into a hyperscan database, once."""
+        if cls._hyperscan_db is None:
+            try:
+                import hyperscan
+
+                db = hyperscan.Database()
+                # Caseless matching is a superset of every pattern, which is
+                # all a prefilter needs
+                flags = (
+                    hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8
+                    | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH
+                )
+                db.compile(
+                    expressions=[p.pattern.encode("utf-8") for p in _ALL_PATTERNS],
+                    ids=list(range(len(_ALL_PATTERNS))),
+                    flags=[flags] * len(_ALL_PATTERNS),
+                )
+                cls._hyperscan_db = db
+            except Exception:
+                cls._hyperscan_db = False
+
+        return cls._hyperscan_db or None
+
+    @classmethod
+    def _match_facts(
+        cls,
+        message: str,
+        hits: set[re.Pattern] | None = None
+    ) -> list[tuple[str, str, str]]:
+        """Run the extraction patterns, optionally only those in hits."""
         extracted: list[tuple[str, str, str]] = []
         message_lower = message.lower()
 
+        def search(pattern: re.Pattern, text: str) -> re.Match | None:
+            if hits is not None and pattern not in hits:
+                return None
+            return pattern.search(text)
+
         # Name patterns
-        name_patterns = [
-            r"(?:my name is|i'm|i am|call me) ([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)(?:\s+and|\s*[,.]|$)",
-            r"(?:jeg heter|kall meg) ([A-ZÆØÅ][a-zæøå]+(?:\s+[A-ZÆØÅ][a-zæøå]+)?)(?:\s+og|\s*[,.]|$)",
-        ]
-        for pattern in name_patterns:
-            match = re.search(pattern, message, re.IGNORECASE)
+        for pattern in _NAME_PATTERNS:
+            match = search(pattern, message)
             if match:
                 name = match.group(1).strip()
                 if name.lower() not in ["i", "a", "the"]:
-                    extracted.append((self.CATEGORY_PERSONAL, "name", name))
+                    extracted.append((cls.CATEGORY_PERSONAL, "name", name))
                     break
 
         # Location patterns
-        location_patterns = [
-            r"(?:i live in|i'm from|i am from) ([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
-            r"(?:jeg bor i|jeg er fra) ([A-ZÆØÅ][a-zæøå]+(?:\s+[A-ZÆØÅ][a-zæøå]+)*)",
-        ]
-        for pattern in location_patterns:
-            match = re.search(pattern, message, re.IGNORECASE)
+        for pattern in _LOCATION_PATTERNS:
+            match = search(pattern, message)
             if match:
                 location = match.group(1).strip()
-                extracted.append((self.CATEGORY_PERSONAL, "location", location))
+                extracted.append((cls.CATEGORY_PERSONAL, "location", location))
                 break
 
         # Job/occupation patterns
-        job_patterns = [
-            r"(?:i work as|i am a|i'm a|my job is) (?:a |an )?([a-z]+(?:\s+[a-z]+)*)",
-            r"(?:jeg jobber som|jeg er) (?:en )?([a-zæøå]+(?:\s+[a-zæøå]+)*)",
-        ]
-        for pattern in job_patterns:
-            match = re.search(pattern, message_lower)
+        for pattern in _JOB_PATTERNS:
+            match = search(pattern, message_lower)
             if match:
                 job = match.group(1).strip()
                 # Filter out common non-job phrases
                 if job not in ["here", "there", "good", "fine", "ok", "sure"]:
-                    extracted.append((self.CATEGORY_WORK, "occupation", job))
+                    extracted.append((cls.CATEGORY_WORK, "occupation", job))
                     break
 
         # Preference patterns (likes)
-        like_patterns = [
-            r"(?:i (?:really )?(?:like|love|enjoy|prefer)) ([a-z]+(?:\s+[a-z]+)*)",
-            r"(?:jeg (?:liker|elsker)) ([a-zæøå]+(?:\s+[a-zæøå]+)*)",
-        ]
-        for pattern in like_patterns:
-            match = re.search(pattern, message_lower)
+        for pattern in _LIKE_PATTERNS:
+            match = search(pattern, message_lower)
             if match:
                 thing = match.group(1).strip()
                 if len(thing) > 2 and thing not in ["it", "that", "this"]:
-                    extracted.append((self.CATEGORY_PREFERENCE, f"likes_{thing}", thing))
+                    extracted.append((cls.CATEGORY_PREFERENCE, f"likes_{thing}", thing))
                     break
 
         # Preference patterns (dislikes)
-        dislike_patterns = [
-            r"(?:i (?:don't|do not|hate|dislike)) ([a-z]+(?:\s+[a-z]+)*)",
-            r"(?:jeg (?:liker ikke|hater)) ([a-zæøå]+(?:\s+[a-zæøå]+)*)",
-        ]
-        for pattern in dislike_patterns:
-            match = re.search(pattern, message_lower)
+        for pattern in _DISLIKE_PATTERNS:
+            match = search(pattern, message_lower)
             if match:
                 thing = match.group(1).strip()
                 if len(thing) > 2 and thing not in ["it", "that", "this"]:
-                    extracted.append((self.CATEGORY_PREFERENCE, f"dislikes_{thing}", thing))
+                    extracted.append((cls.CATEGORY_PREFERENCE, f"dislikes_{thing}", thing))
                     break
 
-        # Store extracted facts
-        for category, key, value in extracted:
-            self.set_fact(
-                category=category,
-                key=key,
-                value=value,
-                confidence=0.8,
-                source_message_id=source_message_id
-            )
-
         return extracted
 
     def get_fact_count(self) -> int:
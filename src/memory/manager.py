@@ -1,9 +1,13 @@
 """Unified memory manager for AIDA."""
 
+import hashlib
+import queue
 import threading
+from collections import OrderedDict
+from datetime import datetime
 from pathlib import Path
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Qt, Signal
 
 from src.memory.database import MemoryDatabase
 from src.memory.conversation import ConversationStore, Session
@@ -18,10 +22,18 @@ class MemoryManager(QObject):
     memory_ready = Signal()
     memory_error = Signal(str)
 
+    # Most queued messages embedded in one pass by the background worker
+    EMBEDDING_BATCH_SIZE = 32
+
+    # Recently embedded texts remembered for reuse by identical messages
+    CONTENT_HASH_CACHE_SIZE = 1024
+
     def __init__(
         self,
         data_dir: Path | None = None,
-        cache_dir: Path | None = None
+        cache_dir: Path | None = None,
+        embedding_device: str = "auto",
+        embedding_fp16: bool = False
     ):
         super().__init__()
 
@@ -42,7 +54,9 @@ class MemoryManager(QObject):
         self._embeddings = EmbeddingStore(
             db=self._db,
             data_dir=data_dir / "embeddings",
-            cache_dir=cache_dir / "embedding_model"
+            cache_dir=cache_dir / "embedding_model",
+            device=embedding_device,
+            fp16=embedding_fp16
         )
 
         # Initialize context builder
@@ -55,9 +69,32 @@ class MemoryManager(QObject):
         # Current session
         self._current_session_id: str | None = None
 
-        # Background thread for embeddings
-        self._embedding_queue: list[tuple[int, str, str]] = []
-        self._embedding_lock = threading.Lock()
+        # Counts for get_user_summary, recomputed only after something changed
+        self._stats = {"sessions": 0, "facts": 0, "embeddings": 0}
+        self._stats_dirty = True
+        self._facts.fact_added.connect(self._invalidate_stats)
+        # Emitted from the embedding worker; setting a flag is safe off-thread
+        self._embeddings.embedding_added.connect(
+            self._invalidate_stats, Qt.ConnectionType.DirectConnection
+        )
+        self._embeddings.index_rebuilt.connect(
+            self._invalidate_stats, Qt.ConnectionType.DirectConnection
+        )
+
+        # Background worker for embeddings; None on the queue stops it
+        self._embedding_q: queue.Queue[tuple[int, str, str] | None] = queue.Queue()
+        # (session, content) digest -> embedding id; ids change on rebuild, so
+        # it is cleared then
+        # Touched by the embedding worker and cleared from the GUI thread;
+        # the generation lets the worker drop ids resolved before a clear
+        self._content_hash_cache: OrderedDict[str, int] = OrderedDict()
+        self._content_hash_lock = threading.Lock()
+        self._content_hash_generation = 0
+        self._embeddings.index_rebuilt.connect(
+            self._clear_content_hashes, Qt.ConnectionType.DirectConnection
+        )
+        self._embedding_worker = threading.Thread(target=self._embedding_loop, daemon=True)
+        self._embedding_worker.start()
 
         self.memory_ready.emit()
 
@@ -90,6 +127,7 @@ class MemoryManager(QObject):
         """Start a new conversation session."""
         session = self._conversations.create_session(title=title)
         self._current_session_id = session.id
+        self._stats_dirty = True
         return session.id
 
     def resume_session(self, session_id: str) -> bool:
@@ -156,33 +194,118 @@ class MemoryManager(QObject):
         if not self._embeddings.is_available():
             return
 
-        with self._embedding_lock:
-            self._embedding_queue.append((message_id, session_id, content))
+        self._embedding_q.put((message_id, session_id, content))
+
+    def _embedding_loop(self) -> None:
+        """Consume the embedding queue, batching whatever is ready."""
+        while True:
+            item = self._embedding_q.get()
+            if item is None:
+                self._embedding_q.task_done()
+                return
+
+            items = [item]
+            stop = False
+            while len(items) < self.EMBEDDING_BATCH_SIZE:
+                try:
+                    item = self._embedding_q.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                items.append(item)
 
-        # Process in background
-        threading.Thread(target=self._process_embedding_queue, daemon=True).start()
+            try:
+                self._process_embedding_queue(items)
+            finally:
+                for _ in range(len(items) + stop):
+                    self._embedding_q.task_done()
 
-    def _process_embedding_queue(self) -> None:
-        """Process queued embeddings."""
-        with self._embedding_lock:
-            if not self._embedding_queue:
+            if stop:
                 return
-            items = self._embedding_queue.copy()
-            self._embedding_queue.clear()
 
-        for message_id, session_id, content in items:
+    def _process_embedding_queue(self, items: list[tuple[int, str, str]]) -> None:
+        """Embed a batch of queued messages, reusing embeddings of identical text.
+
+        Reuse is limited to the same session: a vector's metadata names the
+        session it was stored for, so sharing it across sessions would hide
+        the repeat from search_in_session.
+        """
+        now = datetime.now()
+
+        # (message_id, embedding_id) pairs to record on the messages
+        resolved: list[tuple[int, int]] = []
+        # One item per distinct unseen text; repeats wait on its embedding
+        misses: list[tuple[int, str, str, str]] = []
+        repeats: dict[str, list[int]] = {}
+
+        with self._content_hash_lock:
+            generation = self._content_hash_generation
+            for message_id, session_id, content in items:
+                digest = hashlib.blake2b(
+                    f"{session_id}\0{content}".encode(), digest_size=16
+                ).hexdigest()
+                embedding_id = self._content_hash_cache.get(digest)
+                if embedding_id is not None:
+                    self._content_hash_cache.move_to_end(digest)
+                    resolved.append((message_id, embedding_id))
+                elif digest in repeats:
+                    repeats[digest].append(message_id)
+                else:
+                    repeats[digest] = []
+                    misses.append((message_id, session_id, content, digest))
+
+        try:
+            embedding_ids = self._embeddings.add_embeddings(
+                [(message_id, session_id, content, now) for message_id, session_id, content, _ in misses]
+            )
+        except Exception:
+            embedding_ids = None  # Retry one at a time so one bad item doesn't drop the rest
+
+        if embedding_ids is None:
+            embedding_ids = []
+            for message_id, session_id, content, _ in misses:
+                try:
+                    embedding_ids.append(self._embeddings.add_embedding(
+                        message_id=message_id,
+                        session_id=session_id,
+                        content=content,
+                        timestamp=now
+                    ))
+                except Exception as e:
+                    embedding_ids.append(None)
+                    self.memory_error.emit(f"Embedding error: {e}")
+
+        for (message_id, _, _, digest), embedding_id in zip(misses, embedding_ids):
+            if embedding_id is None:
+                continue
+            self._remember_content_hash(digest, embedding_id, generation)
+            resolved.append((message_id, embedding_id))
+            resolved.extend((repeat_id, embedding_id) for repeat_id in repeats[digest])
+
+        if resolved:
             try:
-                from datetime import datetime
-                embedding_id = self._embeddings.add_embedding(
-                    message_id=message_id,
-                    session_id=session_id,
-                    content=content,
-                    timestamp=datetime.now()
-                )
-                self._conversations.update_embedding_id(message_id, embedding_id)
+                self._conversations.update_embedding_ids(resolved)
             except Exception as e:
                 self.memory_error.emit(f"Embedding error: {e}")
 
+    def _remember_content_hash(self, digest: str, embedding_id: int, generation: int) -> None:
+        """Record an embedded text, evicting the least recently used entry."""
+        with self._content_hash_lock:
+            # The cache was cleared since this batch started; the id may be stale
+            if self._content_hash_generation != generation:
+                return
+            self._content_hash_cache[digest] = embedding_id
+            if len(self._content_hash_cache) > self.CONTENT_HASH_CACHE_SIZE:
+                self._content_hash_cache.popitem(last=False)
+
+    def _clear_content_hashes(self) -> None:
+        """Forget all embedded texts; safe to call from any thread."""
+        with self._content_hash_lock:
+            self._content_hash_cache.clear()
+            self._content_hash_generation += 1
+
     def get_context_for_message(
         self,
         message: str,
@@ -223,15 +346,14 @@ class MemoryManager(QObject):
 
         # Search facts
         if include_facts:
-            all_facts = self._facts.get_all_facts()
-            for category, facts in all_facts.items():
+            matching = self._facts.search_facts(query)
+            for category, facts in matching.items():
                 for fact in facts:
-                    if query.lower() in fact.value.lower() or query.lower() in fact.key.lower():
-                        results["facts"].append({
-                            "category": category,
-                            "key": fact.key,
-                            "value": fact.value
-                        })
+                    results["facts"].append({
+                        "category": category,
+                        "key": fact.key,
+                        "value": fact.value
+                    })
 
         # Search conversation content
         if include_conversations:
@@ -268,14 +390,18 @@ class MemoryManager(QObject):
         """Get a summary of what AIDA knows about the user."""
         facts_str = self._facts.format_facts_for_context()
 
-        session_count = len(self._conversations.list_sessions(limit=1000))
-        fact_count = self._facts.get_fact_count()
-        embedding_count = self._embeddings.get_embedding_count()
+        if self._stats_dirty:
+            self._stats_dirty = False
+            self._stats = {
+                "sessions": self._conversations.count_sessions(),
+                "facts": self._facts.get_fact_count(),
+                "embeddings": self._embeddings.get_embedding_count(),
+            }
 
         summary = f"Memory statistics:\n"
-        summary += f"- {session_count} conversation sessions\n"
-        summary += f"- {fact_count} stored facts\n"
-        summary += f"- {embedding_count} semantic embeddings\n"
+        summary += f"- {self._stats['sessions']} conversation sessions\n"
+        summary += f"- {self._stats['facts']} stored facts\n"
+        summary += f"- {self._stats['embeddings']} semantic embeddings\n"
 
         if facts_str:
             summary += f"\n{facts_str}"
@@ -284,10 +410,9 @@ class MemoryManager(QObject):
 
     def clear_all_memory(self) -> None:
         """Clear all stored memory."""
-        # Delete all sessions (cascades to messages)
-        sessions = self._conversations.list_sessions(limit=10000)
-        for session in sessions:
-            self._conversations.delete_session(session.id)
+        # Delete all sessions and messages
+        self._conversations.clear_all()
+        self._clear_content_hashes()
 
         # Clear facts
         self._facts.clear_all_facts()
@@ -297,8 +422,16 @@ class MemoryManager(QObject):
             self._embeddings.rebuild_index()
 
         self._current_session_id = None
+        self._stats_dirty = True
+
+    def _invalidate_stats(self, *args) -> None:
+        """Mark the cached summary counts as stale."""
+        self._stats_dirty = True
 
     def cleanup(self) -> None:
         """Clean up resources, save pending data."""
+        self._embedding_q.put(None)
+        self._embedding_worker.join()
         self._embeddings.cleanup()
+        self._db.execute("PRAGMA optimize")
         self._db.close()
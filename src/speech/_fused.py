@@ -0,0 +1,58 @@
+"""Fused int16 -> 16 kHz float32 decimation and RMS for the wake word loop."""
+
+import numpy as np
+from scipy.signal import firwin, resample_poly
+
+DECIMATION = 3  # 48000 Hz -> 16000 Hz
+
+# Same anti-aliasing low-pass resample_poly designs for a 1:3 ratio, with the
+# int16 -> [-1, 1) scaling folded into the taps
+_TAPS = firwin(
+    2 * 10 * DECIMATION + 1, 1.0 / DECIMATION, window=("kaiser", 5.0)
+).astype(np.float32)
+_TAPS_SCALED = _TAPS / np.float32(32768.0)
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _decimate_rms_kernel(x, taps, out):
+    """Single pass: FIR low-pass at every third sample, accumulating energy."""
+    half = taps.shape[0] // 2
+    n_in = x.shape[0]
+    energy = 0.0
+    for i in range(out.shape[0]):
+        center = i * 3
+        acc = np.float32(0.0)
+        for k in range(taps.shape[0]):
+            j = center + k - half
+            if 0 <= j < n_in:
+                acc += taps[k] * x[j]
+        out[i] = acc
+        energy += acc * acc
+    return np.sqrt(energy / out.shape[0])
+
+
+def _decimate_rms_numpy(x: np.ndarray, out: np.ndarray) -> float:
+    """Fallback without numba: convert, resample_poly, then RMS."""
+    audio = x.astype(np.float32)
+    audio *= 1.0 / 32768.0
+    out[:] = resample_poly(audio, up=1, down=DECIMATION)[:out.shape[0]]
+    return float(np.sqrt(np.dot(out, out) / out.shape[0]))
+
+
+if njit is not None:
+    _kernel = njit(cache=True, fastmath=True)(_decimate_rms_kernel)
+
+    def decimate_rms(x: np.ndarray, out: np.ndarray) -> float:
+        """Decimate int16 48 kHz samples into out (float32, len(x) // 3) and return its RMS."""
+        return float(_kernel(x, _TAPS_SCALED, out))
+else:
+    decimate_rms = _decimate_rms_numpy
+
+
+def warm_up() -> None:
+    """Trigger JIT compilation so the first real chunk isn't delayed."""
+    decimate_rms(np.zeros(DECIMATION * 4, dtype=np.int16), np.empty(4, dtype=np.float32))
@@ -1,6 +1,7 @@
 """Speech-to-text using Whisper."""
 
 from pathlib import Path
+import threading
 import numpy as np
 import sounddevice as sd
 import soundfile as sf
@@ -8,6 +9,23 @@ from faster_whisper import WhisperModel
 
 from src.core.config import WhisperConfig
 
+_shared_models: dict[tuple[str, str, str], WhisperModel] = {}
+_shared_models_lock = threading.Lock()
+
+
+def get_shared_whisper(model_size: str, device: str, compute_type: str) -> WhisperModel:
+    """Return a process-wide Whisper model, loading it on first use.
+
+    Every WhisperSTT with the same settings shares one copy of the weights.
+    """
+    key = (model_size, device, compute_type)
+    with _shared_models_lock:
+        model = _shared_models.get(key)
+        if model is None:
+            model = WhisperModel(model_size, device=device, compute_type=compute_type)
+            _shared_models[key] = model
+        return model
+
 
 class WhisperSTT:
     """Speech-to-text using faster-whisper."""
@@ -18,7 +36,10 @@ class WhisperSTT:
         self.model: WhisperModel | None = None
         self.sample_rate = 16000
         self.is_recording = False
-        self._audio_buffer: list[np.ndarray] = []
+        # Longest recording kept; later audio is dropped
+        self._max_seconds = 120
+        self._audio_buffer = np.empty(0, dtype=np.int16)
+        self._write_pos = 0
 
     def load_model(self) -> None:
         """Load the Whisper model."""
@@ -28,11 +49,7 @@ class WhisperSTT:
 
         compute_type = "float16" if device == "cuda" else "int8"
 
-        self.model = WhisperModel(
-            self.config.model_size,
-            device=device,
-            compute_type=compute_type,
-        )
+        self.model = get_shared_whisper(self.config.model_size, device, compute_type)
 
     def _cuda_available(self) -> bool:
         """Check if CUDA is available."""
@@ -70,18 +87,25 @@ class WhisperSTT:
 
     def start_recording(self) -> None:
         """Start recording audio from microphone."""
-        self._audio_buffer = []
+        # Reused across recordings; stop_recording hands out a converted copy
+        if self._audio_buffer.size == 0:
+            self._audio_buffer = np.empty(self._max_seconds * self.sample_rate, dtype=np.int16)
+        self._write_pos = 0
         self.is_recording = True
 
         def callback(indata, frames, time, status):
             if self.is_recording:
-                self._audio_buffer.append(indata.copy())
+                start = self._write_pos
+                end = min(start + frames, self._audio_buffer.size)
+                self._audio_buffer[start:end] = indata[:end - start, 0]
+                self._write_pos = end
 
+        # Capture int16 to halve callback traffic; converted once on stop
         self._stream = sd.InputStream(
             device=self.microphone_device,
             samplerate=self.sample_rate,
             channels=1,
-            dtype=np.float32,
+            dtype="int16",
             callback=callback,
         )
         self._stream.start()
@@ -92,10 +116,10 @@ class WhisperSTT:
         self._stream.stop()
         self._stream.close()
 
-        if self._audio_buffer:
-            audio = np.concatenate(self._audio_buffer, axis=0)
-            return audio.flatten()
-        return np.array([])
+        # The only pass over the samples: int16 -> float32 straight from the buffer
+        audio = self._audio_buffer[:self._write_pos].astype(np.float32)
+        audio *= 1.0 / 32768.0
+        return audio
 
     def record_and_transcribe(self, duration: float = 5.0) -> str:
         """Record for a fixed duration and transcribe."""
@@ -2,6 +2,7 @@
 
 import subprocess
 import tempfile
+import threading
 from pathlib import Path
 
 from src.core.config import PiperConfig
@@ -17,6 +18,13 @@ class PiperTTS:
         self.speaker_device = speaker_device  # PulseAudio sink name, None = default
         self._model_path: Path | None = None
         self._current_process: subprocess.Popen | None = None
+        self._warm_piper: subprocess.Popen | None = None
+        self._warm_lock = threading.Lock()
+        self._closed = False
+        # stop() bumps the utterance number, cancelling utterances whose
+        # player hasn't started yet; guards _current_process too
+        self._utterance = 0
+        self._playback_lock = threading.Lock()
         self._ensure_voice_available()
 
     def _ensure_voice_available(self) -> None:
@@ -25,6 +33,81 @@ class PiperTTS:
         model_file = self.config.data_dir / f"{self.config.voice}.onnx"
         if model_file.exists():
             self._model_path = model_file
+            self._start_warm_piper()
+
+    def _start_warm_piper(self) -> subprocess.Popen | None:
+        """Start (or return) a piper process for the next utterance.
+
+        It loads the voice model while idle, so speaking only pays for
+        synthesis. Each process speaks one utterance and exits, which gives
+        a clean end-of-audio (EOF) that raw output otherwise lacks.
+        """
+        if self._closed:
+            return None
+        if self._warm_piper is not None and self._warm_piper.poll() is None:
+            return self._warm_piper
+
+        try:
+            self._warm_piper = subprocess.Popen(
+                [
+                    self.PIPER_CMD,
+                    "--model", str(self._model_path),
+                    "--output-raw",
+                ],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except (FileNotFoundError, OSError):
+            self._warm_piper = None
+
+        return self._warm_piper
+
+    def _set_player(self, player: subprocess.Popen, utterance: int) -> bool:
+        """Make player the current process, unless its utterance was stopped."""
+        with self._playback_lock:
+            if utterance != self._utterance:
+                player.terminate()
+                return False
+            self._current_process = player
+            return True
+
+    def _speak_via_warm_piper(self, text: str, utterance: int) -> bool:
+        """Speak through a preloaded piper process. Returns False if unavailable."""
+        with self._warm_lock:
+            if utterance != self._utterance:
+                return True  # Stopped while an earlier utterance was speaking
+            piper = self._start_warm_piper()
+            if piper is None:
+                return False
+            self._warm_piper = None
+
+            player = subprocess.Popen(
+                self._paplay_cmd(raw=True),
+                stdin=piper.stdout,
+                stderr=subprocess.DEVNULL,
+            )
+            # The player owns the pipe now; piper gets SIGPIPE if it is stopped
+            piper.stdout.close()
+            if not self._set_player(player, utterance):
+                piper.terminate()
+                piper.wait()
+                self._start_warm_piper()
+                return True
+
+            try:
+                piper.stdin.write(" ".join(text.split()).encode())
+                piper.stdin.close()
+            except (BrokenPipeError, OSError):
+                player.terminate()
+                return False
+
+            # Load the model for the next utterance once this one is synthesized
+            piper.wait()
+            self._start_warm_piper()
+
+        player.wait()
+        return True
 
     @property
     def model_path(self) -> Path | None:
@@ -49,6 +132,9 @@ class PiperTTS:
         if self.model_path is None:
             raise RuntimeError(f"Voice model not found: {self.config.voice}")
 
+        if self._speak_via_warm_piper(text, self._utterance):
+            return
+
         # Pipe directly to paplay/aplay to avoid Python audio libraries
         try:
             # piper-tts outputs raw audio, pipe to paplay (PulseAudio)
@@ -114,8 +200,23 @@ class PiperTTS:
 
         # Stop any current playback
         self.stop()
+        utterance = self._utterance
+
+        if self._warm_piper is not None:
+            threading.Thread(
+                target=self._speak_async_warm, args=(text, utterance), daemon=True
+            ).start()
+            return
+
+        self._start_playback(text, utterance)
 
-        # Start piper and player in background
+    def _speak_async_warm(self, text: str, utterance: int) -> None:
+        """Speak through the preloaded piper, or a fresh one if it has died."""
+        if not self._speak_via_warm_piper(text, utterance):
+            self._start_playback(text, utterance)
+
+    def _start_playback(self, text: str, utterance: int) -> None:
+        """Start piper and player in the background."""
         try:
             piper = subprocess.Popen(
                 [
@@ -128,11 +229,14 @@ class PiperTTS:
                 stderr=subprocess.PIPE,
             )
 
-            self._current_process = subprocess.Popen(
+            player = subprocess.Popen(
                 self._paplay_cmd(raw=True),
                 stdin=piper.stdout,
                 stderr=subprocess.PIPE,
             )
+            if not self._set_player(player, utterance):
+                piper.terminate()
+                return
 
             # Send text in background
             piper.stdin.write(text.encode())
@@ -142,11 +246,26 @@ class PiperTTS:
             pass  # Fail silently for async
 
     def stop(self) -> None:
-        """Stop any currently playing audio."""
-        if self._current_process and self._current_process.poll() is None:
-            self._current_process.terminate()
+        """Stop any currently playing audio, and any utterance about to play."""
+        with self._playback_lock:
+            self._utterance += 1
+            if self._current_process and self._current_process.poll() is None:
+                self._current_process.terminate()
             self._current_process = None
 
+    def cleanup(self) -> None:
+        """Stop playback and shut down the preloaded piper process."""
+        self._closed = True
+        self.stop()
+        with self._warm_lock:
+            if self._warm_piper is not None:
+                try:
+                    self._warm_piper.stdin.close()
+                except OSError:
+                    pass
+                self._warm_piper.terminate()
+                self._warm_piper = None
+
     def save_to_file(self, text: str, output_path: Path | str) -> None:
         """Synthesize speech and save to file."""
         if self.model_path is None:
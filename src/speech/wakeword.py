@@ -1,5 +1,6 @@
 """Wake word detection for Aida using separate process."""
 
+from array import array
 from multiprocessing import Process, Queue, Value
 import numpy as np
 import time
@@ -7,24 +8,40 @@ import ctypes
 
 from PySide6.QtCore import QObject, Signal, QTimer
 
+# Chunks quieter than this RMS level (full scale = 1.0) skip transcription
+SILENCE_RMS = 0.005
+
 
 def _wake_word_process(wake_word: str, model_size: str, microphone_device: int | None, muted_flag, running_flag, event_queue: Queue):
     """Run wake word detection in a separate process."""
     import sounddevice as sd
     from faster_whisper import WhisperModel
-    from scipy import signal
+    from src.speech._fused import DECIMATION, decimate_rms, warm_up
     import threading
 
     # Load model in this process
-    model = WhisperModel(model_size, device="cpu", compute_type="int8")
+    # Cap CTranslate2 threads so decoding doesn't starve the audio callback
+    model = WhisperModel(
+        model_size, device="cpu", compute_type="int8", cpu_threads=2, num_workers=1
+    )
 
     # Use 48000 Hz for recording, resample to 16000 for Whisper
-    record_rate = 48000
     whisper_rate = 16000
+    record_rate = whisper_rate * DECIMATION
     chunk_duration = 1.5
 
+    # Reused for every chunk; the callback copies blocks straight into it
+    samples_needed = int(chunk_duration * record_rate)
+    audio_buffer = np.empty(samples_needed, dtype=np.int16)
+    resampled_buffer = np.empty(samples_needed // DECIMATION, dtype=np.float32)
+
+    # Compile the decimation kernel before the first chunk arrives
+    warm_up()
+
     event_queue.put("info:Wake word listener started")
 
+    wake_word_lower = wake_word.lower()
+
     while running_flag.value:
         # Check mute status - if muted, just sleep
         if muted_flag.value:
@@ -33,49 +50,54 @@ def _wake_word_process(wake_word: str, model_size: str, microphone_device: int |
 
         try:
             # Use callback-based recording so we can abort if muted
-            audio_buffer = []
             recording_aborted = threading.Event()
-            samples_needed = int(chunk_duration * record_rate)
+            samples_written = array("q", [0])
 
             def audio_callback(indata, frames, time_info, status):
                 # Check if we should abort recording
                 if muted_flag.value or not running_flag.value:
                     recording_aborted.set()
                     raise sd.CallbackAbort()
-                audio_buffer.append(indata.copy())
+                pos = samples_written[0]
+                n = min(frames, samples_needed - pos)
+                audio_buffer[pos:pos + n] = indata[:n, 0]
+                samples_written[0] = pos + n
 
             # Start recording with callback
             with sd.InputStream(
                 device=microphone_device,
                 samplerate=record_rate,
                 channels=1,
-                dtype=np.float32,
+                dtype="int16",
                 callback=audio_callback,
                 blocksize=int(record_rate * 0.1),  # 100ms blocks for quick mute response
             ):
                 # Wait for enough samples or abort
                 start_time = time.time()
-                while not recording_aborted.is_set():
-                    current_samples = sum(len(buf) for buf in audio_buffer)
-                    if current_samples >= samples_needed:
-                        break
-                    if time.time() - start_time > chunk_duration + 0.5:
-                        break  # Timeout safety
-                    time.sleep(0.05)
+                while (
+                    samples_written[0] < samples_needed
+                    and not recording_aborted.is_set()
+                    and time.time() - start_time < chunk_duration + 0.5  # Timeout safety
+                ):
+                    time.sleep(0.01)
 
             # If recording was aborted due to mute, discard
             if recording_aborted.is_set() or muted_flag.value:
                 continue
 
-            # Combine audio buffers
-            if not audio_buffer:
+            if samples_written[0] == 0:
                 continue
-            audio = np.concatenate(audio_buffer)
+            audio = audio_buffer[:samples_written[0]]
 
-            # Resample to 16000 Hz for Whisper
-            audio_flat = audio.flatten()
-            num_samples = int(len(audio_flat) * whisper_rate / record_rate)
-            audio_resampled = signal.resample(audio_flat, num_samples).astype(np.float32)
+            # One pass: int16 -> float32, anti-aliased 48k -> 16k decimation and RMS
+            audio_resampled = resampled_buffer[:len(audio) // DECIMATION]
+            if len(audio_resampled) == 0:
+                continue
+            rms = decimate_rms(audio, audio_resampled)
+
+            # Cheap energy gate: silence and background hum never reach Whisper
+            if rms < SILENCE_RMS:
+                continue
 
             # Check again before transcription (transcription takes time)
             if muted_flag.value:
@@ -85,16 +107,21 @@ def _wake_word_process(wake_word: str, model_size: str, microphone_device: int |
             segments, _ = model.transcribe(
                 audio_resampled,
                 language="en",
-                beam_size=3,
+                beam_size=1,  # Greedy is enough to spot a single word
                 no_speech_threshold=0.4,
+                vad_filter=True,
+                vad_parameters={"min_silence_duration_ms": 300},
+                condition_on_previous_text=False,
             )
 
-            text = " ".join(s.text for s in segments).lower().strip()
-
-            # Final check before emitting - must not be muted
-            if not muted_flag.value and wake_word.lower() in text:
-                event_queue.put("wake_word_detected")
-                time.sleep(0.5)  # Brief pause after detection
+            # Segments decode lazily, so stop at the first one with the wake word
+            for segment in segments:
+                if wake_word_lower in segment.text.lower():
+                    # Final check before emitting - must not be muted
+                    if not muted_flag.value:
+                        event_queue.put("wake_word_detected")
+                        time.sleep(0.5)  # Brief pause after detection
+                    break
 
         except sd.CallbackAbort:
             continue  # Recording was aborted, try again
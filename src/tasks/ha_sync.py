@@ -1,7 +1,13 @@
 """Home Assistant todo list synchronization."""
 
+import functools
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Callable, Any
+from typing import Callable, Any, Iterator
 
 from src.tasks.models import Task, TaskStatus
 from src.tasks.store import TaskStore
@@ -13,12 +19,20 @@ class HomeAssistantSync:
     # Known HA lists
     HA_LISTS = ["Dag til dag", "Handleliste"]
 
+    # Concurrent HA calls per list when pushing/completing
+    MAX_WORKERS = 8
+
+    # Retries for transient transport errors on HA calls
+    RETRY_ATTEMPTS = 3
+    RETRY_BASE_DELAY_S = 0.2
+
     def __init__(
         self,
         store: TaskStore,
         get_items_func: Callable[..., Any],
         add_item_func: Callable[..., Any],
         complete_item_func: Callable[..., Any],
+        add_items_func: Callable[..., Any] | None = None,
     ):
         """Initialize HA sync.
 
@@ -27,42 +41,130 @@ class HomeAssistantSync:
             get_items_func: Function to get items from HA (mcp__homeassistant__assist__todo_get_items)
             add_item_func: Function to add item to HA (mcp__homeassistant__assist__HassListAddItem)
             complete_item_func: Function to complete item in HA (mcp__homeassistant__assist__HassListCompleteItem)
+            add_items_func: Optional function adding several items to an HA list in
+                one call (name=..., items=[...]); pushes fall back to add_item_func
         """
         self._store = store
-        self._get_items = get_items_func
-        self._add_item = add_item_func
-        self._complete_item = complete_item_func
+        # Reads and completions are idempotent and can be retried as-is;
+        # adds go through _add_item_idempotent so a retry can't duplicate
+        self._get_items = functools.partial(self._retry, get_items_func)
+        self._add_item = functools.partial(self._add_item_idempotent, add_item_func)
+        self._complete_item = functools.partial(self._retry, complete_item_func)
+        self._add_items = add_items_func
+
+        # Worker pools shared by everything a sync does, created when it
+        # starts and shut down when it ends (see _worker_pools)
+        self._pools_lock = threading.Lock()
+        self._pool_users = 0
+        self._list_pool: ThreadPoolExecutor | None = None
+        self._call_pool: ThreadPoolExecutor | None = None
+
+    @contextmanager
+    def _worker_pools(self) -> Iterator[tuple[ThreadPoolExecutor, ThreadPoolExecutor]]:
+        """Yield the (list, HA call) worker pools, starting them if needed.
+
+        Nested uses share one set of pools, so worker threads and their
+        SQLite connections are reused for the whole sync; the last user
+        out shuts them down. Lists and HA calls get separate pools since
+        list syncs wait on HA calls.
+        """
+        with self._pools_lock:
+            if self._pool_users == 0:
+                self._list_pool = ThreadPoolExecutor(
+                    max_workers=len(self.HA_LISTS), thread_name_prefix="ha-sync-list"
+                )
+                self._call_pool = ThreadPoolExecutor(
+                    max_workers=self.MAX_WORKERS, thread_name_prefix="ha-sync-call"
+                )
+            self._pool_users += 1
+            pools = (self._list_pool, self._call_pool)
+
+        try:
+            yield pools
+        finally:
+            with self._pools_lock:
+                self._pool_users -= 1
+                last = self._pool_users == 0
+                if last:
+                    self._list_pool = self._call_pool = None
+            if last:
+                for pool in pools:
+                    pool.shutdown(wait=True)
+
+    def _retry(self, func: Callable[..., Any], **kwargs) -> Any:
+        """Call func, retrying transient transport errors with backoff."""
+        for attempt in range(self.RETRY_ATTEMPTS):
+            try:
+                return func(**kwargs)
+            except OSError:  # ConnectionError, TimeoutError, ...
+                if attempt == self.RETRY_ATTEMPTS - 1:
+                    raise
+                delay = self.RETRY_BASE_DELAY_S * (2 ** attempt)
+                time.sleep(delay * random.uniform(0.5, 1.5))
+
+    def _add_item_idempotent(self, func: Callable[..., Any], name: str, item: str) -> Any:
+        """Add an item to an HA list, retrying only if it didn't land.
+
+        A failed call may still have been applied by HA, so before each
+        retry the list is checked for the item.
+        """
+        first_attempt = True
+
+        def add(**kwargs):
+            nonlocal first_attempt
+            if not first_attempt and self._has_item(name, item):
+                return None
+            first_attempt = False
+            return func(**kwargs)
+
+        return self._retry(add, name=name, item=item)
+
+    def _has_item(self, list_name: str, title: str) -> bool:
+        """Check whether an open item with this title exists on an HA list."""
+        ha_items = self._get_items(todo_list=list_name, status="needs_action") or []
+        wanted = title.lower()
+        return any(self._item_title(it).lower() == wanted for it in ha_items)
+
+    @staticmethod
+    def _item_title(item: Any) -> str:
+        """Get the display title of an HA todo item."""
+        return item.get("summary") or item.get("item") or str(item)
 
     def pull_from_ha(self, list_name: str) -> list[Task]:
         """Pull tasks from HA that don't exist locally.
 
         Returns list of newly created local tasks.
         """
-        # Get items from HA
-        try:
-            ha_items = self._get_items(todo_list=list_name, status="needs_action")
-        except Exception:
-            return []
+        # Fetch HA items in the background while loading local titles
+        with self._worker_pools() as (_, call_pool):
+            future = call_pool.submit(
+                self._get_items, todo_list=list_name, status="needs_action"
+            )
+            local_titles = self._store.ha_title_index(list_name)
+
+            try:
+                ha_items = future.result()
+            except Exception:
+                return []
 
         if not ha_items:
             return []
 
-        # Get existing local tasks for this list
-        local_tasks = self._store.get_tasks_by_ha_list(list_name)
-        local_titles = {t.title.lower() for t in local_tasks}
-
-        # Create local tasks for new HA items
-        new_tasks = []
+        # Drop items already known locally or repeated within this batch
+        seen = set()
+        items = []
         for item in ha_items:
-            title = item.get("summary") or item.get("item") or str(item)
-            if title.lower() not in local_titles:
-                task = self._store.create_task(
-                    title=title,
-                    ha_list_name=list_name,
-                )
-                new_tasks.append(task)
+            title = self._item_title(item)
+            key = title.lower()
+            if key in seen or key in local_titles:
+                continue
+            seen.add(key)
+            items.append(title)
 
-        return new_tasks
+        # Create local tasks for new HA items
+        return self._store.create_tasks(
+            [{"title": title, "ha_list_name": list_name} for title in items]
+        )
 
     def push_to_ha(self, task: Task) -> bool:
         """Push a local task to HA list.
@@ -79,6 +181,35 @@ class HomeAssistantSync:
         except Exception:
             return False
 
+    def push_to_ha_batch(self, tasks: list[Task]) -> int:
+        """Push several local tasks to HA, one call per list when possible.
+
+        Returns the number of tasks pushed.
+        """
+        tasks = [t for t in tasks if t.ha_list_name]
+        if not tasks:
+            return 0
+
+        if self._add_items is None:
+            with self._worker_pools() as (_, call_pool):
+                return sum(call_pool.map(self.push_to_ha, tasks))
+
+        by_list: dict[str, list[Task]] = {}
+        for task in tasks:
+            by_list.setdefault(task.ha_list_name, []).append(task)
+
+        # Bulk adds aren't idempotent, so they are not retried
+        synced = []
+        for list_name, group in by_list.items():
+            try:
+                self._add_items(name=list_name, items=[t.title for t in group])
+            except Exception:
+                continue
+            synced.extend((t.id, t.title) for t in group)
+
+        self._store.update_ha_sync_statuses(synced)
+        return len(synced)
+
     def sync_completion(self, task: Task) -> bool:
         """Sync task completion status with HA.
 
@@ -98,34 +229,13 @@ class HomeAssistantSync:
 
         Returns dict with sync statistics.
         """
-        stats = {
-            "pulled": 0,
-            "pushed": 0,
-            "completed": 0,
-            "errors": 0,
-        }
-
-        # Pull new items from HA
-        try:
-            new_tasks = self.pull_from_ha(list_name)
-            stats["pulled"] = len(new_tasks)
-        except Exception:
-            stats["errors"] += 1
+        with self._worker_pools():
+            stats = self._pull_stats(list_name)
 
-        # Push local tasks that haven't been synced
-        local_tasks = self._store.get_tasks_by_ha_list(list_name)
-        for task in local_tasks:
-            if task.ha_synced_at is None and task.status == TaskStatus.PENDING:
-                if self.push_to_ha(task):
-                    stats["pushed"] += 1
-                else:
-                    stats["errors"] += 1
-
-        # Sync completions
-        for task in local_tasks:
-            if task.status == TaskStatus.COMPLETED and task.ha_synced_at:
-                if self.sync_completion(task):
-                    stats["completed"] += 1
+            # Push local tasks that haven't been synced
+            to_push = self._store.get_tasks_needing_push(list_name)
+            to_complete = self._store.get_tasks_needing_completion_sync(list_name)
+            self._push_and_complete(to_push, to_complete, stats)
 
         return stats
 
@@ -141,9 +251,60 @@ class HomeAssistantSync:
             "errors": 0,
         }
 
-        for list_name in self.HA_LISTS:
-            stats = self.full_sync(list_name)
-            for key in total_stats:
-                total_stats[key] += stats[key]
+        with self._worker_pools() as (list_pool, _):
+            # Lists are independent, so pull them concurrently; the store uses
+            # per-thread connections so this is safe for the DB side too
+            for stats in list_pool.map(self._pull_stats, self.HA_LISTS):
+                for key in total_stats:
+                    total_stats[key] += stats[key]
+
+            # One query for every list's outstanding work, taken after the
+            # pulls so newly pulled tasks are included
+            to_push = []
+            to_complete = []
+            by_list = self._store.get_tasks_by_ha_lists(self.HA_LISTS, needing_sync=True)
+            for tasks in by_list.values():
+                for task in tasks:
+                    if task.status == TaskStatus.PENDING:
+                        to_push.append(task)
+                    else:
+                        to_complete.append(task)
+            self._push_and_complete(to_push, to_complete, total_stats)
 
         return total_stats
+
+    def _pull_stats(self, list_name: str) -> dict:
+        """Pull new items from an HA list, returning fresh sync stats."""
+        stats = {
+            "pulled": 0,
+            "pushed": 0,
+            "completed": 0,
+            "errors": 0,
+        }
+
+        try:
+            new_tasks = self.pull_from_ha(list_name)
+            stats["pulled"] = len(new_tasks)
+        except Exception:
+            stats["errors"] += 1
+
+        return stats
+
+    def _push_and_complete(
+        self,
+        to_push: list[Task],
+        to_complete: list[Task],
+        stats: dict,
+    ) -> None:
+        """Push unsynced tasks and sync completions, adding to stats."""
+        if not to_push and not to_complete:
+            return
+
+        # Completions are independent HA round-trips, so run them
+        # concurrently alongside the push
+        with self._worker_pools() as (_, call_pool):
+            completed = call_pool.map(self.sync_completion, to_complete)
+            pushed = self.push_to_ha_batch(to_push)
+            stats["pushed"] += pushed
+            stats["completed"] += sum(completed)
+            stats["errors"] += len(to_push) - pushed
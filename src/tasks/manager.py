@@ -1,17 +1,24 @@
 """High-level task management API."""
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Qt, Signal
 
-from src.tasks.models import Task, Project, Priority, TaskStatus
+from src.tasks.models import Task, Project, Priority
 from src.tasks.store import TaskStore
 
 if TYPE_CHECKING:
     from src.memory.database import MemoryDatabase
 
 
+@lru_cache(maxsize=1024)
+def _format_day(day: date, fmt: str) -> str:
+    """strftime a due day, cached across summaries."""
+    return day.strftime(fmt)
+
+
 class TaskManager(QObject):
     """Unified interface for task management."""
 
@@ -24,6 +31,17 @@ class TaskManager(QObject):
         self._store = TaskStore(db)
         self._reminder_service = None
 
+        # Spoken summary, reused within the same minute until tasks change
+        self._summary_cache: tuple[datetime, str] | None = None
+        for signal in (
+            self._store.task_created,
+            self._store.tasks_created,
+            self._store.task_updated,
+            self._store.task_completed,
+            self._store.task_deleted,
+        ):
+            signal.connect(self._invalidate_summary, Qt.DirectConnection)
+
     @property
     def store(self) -> TaskStore:
         """Access the task store directly."""
@@ -105,9 +123,8 @@ class TaskManager(QObject):
         self,
         project: str | None = None,
         priority: Priority | None = None,
-        include_completed: bool = False,
     ) -> list[Task]:
-        """Get tasks with optional filters."""
+        """Get pending tasks with optional filters."""
         if priority:
             tasks = self._store.get_tasks_by_priority(priority)
         elif project:
@@ -119,22 +136,36 @@ class TaskManager(QObject):
         else:
             tasks = self._store.get_pending_tasks()
 
-        if not include_completed:
-            tasks = [t for t in tasks if t.status != TaskStatus.COMPLETED]
-
         return tasks
 
     # === Speech Output ===
 
     def get_task_summary(self) -> str:
         """Get a spoken summary of tasks."""
-        pending = self._store.get_pending_tasks()
-        overdue = self._store.get_overdue_tasks()
-        due_soon = self._store.get_tasks_due_soon(within_hours=24)
+        now = datetime.now()
+        minute = now.replace(second=0, microsecond=0)
+        if self._summary_cache is not None and self._summary_cache[0] == minute:
+            return self._summary_cache[1]
+
+        summary = self._build_task_summary(now)
+        self._summary_cache = (minute, summary)
+        return summary
+
+    def _invalidate_summary(self, *args) -> None:
+        """Drop the cached task summary after a task change."""
+        self._summary_cache = None
+
+    def _build_task_summary(self, now: datetime) -> str:
+        """Build the spoken task summary from a single pending-task query."""
+        pending, overdue_ids, due_soon_ids = (
+            self._store.get_pending_with_classification(within_hours=24, now=now)
+        )
 
         if not pending:
             return "You have no pending tasks. Your todo list is empty."
 
+        overdue = [t for t in pending if t.id in overdue_ids]
+
         parts = []
 
         # Overdue tasks
@@ -145,7 +176,10 @@ class TaskManager(QObject):
                 parts.append(f"You have {len(overdue)} overdue tasks")
 
         # Due soon
-        due_soon_not_overdue = [t for t in due_soon if t not in overdue]
+        due_soon_not_overdue = [
+            t for t in pending
+            if t.id in due_soon_ids and t.id not in overdue_ids
+        ]
         if due_soon_not_overdue:
             if len(due_soon_not_overdue) == 1:
                 parts.append(f"1 task due in the next 24 hours: {due_soon_not_overdue[0].title}")
@@ -170,7 +204,7 @@ class TaskManager(QObject):
         # List first few tasks
         if pending:
             top_tasks = pending[:3]
-            task_list = self.format_tasks_for_speech(top_tasks)
+            task_list = self.format_tasks_for_speech(top_tasks, now)
             if len(pending) > 3:
                 parts.append(f"Your top tasks are: {task_list}... and {len(pending) - 3} more")
             else:
@@ -178,18 +212,24 @@ class TaskManager(QObject):
 
         return ". ".join(parts)
 
-    def format_tasks_for_speech(self, tasks: list[Task]) -> str:
+    def format_tasks_for_speech(
+        self,
+        tasks: list[Task],
+        now: datetime | None = None,
+    ) -> str:
         """Format task list for TTS output."""
         if not tasks:
             return "no tasks"
 
+        if now is None:
+            now = datetime.now()
         parts = []
         for task in tasks:
             text = task.title
             if task.priority == Priority.HIGH:
                 text += " (important)"
             if task.due_date:
-                text += f", due {self._format_due_date(task.due_date)}"
+                text += f", due {self._format_due_date(task.due_date, now)}"
             parts.append(text)
 
         if len(parts) == 1:
@@ -199,9 +239,10 @@ class TaskManager(QObject):
         else:
             return ", ".join(parts[:-1]) + f", and {parts[-1]}"
 
-    def _format_due_date(self, dt: datetime) -> str:
+    def _format_due_date(self, dt: datetime, now: datetime | None = None) -> str:
         """Format a due date for speech."""
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         diff = dt - now
 
         if diff.days < 0:
@@ -215,9 +256,9 @@ class TaskManager(QObject):
         elif diff.days == 1:
             return "tomorrow"
         elif diff.days < 7:
-            return dt.strftime("%A")  # Day name
+            return _format_day(dt.date(), "%A")  # Day name
         else:
-            return dt.strftime("%B %d")  # Month Day
+            return _format_day(dt.date(), "%B %d")  # Month Day
 
     # === Projects ===
 
@@ -233,13 +274,7 @@ class TaskManager(QObject):
 
     def get_stats(self) -> dict:
         """Get task statistics."""
-        return {
-            "total": self._store.get_task_count(),
-            "pending": self._store.get_task_count(TaskStatus.PENDING),
-            "completed": self._store.get_task_count(TaskStatus.COMPLETED),
-            "overdue": len(self._store.get_overdue_tasks()),
-            "due_soon": len(self._store.get_tasks_due_soon(24)),
-        }
+        return self._store.get_task_stats(within_hours=24)
 
     # === Cleanup ===
 
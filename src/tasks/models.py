@@ -22,7 +22,7 @@ class TaskStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """A project/category for grouping tasks."""
 
@@ -34,7 +34,7 @@ class Project:
     archived: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """A task/todo item."""
 
@@ -58,9 +58,13 @@ class Task:
     @property
     def is_overdue(self) -> bool:
         """Check if task is overdue."""
+        return self.overdue_at(datetime.now())
+
+    def overdue_at(self, now: datetime) -> bool:
+        """Check if task is overdue at the given time."""
         if self.due_date is None or self.status == TaskStatus.COMPLETED:
             return False
-        return datetime.now() > self.due_date
+        return now > self.due_date
 
     @property
     def is_completed(self) -> bool:
@@ -68,7 +72,7 @@ class Task:
         return self.status == TaskStatus.COMPLETED
 
 
-@dataclass
+@dataclass(slots=True)
 class Reminder:
     """A reminder for a task."""
 
@@ -1,6 +1,8 @@
 """Reminder scheduling and notification service."""
 
+import heapq
 from datetime import datetime, timedelta
+from functools import partial
 from typing import TYPE_CHECKING
 
 from PySide6.QtCore import QObject, Signal, QTimer
@@ -16,13 +18,16 @@ class ReminderService(QObject):
 
     reminder_due = Signal(object, object)  # Task, Reminder
 
-    CHECK_INTERVAL_MS = 60_000  # Check every minute
+    # Longest sleep between wakeups; reloads the schedule from the DB so
+    # clock changes and missed inserts are picked up
+    RESYNC_INTERVAL_MS = 15 * 60_000
 
     def __init__(self, store: "TaskStore"):
         super().__init__()
         self._store = store
         self._timer: QTimer | None = None
         self._running = False
+        self._schedule: list[tuple[datetime, int]] = []  # heap of (remind_at, id)
 
     def start(self) -> None:
         """Start the reminder service."""
@@ -30,51 +35,89 @@ class ReminderService(QObject):
             return
 
         self._timer = QTimer()
-        self._timer.timeout.connect(self._check_reminders)
-        self._timer.start(self.CHECK_INTERVAL_MS)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_timer)
+        self._store.reminder_created.connect(self._on_reminder_created)
         self._running = True
 
         # Initial check
         self._check_reminders()
+        self._reload_schedule()
 
     def stop(self) -> None:
         """Stop the reminder service."""
         if self._timer:
             self._timer.stop()
             self._timer = None
+            self._store.reminder_created.disconnect(self._on_reminder_created)
+        self._schedule.clear()
         self._running = False
 
     def is_running(self) -> bool:
         """Check if service is running."""
         return self._running
 
+    def _reload_schedule(self) -> None:
+        """Rebuild the reminder heap from the DB and re-arm the timer."""
+        self._schedule = self._store.get_unsent_reminder_times()
+        heapq.heapify(self._schedule)
+        self._arm_timer()
+
+    def _arm_timer(self) -> None:
+        """Sleep until the earliest scheduled reminder (or the resync interval)."""
+        if self._timer is None:
+            return
+
+        delay_ms = self.RESYNC_INTERVAL_MS
+        if self._schedule:
+            until_next = (self._schedule[0][0] - datetime.now()).total_seconds()
+            delay_ms = max(0, min(delay_ms, int(until_next * 1000) + 1))
+
+        self._timer.start(delay_ms)
+
+    def _on_timer(self) -> None:
+        """Fire due reminders, then reschedule."""
+        if self._schedule and self._schedule[0][0] <= datetime.now():
+            self._check_reminders()
+        self._reload_schedule()
+
+    def _on_reminder_created(self, reminder: Reminder) -> None:
+        """Add a newly created reminder to the schedule."""
+        if self._timer is None or reminder.sent:
+            return
+
+        heapq.heappush(self._schedule, (reminder.remind_at, reminder.id))
+        if self._schedule[0][1] == reminder.id:
+            self._arm_timer()
+
     def _check_reminders(self) -> None:
         """Check for due reminders and emit signals."""
         now = datetime.now()
         pending = self._store.get_pending_reminders(before=now)
 
-        for reminder, task in pending:
-            # Emit signal
-            self.reminder_due.emit(task, reminder)
+        if not pending:
+            return
 
-            # Mark as sent
-            self._store.mark_reminder_sent(reminder.id)
+        sent_ids = []
+        renewals = []
+        for reminder, task in pending:
+            sent_ids.append(reminder.id)
 
             # Handle recurring reminders
             if reminder.reminder_type == "daily":
                 next_time = reminder.remind_at + timedelta(days=1)
-                self._store.create_reminder(
-                    task_id=task.id,
-                    remind_at=next_time,
-                    reminder_type="daily"
-                )
+                renewals.append((task.id, next_time, "daily"))
             elif reminder.reminder_type == "weekly":
                 next_time = reminder.remind_at + timedelta(weeks=1)
-                self._store.create_reminder(
-                    task_id=task.id,
-                    remind_at=next_time,
-                    reminder_type="weekly"
-                )
+                renewals.append((task.id, next_time, "weekly"))
+
+        # Write all sent flags and renewals in a single transaction
+        self._store.mark_reminders_sent(sent_ids, renewals, now=now)
+
+        # Deliver through the event loop so slow handlers (e.g. speaking a
+        # reminder) don't hold up the scheduler or each other
+        for reminder, task in pending:
+            QTimer.singleShot(0, partial(self.reminder_due.emit, task, reminder))
 
     def schedule_reminder(
         self,
@@ -1,5 +1,11 @@
 """SQLite storage for tasks."""
 
+import dataclasses
+import functools
+import re
+import sqlite3
+import threading
+import time
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -11,18 +17,108 @@ if TYPE_CHECKING:
     from src.memory.database import MemoryDatabase
 
 
+# Stored in tasks.priority_rank so pending tasks sort by an indexed column
+PRIORITY_RANK = {Priority.HIGH: 1, Priority.MEDIUM: 2, Priority.LOW: 3}
+
+# Stored value -> member, cheaper than calling the enum once per row
+_PRIORITY_BY_VALUE = {p.value: p for p in Priority}
+_STATUS_BY_VALUE = {s.value: s for s in TaskStatus}
+
+# Columns in Task / Project field order, so rows are read by index
+_TASK_COLUMNS = (
+    "t.id, t.title, t.description, t.priority, t.status, t.project_id,"
+    " p.name, t.due_date, t.reminder_at, t.reminder_sent, t.ha_list_name,"
+    " t.ha_item_id, t.ha_synced_at, t.created_at, t.updated_at, t.completed_at"
+)
+_PROJECT_COLUMNS = "id, name, description, color, created_at, archived"
+# _TASK_COLUMNS for a RETURNING clause on tasks, where joins aren't allowed
+_TASK_RETURNING = (
+    "id, title, description, priority, status, project_id,"
+    " (SELECT name FROM projects WHERE projects.id = tasks.project_id),"
+    " due_date, reminder_at, reminder_sent, ha_list_name, ha_item_id,"
+    " ha_synced_at, created_at, updated_at, completed_at"
+)
+
+# Ids per "IN (...)" query, below SQLite's historical 999-parameter limit
+ID_BATCH_SIZE = 500
+
+# Read-through cache for the hot read methods; writes clear it immediately,
+# the TTL only bounds staleness for time-dependent queries
+READ_CACHE_TTL_S = 2.0
+READ_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=64)
+def _update_task_sql(columns: frozenset[str]) -> tuple[str, tuple[str, ...]]:
+    """Build the UPDATE for a set of task columns, with its parameter order.
+
+    Columns are sorted so every call with the same fields reuses one SQL
+    string, and with it sqlite3's prepared statement. The statement returns
+    the updated row as _TASK_RETURNING.
+    """
+    order = tuple(sorted(columns))
+    set_clause = ", ".join(f"{column} = ?" for column in order)
+    sql = f"UPDATE tasks SET {set_clause} WHERE id = ? RETURNING {_TASK_RETURNING}"
+    return sql, order
+
+
+def _read_cached(method):
+    """Cache a TaskStore read method's result, keyed by its arguments."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(kwargs.items()))
+        now = time.monotonic()
+        with self._read_cache_lock:
+            hit = self._read_cache.get(key)
+            generation = self._read_generation
+
+        if hit is not None and hit[0] > now:
+            value = hit[1]
+        else:
+            value = method(self, *args, **kwargs)
+            with self._read_cache_lock:
+                # Don't store a result a concurrent write may have made stale
+                if self._read_generation == generation:
+                    if len(self._read_cache) >= READ_CACHE_SIZE:
+                        self._read_cache.clear()
+                    self._read_cache[key] = (now + READ_CACHE_TTL_S, value)
+
+        # Callers get their own copies, so one caller changing a Task or
+        # Project can't alter what other callers read from the cache
+        if isinstance(value, list):
+            return [_copy_model(item) for item in value]
+        return _copy_model(value)
+    return wrapper
+
+
+def _copy_model(value):
+    """Shallow-copy a Task or Project; other values are returned as is."""
+    if isinstance(value, (Task, Project)):
+        return dataclasses.replace(value)
+    return value
+
+
 class TaskStore(QObject):
     """CRUD operations for tasks in SQLite."""
 
     task_created = Signal(int)
+    tasks_created = Signal(list)  # list[int], from create_tasks
     task_updated = Signal(int)
     task_completed = Signal(int)
     task_deleted = Signal(int)
     project_created = Signal(int)
+    reminder_created = Signal(object)  # Reminder
 
     def __init__(self, db: "MemoryDatabase"):
         super().__init__()
         self.db = db
+        # ha_list_name -> lowercased titles, loaded lazily per list
+        self._ha_title_index: dict[str, set[str]] = {}
+        self._ha_title_lock = threading.Lock()
+        # (method, args, kwargs) -> (expires_at, result), see _read_cached
+        self._read_cache: dict[tuple, tuple[float, object]] = {}
+        self._read_cache_lock = threading.Lock()
+        self._read_generation = 0
 
     # === Task CRUD ===
 
@@ -45,14 +141,21 @@ class TaskStore(QObject):
         with self.db.connection() as conn:
             cursor = conn.execute(
                 """INSERT INTO tasks
-                   (title, description, priority, project_id, due_date,
-                    reminder_at, ha_list_name, created_at, updated_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (title, description, priority.value, project_id, due_date,
-                 reminder_at, ha_list_name, now, now)
+                   (title, description, priority, priority_rank, project_id,
+                    due_date, reminder_at, ha_list_name, created_at, updated_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (title, description, priority.value, PRIORITY_RANK[priority],
+                 project_id, due_date, reminder_at, ha_list_name, now, now)
             )
             task_id = cursor.lastrowid
 
+        self._invalidate_read_cache()
+        if ha_list_name:
+            with self._ha_title_lock:
+                titles = self._ha_title_index.get(ha_list_name)
+                if titles is not None:
+                    titles.add(title.lower())
+
         task = Task(
             id=task_id,
             title=title,
@@ -69,10 +172,64 @@ class TaskStore(QObject):
         self.task_created.emit(task_id)
         return task
 
+    def create_tasks(self, items: list[dict]) -> list[Task]:
+        """Create several tasks in one transaction.
+
+        Args:
+            items: create_task keyword arguments, one dict per task
+
+        Emits a single tasks_created signal instead of task_created per task.
+        """
+        if not items:
+            return []
+
+        now = datetime.now()
+        tasks = []
+        with self.db.connection() as conn:
+            for item in items:
+                priority = item.get("priority", Priority.MEDIUM)
+                if not isinstance(priority, Priority):
+                    priority = Priority(priority)
+
+                task = Task(
+                    id=0,
+                    title=item["title"],
+                    description=item.get("description"),
+                    priority=priority,
+                    project_id=item.get("project_id"),
+                    due_date=item.get("due_date"),
+                    reminder_at=item.get("reminder_at"),
+                    ha_list_name=item.get("ha_list_name"),
+                    created_at=now,
+                    updated_at=now,
+                )
+                cursor = conn.execute(
+                    """INSERT INTO tasks
+                       (title, description, priority, priority_rank, project_id,
+                        due_date, reminder_at, ha_list_name, created_at, updated_at)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    (task.title, task.description, priority.value,
+                     PRIORITY_RANK[priority], task.project_id, task.due_date,
+                     task.reminder_at, task.ha_list_name, now, now)
+                )
+                task.id = cursor.lastrowid
+                tasks.append(task)
+
+        self._invalidate_read_cache()
+        with self._ha_title_lock:
+            for task in tasks:
+                if task.ha_list_name:
+                    titles = self._ha_title_index.get(task.ha_list_name)
+                    if titles is not None:
+                        titles.add(task.title.lower())
+
+        self.tasks_created.emit([task.id for task in tasks])
+        return tasks
+
     def get_task(self, task_id: int) -> Task | None:
         """Get a task by ID."""
         row = self.db.fetchone(
-            """SELECT t.*, p.name as project_name
+            f"""SELECT {_TASK_COLUMNS}
                FROM tasks t
                LEFT JOIN projects p ON t.project_id = p.id
                WHERE t.id = ?""",
@@ -84,29 +241,52 @@ class TaskStore(QObject):
 
         return self._row_to_task(row)
 
+    def get_tasks(self, task_ids: list[int]) -> dict[int, Task]:
+        """Get several tasks by ID, keyed by ID; unknown IDs are left out."""
+        ids = list(dict.fromkeys(task_ids))
+        tasks = {}
+        for start in range(0, len(ids), ID_BATCH_SIZE):
+            batch = ids[start:start + ID_BATCH_SIZE]
+            placeholders = ", ".join("?" for _ in batch)
+            rows = self.db.fetchall_tuples(
+                f"""SELECT {_TASK_COLUMNS}
+                   FROM tasks t
+                   LEFT JOIN projects p ON t.project_id = p.id
+                   WHERE t.id IN ({placeholders})""",
+                tuple(batch)
+            )
+            for row in rows:
+                task = self._row_to_task(row)
+                tasks[task.id] = task
+        return tasks
+
     def update_task(self, task_id: int, **kwargs) -> Task | None:
         """Update a task's fields."""
         if not kwargs:
             return self.get_task(task_id)
 
-        # Convert Priority enum to string if present
-        if "priority" in kwargs and isinstance(kwargs["priority"], Priority):
-            kwargs["priority"] = kwargs["priority"].value
-        if "status" in kwargs and isinstance(kwargs["status"], TaskStatus):
-            kwargs["status"] = kwargs["status"].value
+        # Convert Priority enum to string if present, keeping its rank in step
+        if "priority" in kwargs:
+            priority = Priority(kwargs["priority"])
+            kwargs["priority"] = priority.value
+            kwargs["priority_rank"] = PRIORITY_RANK[priority]
+        status = kwargs.get("status")
+        if isinstance(status, TaskStatus):
+            kwargs["status"] = status.value
 
         kwargs["updated_at"] = datetime.now()
 
-        set_clause = ", ".join(f"{k} = ?" for k in kwargs.keys())
-        values = list(kwargs.values()) + [task_id]
-
-        self.db.execute(
-            f"UPDATE tasks SET {set_clause} WHERE id = ?",
-            tuple(values)
+        sql, order = _update_task_sql(frozenset(kwargs))
+        rows = self.db.fetchall_tuples(
+            sql, (*[kwargs[column] for column in order], task_id)
         )
 
+        self._invalidate_read_cache()
+        if "title" in kwargs or "ha_list_name" in kwargs:
+            self._invalidate_ha_title_index()
+
         self.task_updated.emit(task_id)
-        return self.get_task(task_id)
+        return self._row_to_task(rows[0]) if rows else None
 
     def delete_task(self, task_id: int) -> bool:
         """Delete a task."""
@@ -115,6 +295,8 @@ class TaskStore(QObject):
             deleted = cursor.rowcount > 0
 
         if deleted:
+            self._invalidate_read_cache()
+            self._invalidate_ha_title_index()
             self.task_deleted.emit(task_id)
 
         return deleted
@@ -123,50 +305,87 @@ class TaskStore(QObject):
         """Mark a task as completed."""
         now = datetime.now()
 
-        self.db.execute(
-            """UPDATE tasks
+        rows = self.db.fetchall_tuples(
+            f"""UPDATE tasks
                SET status = ?, completed_at = ?, updated_at = ?
-               WHERE id = ?""",
+               WHERE id = ?
+               RETURNING {_TASK_RETURNING}""",
             (TaskStatus.COMPLETED.value, now, now, task_id)
         )
 
+        self._invalidate_read_cache()
         self.task_completed.emit(task_id)
-        return self.get_task(task_id)
+        return self._row_to_task(rows[0]) if rows else None
 
     # === Task Queries ===
 
-    def get_pending_tasks(self, project_id: int | None = None) -> list[Task]:
-        """Get all pending tasks, optionally filtered by project."""
+    @_read_cached
+    def get_pending_tasks(
+        self,
+        project_id: int | None = None,
+        limit: int | None = None,
+    ) -> list[Task]:
+        """Get pending tasks, optionally filtered by project.
+
+        Ordered by priority, then due date (undated last), then age; the
+        order matches idx_tasks_pending so SQLite reads rows in index order.
+        """
+        limit = -1 if limit is None else limit
         if project_id is not None:
-            rows = self.db.fetchall(
-                """SELECT t.*, p.name as project_name
+            rows = self.db.fetchall_tuples(
+                f"""SELECT {_TASK_COLUMNS}
                    FROM tasks t
                    LEFT JOIN projects p ON t.project_id = p.id
                    WHERE t.status = 'pending' AND t.project_id = ?
-                   ORDER BY
-                       CASE t.priority WHEN 'high' THEN 1 WHEN 'medium' THEN 2 ELSE 3 END,
-                       t.due_date ASC NULLS LAST,
-                       t.created_at ASC""",
-                (project_id,)
+                   ORDER BY t.priority_rank, t.due_date IS NULL, t.due_date, t.created_at
+                   LIMIT ?""",
+                (project_id, limit)
             )
         else:
-            rows = self.db.fetchall(
-                """SELECT t.*, p.name as project_name
+            rows = self.db.fetchall_tuples(
+                f"""SELECT {_TASK_COLUMNS}
                    FROM tasks t
                    LEFT JOIN projects p ON t.project_id = p.id
                    WHERE t.status = 'pending'
-                   ORDER BY
-                       CASE t.priority WHEN 'high' THEN 1 WHEN 'medium' THEN 2 ELSE 3 END,
-                       t.due_date ASC NULLS LAST,
-                       t.created_at ASC"""
+                   ORDER BY t.priority_rank, t.due_date IS NULL, t.due_date, t.created_at
+                   LIMIT ?""",
+                (limit,)
             )
 
         return [self._row_to_task(row) for row in rows]
 
+    def get_pending_with_classification(
+        self,
+        within_hours: int = 24,
+        now: datetime | None = None,
+    ) -> tuple[list[Task], set[int], set[int]]:
+        """Get pending tasks along with which are overdue and which are due soon.
+
+        Returns (pending, overdue_ids, due_soon_ids) from a single query;
+        due_soon_ids includes overdue tasks, like get_tasks_due_soon.
+        """
+        from datetime import timedelta
+        if now is None:
+            now = datetime.now()
+        deadline = now + timedelta(hours=within_hours)
+
+        pending = self.get_pending_tasks()
+        overdue_ids = set()
+        due_soon_ids = set()
+        for task in pending:
+            if task.due_date is None:
+                continue
+            if task.overdue_at(now):
+                overdue_ids.add(task.id)
+            if task.due_date <= deadline:
+                due_soon_ids.add(task.id)
+
+        return pending, overdue_ids, due_soon_ids
+
     def get_tasks_by_priority(self, priority: Priority) -> list[Task]:
         """Get tasks by priority level."""
-        rows = self.db.fetchall(
-            """SELECT t.*, p.name as project_name
+        rows = self.db.fetchall_tuples(
+            f"""SELECT {_TASK_COLUMNS}
                FROM tasks t
                LEFT JOIN projects p ON t.project_id = p.id
                WHERE t.priority = ? AND t.status = 'pending'
@@ -180,8 +399,8 @@ class TaskStore(QObject):
         from datetime import timedelta
         deadline = datetime.now() + timedelta(hours=within_hours)
 
-        rows = self.db.fetchall(
-            """SELECT t.*, p.name as project_name
+        rows = self.db.fetchall_tuples(
+            f"""SELECT {_TASK_COLUMNS}
                FROM tasks t
                LEFT JOIN projects p ON t.project_id = p.id
                WHERE t.status = 'pending'
@@ -192,12 +411,13 @@ class TaskStore(QObject):
         )
         return [self._row_to_task(row) for row in rows]
 
+    @_read_cached
     def get_overdue_tasks(self) -> list[Task]:
         """Get all overdue tasks."""
         now = datetime.now()
 
-        rows = self.db.fetchall(
-            """SELECT t.*, p.name as project_name
+        rows = self.db.fetchall_tuples(
+            f"""SELECT {_TASK_COLUMNS}
                FROM tasks t
                LEFT JOIN projects p ON t.project_id = p.id
                WHERE t.status = 'pending'
@@ -209,38 +429,80 @@ class TaskStore(QObject):
         return [self._row_to_task(row) for row in rows]
 
     def search_tasks(self, query: str) -> list[Task]:
-        """Search tasks by title."""
-        rows = self.db.fetchall(
-            """SELECT t.*, p.name as project_name
-               FROM tasks t
-               LEFT JOIN projects p ON t.project_id = p.id
-               WHERE t.title LIKE ?
-               ORDER BY t.status ASC, t.created_at DESC
-               LIMIT 20""",
-            (f"%{query}%",)
-        )
+        """Search tasks by title and description, best matches first."""
+        # Every word in the query must appear, as a word or word prefix
+        terms = re.findall(r"\w+", query)
+        match_expr = " ".join(f'"{term}"*' for term in terms)
+
+        try:
+            if not match_expr:
+                raise sqlite3.OperationalError("no searchable terms")
+
+            rows = self.db.fetchall_tuples(
+                f"""SELECT {_TASK_COLUMNS}
+                   FROM tasks_fts f
+                   JOIN tasks t ON t.id = f.rowid
+                   LEFT JOIN projects p ON t.project_id = p.id
+                   WHERE tasks_fts MATCH ?
+                   ORDER BY f.rank
+                   LIMIT 20""",
+                (match_expr,)
+            )
+        except sqlite3.OperationalError:
+            # No FTS5 support, or nothing tokenizable in the query
+            rows = self.db.fetchall_tuples(
+                f"""SELECT {_TASK_COLUMNS}
+                   FROM tasks t
+                   LEFT JOIN projects p ON t.project_id = p.id
+                   WHERE t.title LIKE ?
+                   ORDER BY t.status ASC, t.created_at DESC
+                   LIMIT 20""",
+                (f"%{query}%",)
+            )
         return [self._row_to_task(row) for row in rows]
 
+    @_read_cached
     def find_task_by_title(self, title: str) -> Task | None:
         """Find a task by fuzzy title match."""
         # Try exact match first
         row = self.db.fetchone(
-            """SELECT t.*, p.name as project_name
+            f"""SELECT {_TASK_COLUMNS}
                FROM tasks t
                LEFT JOIN projects p ON t.project_id = p.id
-               WHERE LOWER(t.title) = LOWER(?) AND t.status = 'pending'""",
+               WHERE t.title = ? COLLATE NOCASE AND t.status = 'pending'""",
             (title,)
         )
 
         if row:
             return self._row_to_task(row)
 
-        # Try partial match
+        # Then the words as a phrase in the title, via the FTS index
+        terms = re.findall(r"\w+", title)
+        if terms:
+            phrase = " ".join(terms)
+            try:
+                row = self.db.fetchone(
+                    f"""SELECT {_TASK_COLUMNS}
+                       FROM tasks_fts f
+                       JOIN tasks t ON t.id = f.rowid
+                       LEFT JOIN projects p ON t.project_id = p.id
+                       WHERE tasks_fts MATCH ? AND t.status = 'pending'
+                       ORDER BY t.created_at DESC
+                       LIMIT 1""",
+                    (f'title : "{phrase}"*',)
+                )
+            except sqlite3.OperationalError:
+                row = None
+
+            if row:
+                return self._row_to_task(row)
+
+        # Fall back to a substring match
         row = self.db.fetchone(
-            """SELECT t.*, p.name as project_name
+            f"""SELECT {_TASK_COLUMNS}
                FROM tasks t
                LEFT JOIN projects p ON t.project_id = p.id
-               WHERE LOWER(t.title) LIKE LOWER(?) AND t.status = 'pending'
+               WHERE t.title LIKE ? AND t.status = 'pending'
                ORDER BY t.created_at DESC
                LIMIT 1""",
             (f"%{title}%",)
@@ -269,6 +531,7 @@ class TaskStore(QObject):
             )
             project_id = cursor.lastrowid
 
+        self._invalidate_read_cache()
         project = Project(
             id=project_id,
             name=name,
@@ -282,28 +545,34 @@ class TaskStore(QObject):
 
     def get_project(self, project_id: int) -> Project | None:
         """Get a project by ID."""
-        row = self.db.fetchone("SELECT * FROM projects WHERE id = ?", (project_id,))
+        row = self.db.fetchone(
+            f"SELECT {_PROJECT_COLUMNS} FROM projects WHERE id = ?", (project_id,)
+        )
         if row is None:
             return None
         return self._row_to_project(row)
 
+    @_read_cached
     def get_project_by_name(self, name: str) -> Project | None:
         """Get a project by name."""
         row = self.db.fetchone(
-            "SELECT * FROM projects WHERE LOWER(name) = LOWER(?)",
+            f"SELECT {_PROJECT_COLUMNS} FROM projects WHERE name = ? COLLATE NOCASE",
             (name,)
         )
         if row is None:
             return None
         return self._row_to_project(row)
 
+    @_read_cached
     def list_projects(self, include_archived: bool = False) -> list[Project]:
         """List all projects."""
         if include_archived:
-            rows = self.db.fetchall("SELECT * FROM projects ORDER BY name")
+            rows = self.db.fetchall_tuples(
+                f"SELECT {_PROJECT_COLUMNS} FROM projects ORDER BY name"
+            )
         else:
-            rows = self.db.fetchall(
-                "SELECT * FROM projects WHERE archived = 0 ORDER BY name"
+            rows = self.db.fetchall_tuples(
+                f"SELECT {_PROJECT_COLUMNS} FROM projects WHERE archived = 0 ORDER BY name"
             )
         return [self._row_to_project(row) for row in rows]
 
@@ -311,7 +580,11 @@ class TaskStore(QObject):
         """Delete a project (tasks will have project_id set to NULL)."""
         with self.db.connection() as conn:
             cursor = conn.execute("DELETE FROM projects WHERE id = ?", (project_id,))
-            return cursor.rowcount > 0
+            deleted = cursor.rowcount > 0
+
+        if deleted:
+            self._invalidate_read_cache()
+        return deleted
 
     # === Reminder Operations ===
 
@@ -332,7 +605,7 @@ class TaskStore(QObject):
             )
             reminder_id = cursor.lastrowid
 
-        return Reminder(
+        reminder = Reminder(
             id=reminder_id,
             task_id=task_id,
             remind_at=remind_at,
@@ -340,11 +613,15 @@ class TaskStore(QObject):
             created_at=now,
         )
 
+        self.reminder_created.emit(reminder)
+        return reminder
+
     def get_pending_reminders(self, before: datetime) -> list[tuple[Reminder, Task]]:
         """Get reminders due before the specified time."""
-        rows = self.db.fetchall(
-            """SELECT r.*, t.title, t.description, t.priority, t.status,
-                      t.project_id, t.due_date, t.ha_list_name, t.created_at as task_created_at
+        rows = self.db.fetchall_tuples(
+            """SELECT r.id, r.task_id, r.remind_at, r.reminder_type, r.sent,
+                      r.created_at, t.title, t.description, t.priority, t.status,
+                      t.project_id, t.due_date, t.ha_list_name, t.created_at
                FROM task_reminders r
                JOIN tasks t ON r.task_id = t.id
                WHERE r.sent = 0 AND r.remind_at <= ? AND t.status = 'pending'
@@ -355,28 +632,38 @@ class TaskStore(QObject):
         results = []
         for row in rows:
             reminder = Reminder(
-                id=row["id"],
-                task_id=row["task_id"],
-                remind_at=row["remind_at"],
-                reminder_type=row["reminder_type"],
-                sent=bool(row["sent"]),
-                created_at=row["created_at"],
+                id=row[0],
+                task_id=row[1],
+                remind_at=row[2],
+                reminder_type=row[3],
+                sent=bool(row[4]),
+                created_at=row[5],
             )
             task = Task(
-                id=row["task_id"],
-                title=row["title"],
-                description=row["description"],
-                priority=Priority(row["priority"]),
-                status=TaskStatus(row["status"]),
-                project_id=row["project_id"],
-                due_date=row["due_date"],
-                ha_list_name=row["ha_list_name"],
-                created_at=row["task_created_at"],
+                id=row[1],
+                title=row[6],
+                description=row[7],
+                priority=_PRIORITY_BY_VALUE[row[8]],
+                status=_STATUS_BY_VALUE[row[9]],
+                project_id=row[10],
+                due_date=row[11],
+                ha_list_name=row[12],
+                created_at=row[13],
             )
             results.append((reminder, task))
 
         return results
 
+    def get_unsent_reminder_times(self) -> list[tuple[datetime, int]]:
+        """Get (remind_at, reminder_id) for all unsent reminders of pending tasks."""
+        rows = self.db.fetchall(
+            """SELECT r.remind_at, r.id
+               FROM task_reminders r
+               JOIN tasks t ON r.task_id = t.id
+               WHERE r.sent = 0 AND t.status = 'pending'"""
+        )
+        return [(row["remind_at"], row["id"]) for row in rows]
+
     def mark_reminder_sent(self, reminder_id: int) -> None:
         """Mark a reminder as sent."""
         self.db.execute(
@@ -384,12 +671,43 @@ class TaskStore(QObject):
             (reminder_id,)
         )
 
+    def mark_reminders_sent(
+        self,
+        reminder_ids: list[int],
+        renewals: list[tuple[int, datetime, str]] | None = None,
+        now: datetime | None = None,
+    ) -> None:
+        """Mark reminders as sent and schedule follow-ups in one transaction.
+
+        Args:
+            reminder_ids: Reminders to mark as sent
+            renewals: (task_id, remind_at, reminder_type) rows to insert
+            now: Creation time for the renewals (defaults to the current time)
+        """
+        if not reminder_ids and not renewals:
+            return
+
+        if now is None:
+            now = datetime.now()
+        with self.db.connection() as conn:
+            conn.executemany(
+                "UPDATE task_reminders SET sent = 1 WHERE id = ?",
+                [(rid,) for rid in reminder_ids]
+            )
+            if renewals:
+                conn.executemany(
+                    """INSERT INTO task_reminders (task_id, remind_at, reminder_type, created_at)
+                       VALUES (?, ?, ?, ?)""",
+                    [(task_id, remind_at, rtype, now)
+                     for task_id, remind_at, rtype in renewals]
+                )
+
     # === HA Sync Helpers ===
 
     def get_tasks_by_ha_list(self, list_name: str) -> list[Task]:
         """Get all tasks synced to a specific HA list."""
-        rows = self.db.fetchall(
-            """SELECT t.*, p.name as project_name
+        rows = self.db.fetchall_tuples(
+            f"""SELECT {_TASK_COLUMNS}
                FROM tasks t
                LEFT JOIN projects p ON t.project_id = p.id
                WHERE t.ha_list_name = ?
@@ -398,6 +716,99 @@ class TaskStore(QObject):
         )
         return [self._row_to_task(row) for row in rows]
 
+    def get_tasks_by_ha_lists(
+        self,
+        list_names: list[str],
+        needing_sync: bool = False,
+    ) -> dict[str, list[Task]]:
+        """Get tasks for several HA lists in one query, grouped by list.
+
+        Args:
+            list_names: HA lists to fetch
+            needing_sync: Only include tasks that still need pushing or
+                completion syncing (see get_tasks_needing_push and
+                get_tasks_needing_completion_sync)
+        """
+        by_list: dict[str, list[Task]] = {name: [] for name in list_names}
+        if not list_names:
+            return by_list
+
+        placeholders = ", ".join("?" for _ in list_names)
+        sync_filter = ""
+        if needing_sync:
+            sync_filter = """
+                 AND ((t.ha_synced_at IS NULL AND t.status = 'pending')
+                      OR (t.ha_synced_at IS NOT NULL AND t.status = 'completed'))"""
+
+        rows = self.db.fetchall_tuples(
+            f"""SELECT {_TASK_COLUMNS}
+               FROM tasks t
+               LEFT JOIN projects p ON t.project_id = p.id
+               WHERE t.ha_list_name IN ({placeholders}){sync_filter}
+               ORDER BY t.created_at DESC""",
+            tuple(list_names)
+        )
+        for row in rows:
+            task = self._row_to_task(row)
+            by_list[task.ha_list_name].append(task)
+        return by_list
+
+    def get_tasks_needing_push(self, list_name: str) -> list[Task]:
+        """Get pending tasks on an HA list that haven't been pushed yet."""
+        rows = self.db.fetchall_tuples(
+            f"""SELECT {_TASK_COLUMNS}
+               FROM tasks t
+               LEFT JOIN projects p ON t.project_id = p.id
+               WHERE t.ha_list_name = ?
+                 AND t.ha_synced_at IS NULL
+                 AND t.status = 'pending'
+               ORDER BY t.created_at DESC""",
+            (list_name,)
+        )
+        return [self._row_to_task(row) for row in rows]
+
+    def get_tasks_needing_completion_sync(self, list_name: str) -> list[Task]:
+        """Get completed tasks on an HA list that were previously pushed."""
+        rows = self.db.fetchall_tuples(
+            f"""SELECT {_TASK_COLUMNS}
+               FROM tasks t
+               LEFT JOIN projects p ON t.project_id = p.id
+               WHERE t.ha_list_name = ?
+                 AND t.ha_synced_at IS NOT NULL
+                 AND t.status = 'completed'
+               ORDER BY t.created_at DESC""",
+            (list_name,)
+        )
+        return [self._row_to_task(row) for row in rows]
+
+    def ha_title_index(self, list_name: str) -> set[str]:
+        """Get the lowercased titles of all tasks on an HA list.
+
+        The returned set is kept up to date by the store and must not be
+        modified by callers.
+        """
+        with self._ha_title_lock:
+            titles = self._ha_title_index.get(list_name)
+            if titles is None:
+                rows = self.db.fetchall(
+                    "SELECT title FROM tasks WHERE ha_list_name = ?",
+                    (list_name,)
+                )
+                titles = {row["title"].lower() for row in rows}
+                self._ha_title_index[list_name] = titles
+            return titles
+
+    def _invalidate_ha_title_index(self) -> None:
+        """Drop the HA title index so it is reloaded on next access."""
+        with self._ha_title_lock:
+            self._ha_title_index.clear()
+
+    def _invalidate_read_cache(self) -> None:
+        """Drop cached read results after a write."""
+        with self._read_cache_lock:
+            self._read_cache.clear()
+            self._read_generation += 1
+
     def update_ha_sync_status(
         self,
         task_id: int,
@@ -409,9 +820,28 @@ class TaskStore(QObject):
             "UPDATE tasks SET ha_item_id = ?, ha_synced_at = ? WHERE id = ?",
             (ha_item_id, now, task_id)
         )
+        self._invalidate_read_cache()
+
+    def update_ha_sync_statuses(self, items: list[tuple[int, str | None]]) -> None:
+        """Update HA sync status for several tasks in one transaction.
+
+        Args:
+            items: (task_id, ha_item_id) pairs
+        """
+        if not items:
+            return
+
+        now = datetime.now()
+        with self.db.connection() as conn:
+            conn.executemany(
+                "UPDATE tasks SET ha_item_id = ?, ha_synced_at = ? WHERE id = ?",
+                [(ha_item_id, now, task_id) for task_id, ha_item_id in items]
+            )
+        self._invalidate_read_cache()
 
     # === Statistics ===
 
+    @_read_cached
     def get_task_count(self, status: TaskStatus | None = None) -> int:
         """Get count of tasks, optionally filtered by status."""
         if status:
@@ -424,36 +854,63 @@ class TaskStore(QObject):
 
         return row["count"] if row else 0
 
+    def get_task_stats(self, within_hours: int = 24) -> dict[str, int]:
+        """Get total, pending, completed, overdue and due-soon counts.
+
+        Counts in a single aggregate query instead of loading Task rows;
+        due_soon includes overdue tasks, like get_tasks_due_soon.
+        """
+        from datetime import timedelta
+        now = datetime.now()
+        deadline = now + timedelta(hours=within_hours)
+
+        row = self.db.fetchone(
+            """SELECT COUNT(*),
+                      COALESCE(SUM(status = 'pending'), 0),
+                      COALESCE(SUM(status = 'completed'), 0),
+                      COALESCE(SUM(status = 'pending' AND due_date < ?), 0),
+                      COALESCE(SUM(status = 'pending' AND due_date <= ?), 0)
+               FROM tasks""",
+            (now, deadline)
+        )
+        return {
+            "total": row[0],
+            "pending": row[1],
+            "completed": row[2],
+            "overdue": row[3],
+            "due_soon": row[4],
+        }
+
     # === Helper Methods ===
 
     def _row_to_task(self, row) -> Task:
-        """Convert a database row to a Task object."""
+        """Convert a row selected with _TASK_COLUMNS to a Task object."""
         return Task(
-            id=row["id"],
-            title=row["title"],
-            description=row["description"],
-            priority=Priority(row["priority"]),
-            status=TaskStatus(row["status"]),
-            project_id=row["project_id"],
-            project_name=row["project_name"] if "project_name" in row.keys() else None,
-            due_date=row["due_date"],
-            reminder_at=row["reminder_at"],
-            reminder_sent=bool(row["reminder_sent"]),
-            ha_list_name=row["ha_list_name"],
-            ha_item_id=row["ha_item_id"],
-            ha_synced_at=row["ha_synced_at"],
-            created_at=row["created_at"],
-            updated_at=row["updated_at"],
-            completed_at=row["completed_at"],
+            id=row[0],
+            title=row[1],
+            description=row[2],
+            priority=_PRIORITY_BY_VALUE[row[3]],
+            status=_STATUS_BY_VALUE[row[4]],
+            project_id=row[5],
+            project_name=row[6],
+            due_date=row[7],
+            reminder_at=row[8],
+            reminder_sent=bool(row[9]),
+            ha_list_name=row[10],
+            ha_item_id=row[11],
+            ha_synced_at=row[12],
+            created_at=row[13],
+            updated_at=row[14],
+            completed_at=row[15],
         )
 
     def _row_to_project(self, row) -> Project:
-        """Convert a database row to a Project object."""
+        """Convert a row selected with _PROJECT_COLUMNS to a Project object."""
         return Project(
-            id=row["id"],
-            name=row["name"],
-            description=row["description"],
-            color=row["color"],
-            created_at=row["created_at"],
-            archived=bool(row["archived"]),
+            id=row[0],
+            name=row[1],
+            description=row[2],
+            color=row[3],
+            created_at=row[4],
+            archived=bool(row[5]),
         )
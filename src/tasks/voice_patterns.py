@@ -25,28 +25,28 @@ class TaskVoiceParser:
     """Parse natural language task commands."""
 
     # Add task patterns (English and Norwegian)
-    ADD_PATTERNS = [
-        r"(?:add|create|new) (?:a )?task (?:to )?(?:do )?(.+)",
-        r"(?:add|put) (.+?) (?:to|on) (?:my )?(?:todo|task|shopping|grocery)(?:s| list)?",
-        r"(?:add) (.+?) to (?:the )?(?:shopping|grocery) list",
-        r"(?:remind me to|i need to|don't forget to|gotta) (.+)",
-        r"(?:legg til|ny) (?:oppgave )?(.+)",  # Norwegian
-        r"(?:husk meg på|ikke glem) (.+)",  # Norwegian
-    ]
+    ADD_PATTERNS = (
+        re.compile(r"(?:add|create|new) (?:a )?task (?:to )?(?:do )?(.+)"),
+        re.compile(r"(?:add|put) (.+?) (?:to|on) (?:my )?(?:todo|task|shopping|grocery)(?:s| list)?"),
+        re.compile(r"(?:add) (.+?) to (?:the )?(?:shopping|grocery) list"),
+        re.compile(r"(?:remind me to|i need to|don't forget to|gotta) (.+)"),
+        re.compile(r"(?:legg til|ny) (?:oppgave )?(.+)"),  # Norwegian
+        re.compile(r"(?:husk meg på|ikke glem) (.+)"),  # Norwegian
+    )
 
     # Complete task patterns
-    COMPLETE_PATTERNS = [
-        r"(?:complete|finish|done(?: with)?|mark (?:as )?(?:done|complete)|check off) (?:task )?(.+)",
-        r"(?:i (?:finished|completed|did|done)) (.+)",
-        r"(?:ferdig med|fullført) (.+)",  # Norwegian
-    ]
+    COMPLETE_PATTERNS = (
+        re.compile(r"(?:complete|finish|done(?: with)?|mark (?:as )?(?:done|complete)|check off) (?:task )?(.+)"),
+        re.compile(r"(?:i (?:finished|completed|did|done)) (.+)"),
+        re.compile(r"(?:ferdig med|fullført) (.+)"),  # Norwegian
+    )
 
     # List task patterns
-    LIST_PATTERNS = [
-        r"(?:what(?:'s| is) on my|show(?: me)?(?: my)?|list(?: my)?|read(?: my)?) ?(?:todo|task|to-do)(?:s| list)?",
-        r"what (?:do i (?:need|have) to do|are my tasks)",
-        r"(?:hva (?:er|skal|må) jeg (?:gjøre|huske)|vis (?:mine )?oppgaver)",  # Norwegian
-    ]
+    LIST_PATTERNS = (
+        re.compile(r"(?:what(?:'s| is) on my|show(?: me)?(?: my)?|list(?: my)?|read(?: my)?) ?(?:todo|task|to-do)(?:s| list)?"),
+        re.compile(r"what (?:do i (?:need|have) to do|are my tasks)"),
+        re.compile(r"(?:hva (?:er|skal|må) jeg (?:gjøre|huske)|vis (?:mine )?oppgaver)"),  # Norwegian
+    )
 
     # Priority keywords
     PRIORITY_HIGH = [
@@ -58,17 +58,17 @@ class TaskVoiceParser:
         "lav prioritet", "ikke viktig", "når som helst",
     ]
 
-    # Time patterns with their delta functions
-    TIME_PATTERNS = [
-        (r"\btoday\b|\bi dag\b", lambda: _end_of_day(0)),
-        (r"\btomorrow\b|\bi morgen\b", lambda: _end_of_day(1)),
-        (r"\bnext week\b|\bneste uke\b", lambda: datetime.now() + timedelta(weeks=1)),
-        (r"\bthis weekend\b", lambda: _next_weekend()),
-        (r"\bin an? hour\b|\bom en time\b", lambda: datetime.now() + timedelta(hours=1)),
-        (r"\bin (\d+) minutes?\b|\bom (\d+) minutt(?:er)?\b", lambda m: datetime.now() + timedelta(minutes=int(m))),
-        (r"\bin (\d+) hours?\b|\bom (\d+) time(?:r)?\b", lambda m: datetime.now() + timedelta(hours=int(m))),
-        (r"\bin (\d+) days?\b|\bom (\d+) dag(?:er)?\b", lambda m: datetime.now() + timedelta(days=int(m))),
-    ]
+    # Time patterns with their delta functions, relative to the parse time
+    TIME_PATTERNS = (
+        (re.compile(r"\btoday\b|\bi dag\b", re.IGNORECASE), lambda now: _end_of_day(now, 0)),
+        (re.compile(r"\btomorrow\b|\bi morgen\b", re.IGNORECASE), lambda now: _end_of_day(now, 1)),
+        (re.compile(r"\bnext week\b|\bneste uke\b", re.IGNORECASE), lambda now: now + timedelta(weeks=1)),
+        (re.compile(r"\bthis weekend\b", re.IGNORECASE), lambda now: _next_weekend(now)),
+        (re.compile(r"\bin an? hour\b|\bom en time\b", re.IGNORECASE), lambda now: now + timedelta(hours=1)),
+        (re.compile(r"\bin (\d+) minutes?\b|\bom (\d+) minutt(?:er)?\b", re.IGNORECASE), lambda now, m: now + timedelta(minutes=int(m))),
+        (re.compile(r"\bin (\d+) hours?\b|\bom (\d+) time(?:r)?\b", re.IGNORECASE), lambda now, m: now + timedelta(hours=int(m))),
+        (re.compile(r"\bin (\d+) days?\b|\bom (\d+) dag(?:er)?\b", re.IGNORECASE), lambda now, m: now + timedelta(days=int(m))),
+    )
 
     # Shopping/grocery list keywords -> HA Handleliste
     SHOPPING_KEYWORDS = [
@@ -81,13 +81,39 @@ class TaskVoiceParser:
         "daily", "dag til dag", "today's list", "dagens",
     ]
 
-    def parse(self, message: str) -> ParsedTaskCommand | None:
-        """Parse a message for task commands."""
+    # Keyword lists as single alternations, so each category is one C-level scan
+    PRIORITY_HIGH_PATTERN = re.compile("|".join(map(re.escape, PRIORITY_HIGH)))
+    PRIORITY_LOW_PATTERN = re.compile("|".join(map(re.escape, PRIORITY_LOW)))
+    SHOPPING_PATTERN = re.compile("|".join(map(re.escape, SHOPPING_KEYWORDS)))
+    DAILY_PATTERN = re.compile("|".join(map(re.escape, DAILY_KEYWORDS)))
+
+    # Modifier extraction and title cleanup
+    PROJECT_PATTERN = re.compile(r"(?:for|in|til) (?:project|prosjekt) (\w+)")
+    SHOPPING_CLEANUP_PATTERNS = (
+        re.compile(r"\b(?:to )?(?:the )?shopping list\b", re.IGNORECASE),
+        re.compile(r"\b(?:på )?handleliste(?:n)?\b", re.IGNORECASE),
+    )
+    # Time and priority phrases stripped from titles in one pass
+    TITLE_CLEANUP_PATTERN = re.compile(
+        "|".join(
+            [pattern.pattern for pattern, _ in TIME_PATTERNS]
+            + [rf"\b{phrase}\b" for phrase in PRIORITY_HIGH + PRIORITY_LOW]
+        ),
+        re.IGNORECASE,
+    )
+    WHITESPACE_PATTERN = re.compile(r"\s+")
+
+    def parse(self, message: str, now: datetime | None = None) -> ParsedTaskCommand | None:
+        """Parse a message for task commands.
+
+        Relative times ("tomorrow", "in 2 hours") are resolved against now,
+        which defaults to the current time.
+        """
         message_lower = message.lower()
 
         # Try list patterns first (most specific)
         for pattern in self.LIST_PATTERNS:
-            if re.search(pattern, message_lower):
+            if pattern.search(message_lower):
                 cmd = ParsedTaskCommand(action="list")
                 # Check for priority filter
                 if any(kw in message_lower for kw in ["high priority", "viktig", "important"]):
@@ -98,20 +124,24 @@ class TaskVoiceParser:
 
         # Try complete patterns
         for pattern in self.COMPLETE_PATTERNS:
-            match = re.search(pattern, message_lower)
+            match = pattern.search(message_lower)
             if match:
                 title = match.group(1).strip()
                 return ParsedTaskCommand(action="complete", title=title)
 
         # Try add patterns
         for pattern in self.ADD_PATTERNS:
-            match = re.search(pattern, message_lower)
+            match = pattern.search(message_lower)
             if match:
-                return self._parse_add_command(match.group(1), message)
+                if now is None:
+                    now = datetime.now()
+                return self._parse_add_command(match.group(1), message, now)
 
         return None
 
-    def _parse_add_command(self, raw_title: str, full_message: str) -> ParsedTaskCommand:
+    def _parse_add_command(
+        self, raw_title: str, full_message: str, now: datetime
+    ) -> ParsedTaskCommand:
         """Parse an add task command with optional modifiers."""
         title = raw_title.strip()
         message_lower = full_message.lower()
@@ -119,20 +149,20 @@ class TaskVoiceParser:
         cmd = ParsedTaskCommand(action="add", title=title)
 
         # Extract priority
-        if any(kw in message_lower for kw in self.PRIORITY_HIGH):
+        if self.PRIORITY_HIGH_PATTERN.search(message_lower):
             cmd.priority = Priority.HIGH
-        elif any(kw in message_lower for kw in self.PRIORITY_LOW):
+        elif self.PRIORITY_LOW_PATTERN.search(message_lower):
             cmd.priority = Priority.LOW
 
         # Extract time/deadline
         for pattern, time_func in self.TIME_PATTERNS:
-            match = re.search(pattern, message_lower)
+            match = pattern.search(message_lower)
             if match:
                 groups = [g for g in match.groups() if g is not None] if match.groups() else []
                 if groups:
-                    cmd.due_date = time_func(groups[0])
+                    cmd.due_date = time_func(now, groups[0])
                 else:
-                    cmd.due_date = time_func()
+                    cmd.due_date = time_func(now)
 
                 # If "remind" is in message, also set reminder
                 if "remind" in message_lower or "husk" in message_lower:
@@ -140,28 +170,24 @@ class TaskVoiceParser:
                 break
 
         # Extract project (e.g., "for project X", "in project X")
-        project_match = re.search(r"(?:for|in|til) (?:project|prosjekt) (\w+)", message_lower)
+        project_match = self.PROJECT_PATTERN.search(message_lower)
         if project_match:
             cmd.project = project_match.group(1)
 
         # Extract HA list
-        if any(kw in message_lower for kw in self.SHOPPING_KEYWORDS):
+        if self.SHOPPING_PATTERN.search(message_lower):
             cmd.ha_list = "Handleliste"
             # Clean up title - remove shopping keywords
-            title = re.sub(r"\b(?:to )?(?:the )?shopping list\b", "", title, flags=re.IGNORECASE)
-            title = re.sub(r"\b(?:på )?handleliste(?:n)?\b", "", title, flags=re.IGNORECASE)
+            for pattern in self.SHOPPING_CLEANUP_PATTERNS:
+                title = pattern.sub("", title)
             cmd.title = title.strip()
 
-        elif any(kw in message_lower for kw in self.DAILY_KEYWORDS):
+        elif self.DAILY_PATTERN.search(message_lower):
             cmd.ha_list = "Dag til dag"
 
         # Clean up title - remove time phrases and priority phrases
-        clean_title = cmd.title
-        for pattern, _ in self.TIME_PATTERNS:
-            clean_title = re.sub(pattern, "", clean_title, flags=re.IGNORECASE)
-        for phrase in self.PRIORITY_HIGH + self.PRIORITY_LOW:
-            clean_title = re.sub(rf"\b{phrase}\b", "", clean_title, flags=re.IGNORECASE)
-        clean_title = re.sub(r"\s+", " ", clean_title).strip()
+        clean_title = self.TITLE_CLEANUP_PATTERN.sub("", cmd.title)
+        clean_title = self.WHITESPACE_PATTERN.sub(" ", clean_title).strip()
 
         if clean_title:
             cmd.title = clean_title
@@ -169,15 +195,14 @@ class TaskVoiceParser:
         return cmd
 
 
-def _end_of_day(days_from_now: int) -> datetime:
+def _end_of_day(now: datetime, days_from_now: int) -> datetime:
     """Get end of day (23:59) for N days from now."""
-    target = datetime.now() + timedelta(days=days_from_now)
+    target = now + timedelta(days=days_from_now)
     return target.replace(hour=23, minute=59, second=59, microsecond=0)
 
 
-def _next_weekend() -> datetime:
+def _next_weekend(now: datetime) -> datetime:
     """Get next Saturday."""
-    now = datetime.now()
     days_ahead = 5 - now.weekday()  # Saturday is 5
     if days_ahead <= 0:
         days_ahead += 7
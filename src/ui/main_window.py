@@ -1,6 +1,9 @@
 """Main window for Aida."""
 
+import re
+
 from PySide6.QtWidgets import (
+    QApplication,
     QMainWindow,
     QWidget,
     QVBoxLayout,
@@ -9,42 +12,165 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QPushButton,
     QLabel,
-    QFrame,
     QCheckBox,
+    QListView,
+    QPlainTextEdit,
+    QStyle,
+    QStyledItemDelegate,
 )
-from PySide6.QtCore import Qt, Signal, Slot
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, Signal, Slot, QAbstractListModel, QModelIndex, QSize
+from PySide6.QtGui import QAction, QColor, QFont, QFontMetrics, QKeySequence, QPainter
 from src.ui.visualizer import VisualizerWidget
 
+# Status texts that show the visualizer in its active mode
+ACTIVE_STATUS_PATTERN = re.compile(
+    "Speaking|Thinking|Searching|Fetching|Opening|Looking|Organizing|Compressing|Renaming"
+)
 
-class ChatMessage(QFrame):
-    """A single chat message widget."""
-
-    def __init__(self, text: str, is_user: bool, parent=None):
-        super().__init__(parent)
-
-        self.setFrameShape(QFrame.Shape.StyledPanel)
-
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(10, 5, 10, 5)
 
-        # Sender label
-        sender = QLabel("You" if is_user else "Aida")
-        layout.addWidget(sender)
+class ChatModel(QAbstractListModel):
+    """Chat messages as (text, is_user) rows."""
 
-        # Message text
-        message = QLabel(text)
-        message.setWordWrap(True)
-        message.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-        layout.addWidget(message)
+    IsUserRole = Qt.ItemDataRole.UserRole + 1
 
-        # Style based on sender (explicit text color for dark themes)
-        if is_user:
-            self.setStyleSheet("background-color: #e3f2fd; border-radius: 8px; color: #1a1a1a;")
-            sender.setStyleSheet("font-weight: bold; color: #1565c0;")
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._messages: list[tuple[str, bool]] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._messages)
+
+    def flags(self, index) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        # "Editable" only so a double-click opens the read-only text editor
+        return (
+            Qt.ItemFlag.ItemIsEnabled
+            | Qt.ItemFlag.ItemIsSelectable
+            | Qt.ItemFlag.ItemIsEditable
+        )
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        text, is_user = self._messages[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return text
+        if role == self.IsUserRole:
+            return is_user
+        return None
+
+    def append_message(self, text: str, is_user: bool) -> None:
+        """Append a message row."""
+        row = len(self._messages)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._messages.append((text, is_user))
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        """Remove all messages."""
+        self.beginResetModel()
+        self._messages.clear()
+        self.endResetModel()
+
+
+class ChatDelegate(QStyledItemDelegate):
+    """Paints a chat message as a rounded bubble with a sender line."""
+
+    # Explicit text color for dark themes
+    USER_BACKGROUND = QColor("#e3f2fd")
+    USER_SENDER = QColor("#1565c0")
+    ASSISTANT_BACKGROUND = QColor("#f5f5f5")
+    ASSISTANT_SENDER = QColor("#6a1b9a")
+    TEXT_COLOR = QColor("#1a1a1a")
+
+    RADIUS = 8
+    MARGIN_X = 10
+    MARGIN_Y = 5
+    LINE_SPACING = 6
+
+    def paint(self, painter, option, index) -> None:
+        is_user = index.data(ChatModel.IsUserRole)
+        content = option.rect.adjusted(
+            self.MARGIN_X, self.MARGIN_Y, -self.MARGIN_X, -self.MARGIN_Y
+        )
+        sender_font = self._sender_font(option.font)
+        sender_height = QFontMetrics(sender_font).height()
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self.USER_BACKGROUND if is_user else self.ASSISTANT_BACKGROUND)
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.setPen(option.palette.highlight().color())
+        painter.drawRoundedRect(option.rect, self.RADIUS, self.RADIUS)
+
+        painter.setFont(sender_font)
+        painter.setPen(self.USER_SENDER if is_user else self.ASSISTANT_SENDER)
+        painter.drawText(
+            content.adjusted(0, 0, 0, sender_height - content.height()),
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            "You" if is_user else "Aida",
+        )
+
+        painter.setFont(option.font)
+        painter.setPen(self.TEXT_COLOR)
+        painter.drawText(
+            content.adjusted(0, sender_height + self.LINE_SPACING, 0, 0),
+            Qt.AlignmentFlag.AlignLeft | Qt.TextFlag.TextWordWrap,
+            index.data(),
+        )
+        painter.restore()
+
+    def sizeHint(self, option, index) -> QSize:
+        view = option.widget
+        if view is not None:
+            width = view.viewport().width() - 2 * view.spacing()
         else:
-            self.setStyleSheet("background-color: #f5f5f5; border-radius: 8px; color: #1a1a1a;")
-            sender.setStyleSheet("font-weight: bold; color: #6a1b9a;")
+            width = option.rect.width()
+
+        text_rect = QFontMetrics(option.font).boundingRect(
+            0, 0, max(width - 2 * self.MARGIN_X, 1), 0,
+            Qt.TextFlag.TextWordWrap, index.data(),
+        )
+        sender_height = QFontMetrics(self._sender_font(option.font)).height()
+        height = (
+            2 * self.MARGIN_Y + sender_height + self.LINE_SPACING + text_rect.height()
+        )
+        return QSize(width, height)
+
+    def createEditor(self, parent, option, index) -> QWidget:
+        # Read-only, so part of a message can be selected and copied
+        editor = QPlainTextEdit(parent)
+        editor.setReadOnly(True)
+        editor.setFrameShape(QPlainTextEdit.Shape.NoFrame)
+        editor.setFont(option.font)
+        editor.setStyleSheet(
+            f"background: transparent; color: {self.TEXT_COLOR.name()};"
+        )
+        return editor
+
+    def setEditorData(self, editor, index) -> None:
+        editor.setPlainText(index.data())
+        editor.selectAll()
+
+    def setModelData(self, editor, model, index) -> None:
+        pass  # Messages are never edited
+
+    def updateEditorGeometry(self, editor, option, index) -> None:
+        sender_height = QFontMetrics(self._sender_font(option.font)).height()
+        editor.setGeometry(option.rect.adjusted(
+            self.MARGIN_X,
+            self.MARGIN_Y + sender_height + self.LINE_SPACING,
+            -self.MARGIN_X,
+            -self.MARGIN_Y,
+        ))
+
+    @staticmethod
+    def _sender_font(font: QFont) -> QFont:
+        bold = QFont(font)
+        bold.setBold(True)
+        return bold
 
 
 class MainWindow(QMainWindow):
@@ -99,20 +225,27 @@ class MainWindow(QMainWindow):
         ww_layout.addStretch()
         layout.addLayout(ww_layout)
 
-        # Chat area
-        self._chat_area = QWidget()
-        self._chat_layout = QVBoxLayout(self._chat_area)
-        self._chat_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        self._chat_layout.setSpacing(10)
-
-        # Scrollable chat
-        from PySide6.QtWidgets import QScrollArea
-
-        scroll = QScrollArea()
-        scroll.setWidget(self._chat_area)
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        layout.addWidget(scroll, 1)
+        # Chat area: messages are painted by a delegate, so only the
+        # visible rows cost anything to lay out and draw
+        self._chat_model = ChatModel(self)
+        self._chat_view = QListView()
+        self._chat_view.setModel(self._chat_model)
+        self._chat_view.setItemDelegate(ChatDelegate(self._chat_view))
+        self._chat_view.setSpacing(5)
+        self._chat_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self._chat_view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self._chat_view.setSelectionMode(QListView.SelectionMode.SingleSelection)
+        self._chat_view.setEditTriggers(QListView.EditTrigger.DoubleClicked)
+        self._chat_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        # Ctrl+C or the context menu copies the selected message; double-click
+        # opens it for selecting part of the text
+        copy_action = QAction("Copy", self._chat_view)
+        copy_action.setShortcut(QKeySequence.StandardKey.Copy)
+        copy_action.setShortcutContext(Qt.ShortcutContext.WidgetShortcut)
+        copy_action.triggered.connect(self._copy_selected_message)
+        self._chat_view.addAction(copy_action)
+        self._chat_view.setContextMenuPolicy(Qt.ContextMenuPolicy.ActionsContextMenu)
+        layout.addWidget(self._chat_view, 1)
 
         # Input area
         input_layout = QHBoxLayout()
@@ -145,8 +278,13 @@ class MainWindow(QMainWindow):
     @Slot(str, bool)
     def add_message(self, text: str, is_user: bool) -> None:
         """Add a message to the chat."""
-        message = ChatMessage(text, is_user)
-        self._chat_layout.addWidget(message)
+        self._chat_model.append_message(text, is_user)
+
+    def _copy_selected_message(self) -> None:
+        """Copy the selected chat message's text to the clipboard."""
+        index = self._chat_view.currentIndex()
+        if index.isValid():
+            QApplication.clipboard().setText(index.data())
 
     @Slot(str)
     def set_status(self, status: str) -> None:
@@ -154,12 +292,7 @@ class MainWindow(QMainWindow):
         self._status_label.setText(status)
         
         # Heuristic for active modes
-        active_keywords = [
-            "Speaking", "Thinking", "Searching", "Fetching", 
-            "Opening", "Looking", "Organizing", "Compressing", "Renaming"
-        ]
-        
-        if any(keyword in status for keyword in active_keywords):
+        if ACTIVE_STATUS_PATTERN.search(status):
              self.visualizer.set_mode("speaking")
         elif not "Listening" in status:
              self.visualizer.set_mode("idle")
@@ -178,7 +311,4 @@ class MainWindow(QMainWindow):
 
     def clear_chat(self) -> None:
         """Clear all chat messages."""
-        while self._chat_layout.count():
-            item = self._chat_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        self._chat_model.clear()
@@ -1,5 +1,11 @@
 """Settings dialog for Aida."""
 
+import functools
+import json
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -7,50 +13,193 @@ from PySide6.QtWidgets import (
     QGroupBox,
     QLabel,
     QComboBox,
-    QTextEdit,
+    QPlainTextEdit,
     QPushButton,
-    QFormLayout,
+    QGridLayout,
     QTabWidget,
     QWidget,
     QLineEdit,
     QCheckBox,
-    QListWidget,
+    QListView,
+)
+from PySide6.QtCore import (
+    Qt,
+    Signal,
+    QSignalBlocker,
+    QThread,
+    QAbstractListModel,
+    QModelIndex,
 )
-from PySide6.QtCore import Signal
+from PySide6.QtGui import QIntValidator
 
 from src.core.config import AidaConfig
 from src.core.audio_devices import AudioDeviceManager
 
 
+# Language presets: whisper language, Piper voice and system prompt
+PRESETS_PATH = Path(__file__).with_name("presets.json")
+
+
+@functools.cache
+def _load_presets() -> dict[str, dict[str, str]]:
+    """Read the language presets on first use."""
+    return json.loads(PRESETS_PATH.read_text(encoding="utf-8"))
+
+
+@functools.cache
+def _preset_lookup() -> dict[tuple[str, str], str]:
+    """Map (whisper language, stripped prompt) to a preset name."""
+    return {
+        (preset["whisper_lang"], preset["prompt"].strip()): lang
+        for lang, preset in _load_presets().items()
+    }
+
+
+@contextmanager
+def _updates_suspended(widget: QWidget):
+    """Hold off repaints of widget while it is rebuilt; nests safely."""
+    if not widget.updatesEnabled():
+        yield
+        return
+    widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        widget.setUpdatesEnabled(True)
+
+
+def _assign(obj, name: str, value) -> bool:
+    """Set obj.name to value if it differs; return whether it changed."""
+    if getattr(obj, name) == value:
+        return False
+    setattr(obj, name, value)
+    return True
+
+
+# Converters between config values and form widgets. The from-UI side also
+# gets the current config value, to keep it when the input is incomplete.
+def _set_text(edit: QLineEdit, value) -> None:
+    edit.setText(str(value))
+
+
+def _set_checked(box: QCheckBox, value: bool) -> None:
+    box.setChecked(value)
+
+
+def _stripped_text(edit: QLineEdit, current: str) -> str:
+    return edit.text().strip()
+
+
+def _raw_text(edit: QLineEdit, current: str) -> str:
+    return edit.text()
+
+
+def _checked(box: QCheckBox, current: bool) -> bool:
+    return box.isChecked()
+
+
+def _port_value(edit: QLineEdit, current: int) -> int:
+    """Port typed into a validated edit, or current if it is incomplete."""
+    if not edit.hasAcceptableInput():
+        return current
+    # The validator's locale may accept group separators that int() rejects
+    port, _ = edit.validator().locale().toInt(edit.text())
+    return port
+
+
+class RssFeedModel(QAbstractListModel):
+    """RSS feeds as {"name", "url"} dict rows."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._feeds: list[dict[str, str]] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._feeds)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        feed = self._feeds[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"{feed['name']} - {feed['url']}"
+        if role == Qt.ItemDataRole.UserRole:
+            return feed
+        return None
+
+    def feeds(self) -> list[dict[str, str]]:
+        """Copy of the feeds in display order."""
+        return list(self._feeds)
+
+    def set_feeds(self, feeds: list[dict[str, str]]) -> None:
+        """Replace all feeds."""
+        self.beginResetModel()
+        self._feeds = [{"name": feed["name"], "url": feed["url"]} for feed in feeds]
+        self.endResetModel()
+
+    def append_feed(self, name: str, url: str) -> None:
+        """Append a feed row."""
+        row = len(self._feeds)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._feeds.append({"name": name, "url": url})
+        self.endInsertRows()
+
+    def remove_feed(self, row: int) -> None:
+        """Remove the feed at row."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._feeds[row]
+        self.endRemoveRows()
+
+
+class DeviceLoader(QThread):
+    """Worker thread that enumerates audio devices."""
+
+    devices_loaded = Signal(list, list)  # microphones, speakers
+
+    def run(self):
+        self.devices_loaded.emit(
+            AudioDeviceManager.list_microphones(),
+            AudioDeviceManager.list_speakers(),
+        )
+
+
 class SettingsDialog(QDialog):
     """Settings dialog for configuring Aida."""
 
     settings_changed = Signal()
 
-    # Language presets
-    _presets = {
-        "English": {
-            "whisper_lang": "en",
-            "piper_voice": "en_US-amy-medium",
-            "prompt": """You are Aida, a helpful AI desktop assistant.
-You help users with tasks like web searches, opening applications, and answering questions.
-Be concise and friendly.
-
-CRITICAL INSTRUCTION: You must NOT hallucinate or make up information. If you do not know the answer to a question, or if you cannot verify the state of a device (like a light or door) because you lack access, simply state that you do not know or cannot check. Do not guess.
-
-You have access to the user's webcam and can see them when they ask. If someone asks you to see them, look at them, describe what you see, or any vision-related request - you CAN do this. The system will capture an image for you to analyze."""
-        },
-        "Norwegian": {
-            "whisper_lang": "no",
-            "piper_voice": "no_NO-talesyntese-medium",
-            "prompt": """Du er Aida, en hjelpsom AI-skrivebordsassistent.
-Du hjelper brukere med oppgaver som nettsøk, åpning av applikasjoner og å svare på spørsmål.
-Vær kortfattet og vennlig.
-
-KRITISK INSTRUKSJON: Du må IKKE hallusinere eller finne på informasjon. Hvis du ikke vet svaret på et spørsmål, eller hvis du ikke kan bekrefte tilstanden til en enhet (som et lys eller en dør) fordi du mangler tilgang, si ganske enkelt at du ikke vet eller ikke kan sjekke. Ikke gjett.
-
-Du har tilgang til brukerens webkamera og kan se dem når de spør. Hvis noen ber deg om å se dem, se på dem, beskriv hva du ser, eller andre synsrelaterte forespørsler - du KAN gjøre dette. Systemet vil ta et bilde du kan analysere."""
-        }
+    # Device lists are shared between dialog opens for this long
+    DEVICE_CACHE_TTL_S = 60.0
+    _device_cache: tuple[float, list, list] | None = None  # (loaded_at, mics, speakers)
+
+    # Tab indexes; every tab but General is built on first visit
+    GENERAL_TAB = 0
+    MAIL_TAB = 1
+    HA_TAB = 2
+    RSS_TAB = 3
+
+    # Device labels longer than this (in pixels) are elided, full name in the tooltip
+    DEVICE_LABEL_WIDTH = 380
+
+    # Plain config fields shown on each lazily built tab:
+    # (widget attribute, config section, config field, to_ui, from_ui)
+    _BINDINGS = {
+        MAIL_TAB: (
+            ("_mail_enabled", "mail", "enabled", _set_checked, _checked),
+            ("_email_edit", "mail", "email", _set_text, _stripped_text),
+            ("_password_edit", "mail", "password", _set_text, _raw_text),
+            ("_imap_server_edit", "mail", "imap_server", _set_text, _stripped_text),
+            ("_imap_port_edit", "mail", "imap_port", _set_text, _port_value),
+            ("_smtp_server_edit", "mail", "smtp_server", _set_text, _stripped_text),
+            ("_smtp_port_edit", "mail", "smtp_port", _set_text, _port_value),
+            ("_cal_enabled", "mail", "calendar_enabled", _set_checked, _checked),
+            ("_caldav_url_edit", "mail", "caldav_url", _set_text, _stripped_text),
+        ),
+        HA_TAB: (
+            ("_ha_enabled", "ha", "enabled", _set_checked, _checked),
+            ("_ha_url_edit", "ha", "url", _set_text, _stripped_text),
+            ("_ha_token_edit", "ha", "token", _set_text, _raw_text),
+        ),
     }
 
     def __init__(self, config: AidaConfig, parent=None):
@@ -58,13 +207,21 @@ Du har tilgang til brukerens webkamera og kan se dem når de spør. Hvis noen be
 
         self.config = config
         self._available_models: list[str] = []
+        # (microphones, speakers) shown in the combos; None while loading
+        self._devices: tuple[list, list] | None = None
+        self._device_loader: DeviceLoader | None = None
+        # Devices are enumerated once the General tab is showing
+        self._devices_pending = False
+        # Device list each combo currently shows, as (id, name, is_default) tuples
+        self._device_signatures: dict[QComboBox, tuple] = {}
 
         self.setWindowTitle("Aida Settings")
         self.setMinimumWidth(500)
         self.setMinimumHeight(500)
 
-        self._setup_ui()
-        self._load_current_settings()
+        with _updates_suspended(self):
+            self._setup_ui()
+            self._load_current_settings()
 
     def _setup_ui(self) -> None:
         """Set up the dialog UI."""
@@ -81,116 +238,173 @@ Du har tilgang til brukerens webkamera og kan se dem når de spør. Hvis noen be
 
         # Language Settings
         lang_group = QGroupBox("Language")
-        lang_layout = QFormLayout()
         
         self._lang_combo = QComboBox()
         self._lang_combo.addItem("Custom", None)
-        for lang in self._presets.keys():
+        for lang in _load_presets():
             self._lang_combo.addItem(lang, lang)
         self._lang_combo.currentIndexChanged.connect(self._on_language_changed)
-        lang_layout.addRow("Preset:", self._lang_combo)
-        
-        lang_group.setLayout(lang_layout)
+
+        self._populate_form(lang_group, [("Preset:", self._lang_combo)])
         general_layout.addWidget(lang_group)
 
         # LLM Settings
         llm_group = QGroupBox("LLM Settings")
-        llm_layout = QFormLayout()
 
         self._model_combo = QComboBox()
         self._model_combo.setMinimumWidth(250)
-        llm_layout.addRow("Model:", self._model_combo)
 
         self._vision_model_combo = QComboBox()
         self._vision_model_combo.setMinimumWidth(250)
-        llm_layout.addRow("Vision Model:", self._vision_model_combo)
 
-        self._prompt_edit = QTextEdit()
+        self._prompt_edit = QPlainTextEdit()
         self._prompt_edit.setMinimumHeight(100)
         self._prompt_edit.setMaximumHeight(150)
-        llm_layout.addRow("System Prompt:", self._prompt_edit)
 
-        llm_group.setLayout(llm_layout)
+        self._populate_form(llm_group, [
+            ("Model:", self._model_combo),
+            ("Vision Model:", self._vision_model_combo),
+            ("System Prompt:", self._prompt_edit),
+        ])
         general_layout.addWidget(llm_group)
 
         # Audio Settings
         audio_group = QGroupBox("Audio Settings")
-        audio_layout = QFormLayout()
 
         self._mic_combo = QComboBox()
-        self._mic_combo.setMinimumWidth(250)
-        audio_layout.addRow("Microphone:", self._mic_combo)
-
         self._speaker_combo = QComboBox()
-        self._speaker_combo.setMinimumWidth(250)
-        audio_layout.addRow("Speaker:", self._speaker_combo)
-
-        audio_group.setLayout(audio_layout)
+        for combo in (self._mic_combo, self._speaker_combo):
+            combo.setMinimumWidth(250)
+            # Size from a fixed length so long device names don't widen the dialog
+            combo.setSizeAdjustPolicy(
+                QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon
+            )
+
+        self._populate_form(audio_group, [
+            ("Microphone:", self._mic_combo),
+            ("Speaker:", self._speaker_combo),
+        ])
         general_layout.addWidget(audio_group)
         
         self.tabs.addTab(general_tab, "General")
 
-        # --- Mail Tab ---
-        mail_tab = QWidget()
-        mail_layout = QFormLayout(mail_tab)
-        mail_layout.setSpacing(15)
-        
+        self.tabs.addTab(QWidget(), "Mail & Calendar")
+        self.tabs.addTab(QWidget(), "Home Assistant")
+        self.tabs.addTab(QWidget(), "RSS Feeds")
+        self._tab_builders = {
+            self.MAIL_TAB: self._build_mail_tab,
+            self.HA_TAB: self._build_ha_tab,
+            self.RSS_TAB: self._build_rss_tab,
+        }
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
+        self.tabs.currentChanged.connect(self._load_pending_devices)
+
+        # Buttons
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+
+        self._refresh_btn = QPushButton("Refresh Devices")
+        self._refresh_btn.clicked.connect(self._refresh_devices)
+        button_layout.addWidget(self._refresh_btn)
+
+        self._save_btn = QPushButton("Save")
+        self._save_btn.clicked.connect(self._save_settings)
+        button_layout.addWidget(self._save_btn)
+
+        self._cancel_btn = QPushButton("Cancel")
+        self._cancel_btn.clicked.connect(self.reject)
+        button_layout.addWidget(self._cancel_btn)
+
+        main_layout.addLayout(button_layout)
+
+    def _populate_form(
+        self, parent: QWidget, rows: list[tuple[str | None, QWidget]], spacing: int | None = None
+    ) -> None:
+        """Lay out label/widget rows in one grid and install it on parent.
+
+        A row with no label spans both columns.
+        """
+        with _updates_suspended(parent):
+            grid = QGridLayout()
+            if spacing is not None:
+                grid.setSpacing(spacing)
+            for row, (label, widget) in enumerate(rows):
+                if label is None:
+                    grid.addWidget(widget, row, 0, 1, 2)
+                else:
+                    grid.addWidget(QLabel(label), row, 0)
+                    grid.addWidget(widget, row, 1)
+            grid.setRowStretch(len(rows), 1)
+            parent.setLayout(grid)
+
+    def _ensure_tab_built(self, index: int) -> None:
+        """Build a tab's widgets and load its settings on first visit."""
+        builder = self._tab_builders.pop(index, None)
+        if builder is not None:
+            builder()
+
+    def _is_tab_built(self, index: int) -> bool:
+        """Whether a lazily built tab has been created yet."""
+        return index not in self._tab_builders
+
+    def _build_mail_tab(self) -> None:
+        """Create the Mail & Calendar tab."""
         self._mail_enabled = QCheckBox("Enable Mail Integration")
-        mail_layout.addRow(self._mail_enabled)
-        
         self._email_edit = QLineEdit()
-        mail_layout.addRow("Email:", self._email_edit)
-        
+
         self._password_edit = QLineEdit()
         self._password_edit.setEchoMode(QLineEdit.EchoMode.Password)
         self._password_edit.setPlaceholderText("App Password recommended")
-        mail_layout.addRow("Password:", self._password_edit)
-        
+
         self._imap_server_edit = QLineEdit()
-        mail_layout.addRow("IMAP Server:", self._imap_server_edit)
-        
         self._imap_port_edit = QLineEdit()
-        mail_layout.addRow("IMAP Port:", self._imap_port_edit)
-        
+        self._imap_port_edit.setValidator(QIntValidator(1, 65535, self._imap_port_edit))
         self._smtp_server_edit = QLineEdit()
-        mail_layout.addRow("SMTP Server:", self._smtp_server_edit)
-        
         self._smtp_port_edit = QLineEdit()
-        mail_layout.addRow("SMTP Port:", self._smtp_port_edit)
-        
-        # Spacer
-        mail_layout.addRow(QLabel("--- Calendar ---"))
-        
+        self._smtp_port_edit.setValidator(QIntValidator(1, 65535, self._smtp_port_edit))
+
         self._cal_enabled = QCheckBox("Enable Calendar Integration")
-        mail_layout.addRow(self._cal_enabled)
-        
+
         self._caldav_url_edit = QLineEdit()
         self._caldav_url_edit.setPlaceholderText("Find this in your calendar provider settings")
-        mail_layout.addRow("CalDAV URL:", self._caldav_url_edit)
-        
-        self.tabs.addTab(mail_tab, "Mail & Calendar")
 
-        # --- Home Assistant Tab ---
-        ha_tab = QWidget()
-        ha_layout = QFormLayout(ha_tab)
-        ha_layout.setSpacing(15)
-        
+        self._populate_form(self.tabs.widget(self.MAIL_TAB), [
+            (None, self._mail_enabled),
+            ("Email:", self._email_edit),
+            ("Password:", self._password_edit),
+            ("IMAP Server:", self._imap_server_edit),
+            ("IMAP Port:", self._imap_port_edit),
+            ("SMTP Server:", self._smtp_server_edit),
+            ("SMTP Port:", self._smtp_port_edit),
+            (None, QLabel("--- Calendar ---")),
+            (None, self._cal_enabled),
+            ("CalDAV URL:", self._caldav_url_edit),
+        ], spacing=15)
+
+        self._load_bound_settings(self.MAIL_TAB)
+
+    def _build_ha_tab(self) -> None:
+        """Create the Home Assistant tab."""
         self._ha_enabled = QCheckBox("Enable Home Assistant Integration")
-        ha_layout.addRow(self._ha_enabled)
-        
+
         self._ha_url_edit = QLineEdit()
         self._ha_url_edit.setPlaceholderText("e.g. http://homeassistant.local:8123")
-        ha_layout.addRow("URL:", self._ha_url_edit)
-        
+
         self._ha_token_edit = QLineEdit()
         self._ha_token_edit.setEchoMode(QLineEdit.EchoMode.Password)
         self._ha_token_edit.setPlaceholderText("Long-Lived Access Token")
-        ha_layout.addRow("Token:", self._ha_token_edit)
-        
-        self.tabs.addTab(ha_tab, "Home Assistant")
 
-        # --- RSS Feeds Tab ---
-        rss_tab = QWidget()
+        self._populate_form(self.tabs.widget(self.HA_TAB), [
+            (None, self._ha_enabled),
+            ("URL:", self._ha_url_edit),
+            ("Token:", self._ha_token_edit),
+        ], spacing=15)
+
+        self._load_bound_settings(self.HA_TAB)
+
+    def _build_rss_tab(self) -> None:
+        """Create the RSS Feeds tab."""
+        rss_tab = self.tabs.widget(self.RSS_TAB)
         rss_layout = QVBoxLayout(rss_tab)
         rss_layout.setSpacing(10)
 
@@ -199,7 +413,9 @@ Du har tilgang til brukerens webkamera og kan se dem når de spør. Hvis noen be
 
         rss_layout.addWidget(QLabel("Configured news feeds:"))
 
-        self._rss_list = QListWidget()
+        self._rss_model = RssFeedModel(self)
+        self._rss_list = QListView()
+        self._rss_list.setModel(self._rss_model)
         self._rss_list.setMinimumHeight(150)
         rss_layout.addWidget(self._rss_list)
 
@@ -224,25 +440,30 @@ Du har tilgang til brukerens webkamera og kan se dem når de spør. Hvis noen be
         rss_layout.addWidget(self._rss_remove_btn)
 
         rss_layout.addStretch()
-        self.tabs.addTab(rss_tab, "RSS Feeds")
-
-        # Buttons
-        button_layout = QHBoxLayout()
-        button_layout.addStretch()
 
-        self._refresh_btn = QPushButton("Refresh Devices")
-        self._refresh_btn.clicked.connect(self._refresh_devices)
-        button_layout.addWidget(self._refresh_btn)
-
-        self._save_btn = QPushButton("Save")
-        self._save_btn.clicked.connect(self._save_settings)
-        button_layout.addWidget(self._save_btn)
+        self._load_rss_settings()
 
-        self._cancel_btn = QPushButton("Cancel")
-        self._cancel_btn.clicked.connect(self.reject)
-        button_layout.addWidget(self._cancel_btn)
-
-        main_layout.addLayout(button_layout)
+    def reload(self, config: AidaConfig) -> None:
+        """Show config again in a reused dialog, discarding unsaved edits."""
+        self.config = config
+        # Refill the device combos so they reselect the configured devices
+        self._device_signatures.clear()
+
+        with _updates_suspended(self):
+            # Drop the previous selection so the configured models win
+            for combo in (self._model_combo, self._vision_model_combo):
+                with QSignalBlocker(combo):
+                    combo.clear()
+            self._update_model_combos()
+
+            self._load_current_settings()
+            for tab in self._BINDINGS:
+                if self._is_tab_built(tab):
+                    self._load_bound_settings(tab)
+            if self._is_tab_built(self.RSS_TAB):
+                self._rss_name_edit.clear()
+                self._rss_url_edit.clear()
+                self._load_rss_settings()
 
     def set_available_models(self, models: list[str]) -> None:
         """Set the available Ollama models."""
@@ -254,31 +475,35 @@ Du har tilgang til brukerens webkamera og kan se dem når de spør. Hvis noen be
         current_model = self._model_combo.currentText()
         current_vision = self._vision_model_combo.currentText()
 
-        self._model_combo.clear()
-        self._vision_model_combo.clear()
-
-        for model in self._available_models:
-            self._model_combo.addItem(model)
-            self._vision_model_combo.addItem(model)
-
-        # Restore selection or set config value
-        if current_model and current_model in self._available_models:
-            self._model_combo.setCurrentText(current_model)
-        elif self.config.ollama.model in self._available_models:
-            self._model_combo.setCurrentText(self.config.ollama.model)
-
-        if current_vision and current_vision in self._available_models:
-            self._vision_model_combo.setCurrentText(current_vision)
-        elif self.config.ollama.vision_model in self._available_models:
-            self._vision_model_combo.setCurrentText(self.config.ollama.vision_model)
+        with (
+            _updates_suspended(self),
+            QSignalBlocker(self._model_combo),
+            QSignalBlocker(self._vision_model_combo),
+        ):
+            self._model_combo.clear()
+            self._vision_model_combo.clear()
+            self._model_combo.addItems(self._available_models)
+            self._vision_model_combo.addItems(self._available_models)
+
+            # Restore selection or set config value
+            if current_model and current_model in self._available_models:
+                self._model_combo.setCurrentText(current_model)
+            elif self.config.ollama.model in self._available_models:
+                self._model_combo.setCurrentText(self.config.ollama.model)
+
+            if current_vision and current_vision in self._available_models:
+                self._vision_model_combo.setCurrentText(current_vision)
+            elif self.config.ollama.vision_model in self._available_models:
+                self._vision_model_combo.setCurrentText(self.config.ollama.vision_model)
 
     def _on_language_changed(self, index: int) -> None:
         """Handle language preset change."""
         lang = self._lang_combo.itemData(index)
-        if not lang or lang not in self._presets:
+        presets = _load_presets()
+        if not lang or lang not in presets:
             return
 
-        preset = self._presets[lang]
+        preset = presets[lang]
         self._prompt_edit.setPlainText(preset["prompt"])
         
         # We store the other settings temporarily, applied on save
@@ -287,151 +512,191 @@ Du har tilgang til brukerens webkamera og kan se dem når de spør. Hvis noen be
     def _load_current_settings(self) -> None:
         """Load current settings into the UI."""
         # Check if current settings match a preset
-        current_whisper = self.config.whisper.language
-        current_prompt = self.config.ollama.system_prompt
-        
-        found_preset = False
-        for lang, preset in self._presets.items():
-            if (preset["whisper_lang"] == current_whisper and 
-                preset["prompt"].strip() == current_prompt.strip()):
-                
-                index = self._lang_combo.findData(lang)
-                if index >= 0:
-                    self._lang_combo.setCurrentIndex(index)
-                    found_preset = True
-                break
-        
-        if not found_preset:
-             self._lang_combo.setCurrentIndex(0) # Custom
+        lang = _preset_lookup().get(
+            (self.config.whisper.language, self.config.ollama.system_prompt.strip())
+        )
+        index = self._lang_combo.findData(lang) if lang else -1
+        self._lang_combo.setCurrentIndex(max(index, 0))  # 0 is Custom
 
         # System prompt
         self._prompt_edit.setPlainText(self.config.ollama.system_prompt)
         
-        # Mail settings
-        self._mail_enabled.setChecked(self.config.mail.enabled)
-        self._email_edit.setText(self.config.mail.email)
-        self._password_edit.setText(self.config.mail.password)
-        self._imap_server_edit.setText(self.config.mail.imap_server)
-        self._imap_port_edit.setText(str(self.config.mail.imap_port))
-        self._smtp_server_edit.setText(self.config.mail.smtp_server)
-        self._smtp_port_edit.setText(str(self.config.mail.smtp_port))
-        self._cal_enabled.setChecked(self.config.mail.calendar_enabled)
-        self._caldav_url_edit.setText(self.config.mail.caldav_url)
-        
-        # HA settings
-        self._ha_enabled.setChecked(self.config.ha.enabled)
-        self._ha_url_edit.setText(self.config.ha.url)
-        self._ha_token_edit.setText(self.config.ha.token)
-
-        # RSS settings
+        # Device lists, enumerated in the background when General is showing
+        self._devices = None
+        self._devices_pending = True
+        self._load_pending_devices(self.tabs.currentIndex())
+
+    def _load_bound_settings(self, tab: int) -> None:
+        """Load a tab's plain config fields into its widgets."""
+        for attr, section, field, to_ui, _ in self._BINDINGS[tab]:
+            to_ui(getattr(self, attr), getattr(getattr(self.config, section), field))
+
+    def _save_bound_settings(self, tab: int) -> bool:
+        """Write a tab's widgets back to their config fields; True if any changed."""
+        changed = False
+        for attr, section, field, _, from_ui in self._BINDINGS[tab]:
+            config_section = getattr(self.config, section)
+            changed |= _assign(
+                config_section,
+                field,
+                from_ui(getattr(self, attr), getattr(config_section, field)),
+            )
+        return changed
+
+    def _load_rss_settings(self) -> None:
+        """Load RSS settings into the RSS tab."""
         self._rss_enabled.setChecked(self.config.rss.enabled)
-        self._rss_list.clear()
-        for feed in self.config.rss.feeds:
-            self._rss_list.addItem(f"{feed['name']} - {feed['url']}")
+        self._rss_model.set_feeds(self.config.rss.feeds)
 
-        # Refresh device lists
-        self._refresh_devices()
+    def _load_pending_devices(self, index: int) -> None:
+        """Fill the device combos on the first visit to the General tab."""
+        if index == self.GENERAL_TAB and self._devices_pending:
+            self._devices_pending = False
+            self._load_devices(use_cache=True)
 
     def _refresh_devices(self) -> None:
-        """Refresh the audio device lists."""
-        # Microphones
-        self._mic_combo.clear()
-        self._mic_combo.addItem("System Default", None)
-
-        microphones = AudioDeviceManager.list_microphones()
-        for mic in microphones:
-            label = f"{mic.name}" + (" (default)" if mic.is_default else "")
-            self._mic_combo.addItem(label, mic.id)
-
-        # Set current selection
-        if self.config.audio.microphone_device is not None:
-            for i in range(self._mic_combo.count()):
-                if self._mic_combo.itemData(i) == self.config.audio.microphone_device:
-                    self._mic_combo.setCurrentIndex(i)
-                    break
-
-        # Speakers
-        self._speaker_combo.clear()
-        self._speaker_combo.addItem("System Default", None)
-
-        speakers = AudioDeviceManager.list_speakers()
-        for speaker in speakers:
-            label = f"{speaker.name}" + (" (default)" if speaker.is_default else "")
-            self._speaker_combo.addItem(label, speaker.id)
-
-        # Set current selection
-        if self.config.audio.speaker_device is not None:
-            for i in range(self._speaker_combo.count()):
-                if self._speaker_combo.itemData(i) == self.config.audio.speaker_device:
-                    self._speaker_combo.setCurrentIndex(i)
-                    break
+        """Re-enumerate the audio devices."""
+        self._load_devices(use_cache=False)
+
+    def _load_devices(self, use_cache: bool) -> None:
+        """Fill the device combos, enumerating devices off the UI thread."""
+        cache = SettingsDialog._device_cache
+        if (
+            use_cache
+            and cache is not None
+            and time.monotonic() - cache[0] < self.DEVICE_CACHE_TTL_S
+        ):
+            self._on_devices_loaded(cache[1], cache[2])
+            return
+
+        if self._device_loader is not None and self._device_loader.isRunning():
+            return
+
+        self._devices = None
+        for combo in (self._mic_combo, self._speaker_combo):
+            # A refresh keeps the current list up until the new one arrives
+            if combo not in self._device_signatures:
+                combo.clear()
+                combo.addItem("Loading…", None)
+            combo.setEnabled(False)
+        self._refresh_btn.setEnabled(False)
+
+        self._device_loader = DeviceLoader(self)
+        self._device_loader.devices_loaded.connect(self._on_devices_enumerated)
+        self._device_loader.start()
+
+    def _on_devices_enumerated(self, microphones: list, speakers: list) -> None:
+        """Cache a fresh enumeration for later dialogs and show it."""
+        SettingsDialog._device_cache = (time.monotonic(), microphones, speakers)
+        self._on_devices_loaded(microphones, speakers)
+
+    def _on_devices_loaded(self, microphones: list, speakers: list) -> None:
+        """Populate the device combos from an enumeration result."""
+        self._devices = (microphones, speakers)
+
+        with _updates_suspended(self):
+            self._fill_device_combo(
+                self._mic_combo, microphones, self.config.audio.microphone_device
+            )
+            self._fill_device_combo(
+                self._speaker_combo, speakers, self.config.audio.speaker_device
+            )
+
+        self._mic_combo.setEnabled(True)
+        self._speaker_combo.setEnabled(True)
+        self._refresh_btn.setEnabled(True)
+
+    def _fill_device_combo(self, combo: QComboBox, devices: list, selected) -> None:
+        """Replace a combo's items with "System Default" plus the devices."""
+        signature = tuple(
+            (device.id, device.name, device.is_default) for device in devices
+        )
+        if self._device_signatures.get(combo) == signature:
+            return
+        self._device_signatures[combo] = signature
+
+        full_labels = [
+            device.name + (" (default)" if device.is_default else "")
+            for device in devices
+        ]
+        metrics = combo.fontMetrics()
+        labels = ["System Default"] + [
+            metrics.elidedText(label, Qt.TextElideMode.ElideMiddle, self.DEVICE_LABEL_WIDTH)
+            for label in full_labels
+        ]
+        rows = {}
+
+        with QSignalBlocker(combo):
+            combo.clear()
+            combo.addItems(labels)
+            # Row 0 is "System Default", whose data stays None
+            for row, (device, label) in enumerate(zip(devices, full_labels), start=1):
+                combo.setItemData(row, device.id)
+                combo.setItemData(row, label, Qt.ItemDataRole.ToolTipRole)
+                rows.setdefault(device.id, row)
+
+            # Set current selection
+            row = rows.get(selected)
+            if row is not None:
+                combo.setCurrentIndex(row)
 
     def _save_settings(self) -> None:
         """Save settings and close dialog."""
-        # Update config
+        config = self.config
+        changed = False
+
         if self._model_combo.currentText():
-            self.config.ollama.model = self._model_combo.currentText()
+            changed |= _assign(config.ollama, "model", self._model_combo.currentText())
 
         if self._vision_model_combo.currentText():
-            self.config.ollama.vision_model = self._vision_model_combo.currentText()
+            changed |= _assign(
+                config.ollama, "vision_model", self._vision_model_combo.currentText()
+            )
 
-        self.config.ollama.system_prompt = self._prompt_edit.toPlainText()
+        changed |= _assign(config.ollama, "system_prompt", self._prompt_edit.toPlainText())
 
         # Apply language preset settings if selected
         lang = self._lang_combo.currentData()
-        if lang and lang in self._presets:
-            preset = self._presets[lang]
-            self.config.whisper.language = preset["whisper_lang"]
+        presets = _load_presets()
+        if lang and lang in presets:
+            preset = presets[lang]
+            changed |= _assign(config.whisper, "language", preset["whisper_lang"])
             # Only update Piper voice if using Piper
-            if self.config.tts_provider == "piper":
-                self.config.piper.voice = preset["piper_voice"]
-
-        self.config.audio.microphone_device = self._mic_combo.currentData()
-        self.config.audio.speaker_device = self._speaker_combo.currentData()
-        
-        # Mail config
-        self.config.mail.enabled = self._mail_enabled.isChecked()
-        self.config.mail.email = self._email_edit.text().strip()
-        self.config.mail.password = self._password_edit.text()
-        self.config.mail.imap_server = self._imap_server_edit.text().strip()
-        try:
-            self.config.mail.imap_port = int(self._imap_port_edit.text().strip())
-        except ValueError:
-            pass
-        self.config.mail.smtp_server = self._smtp_server_edit.text().strip()
-        try:
-            self.config.mail.smtp_port = int(self._smtp_port_edit.text().strip())
-        except ValueError:
-            pass
-            
-        self.config.mail.calendar_enabled = self._cal_enabled.isChecked()
-        self.config.mail.caldav_url = self._caldav_url_edit.text().strip()
-
-        # HA config
-        self.config.ha.enabled = self._ha_enabled.isChecked()
-        self.config.ha.url = self._ha_url_edit.text().strip()
-        self.config.ha.token = self._ha_token_edit.text()
+            if config.tts_provider == "piper":
+                changed |= _assign(config.piper, "voice", preset["piper_voice"])
+
+        # Keep the saved devices if enumeration hasn't finished yet
+        if self._devices is not None:
+            changed |= _assign(
+                config.audio, "microphone_device", self._mic_combo.currentData()
+            )
+            changed |= _assign(
+                config.audio, "speaker_device", self._speaker_combo.currentData()
+            )
+
+        # Mail and HA config
+        for tab in self._BINDINGS:
+            if self._is_tab_built(tab):
+                changed |= self._save_bound_settings(tab)
 
         # RSS config
-        self.config.rss.enabled = self._rss_enabled.isChecked()
-        # Rebuild feeds list from QListWidget
-        feeds = []
-        for i in range(self._rss_list.count()):
-            item_text = self._rss_list.item(i).text()
-            # Parse "Name - URL" format
-            if " - " in item_text:
-                name, url = item_text.split(" - ", 1)
-                feeds.append({"name": name, "url": url})
-        self.config.rss.feeds = feeds
-
-        # Save to file
-        self.config.save()
-
-        # Emit signal
-        self.settings_changed.emit()
+        if self._is_tab_built(self.RSS_TAB):
+            changed |= _assign(config.rss, "enabled", self._rss_enabled.isChecked())
+            changed |= _assign(config.rss, "feeds", self._rss_model.feeds())
+
+        # Only write the file and restart services when something changed
+        if changed:
+            config.save()
+            self.settings_changed.emit()
 
         self.accept()
 
+    def done(self, result: int) -> None:
+        """Wait for a running device enumeration before closing."""
+        if self._device_loader is not None:
+            self._device_loader.wait()
+        super().done(result)
+
     def _add_rss_feed(self) -> None:
         """Add a new RSS feed to the list."""
         name = self._rss_name_edit.text().strip()
@@ -444,12 +709,12 @@ Du har tilgang til brukerens webkamera og kan se dem når de spør. Hvis noen be
         if not url.startswith(("http://", "https://")):
             url = f"https://{url}"
 
-        self._rss_list.addItem(f"{name} - {url}")
+        self._rss_model.append_feed(name, url)
         self._rss_name_edit.clear()
         self._rss_url_edit.clear()
 
     def _remove_rss_feed(self) -> None:
         """Remove the selected RSS feed from the list."""
-        current_row = self._rss_list.currentRow()
-        if current_row >= 0:
-            self._rss_list.takeItem(current_row)
+        current = self._rss_list.currentIndex()
+        if current.isValid():
+            self._rss_model.remove_feed(current.row())
@@ -1,11 +1,13 @@
 """Task management window for Aida."""
 
+import functools
+from datetime import datetime
+
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
     QHBoxLayout,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QPushButton,
     QLineEdit,
     QLabel,
@@ -13,23 +15,136 @@ from PySide6.QtWidgets import (
     QInputDialog,
     QMessageBox,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer, QAbstractListModel, QModelIndex
+from PySide6.QtGui import QColor
 
 from src.tasks.models import Task, Priority
 from src.tasks.store import TaskStore
 
 
+def _task_signature(task: Task, overdue: bool) -> tuple:
+    """Everything a task row's text and color depend on."""
+    return (task.title, task.priority, task.due_date, overdue)
+
+
+# Priority -> (title prefix, color); overdue tasks without a color get OVERDUE_COLOR
+_PRIORITY_FORMAT: dict[Priority, tuple[str, QColor | None]] = {
+    Priority.HIGH: ("[HIGH] ", QColor(Qt.GlobalColor.red)),
+    Priority.MEDIUM: ("", None),
+    Priority.LOW: ("[low] ", None),
+}
+OVERDUE_COLOR = QColor(Qt.GlobalColor.darkRed)
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_task(
+    title: str, priority: Priority, due_date: datetime | None, overdue: bool
+) -> tuple[str, QColor | None]:
+    """Display text and foreground color for a task row."""
+    prefix, color = _PRIORITY_FORMAT[priority]
+
+    # Build display text
+    text = prefix + title
+
+    if due_date:
+        due_str = due_date.strftime("%b %d")
+        text += f"  (due: {due_str})"
+
+    if overdue:
+        text += " - OVERDUE!"
+
+    # Color coding
+    if color is None and overdue:
+        color = OVERDUE_COLOR
+
+    return text, color
+
+
+class TaskListModel(QAbstractListModel):
+    """Pending tasks as (task, overdue) rows."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[tuple[Task, bool]] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        task, overdue = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return _format_task(*_task_signature(task, overdue))[0]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return _format_task(*_task_signature(task, overdue))[1]
+        if role == Qt.ItemDataRole.UserRole:
+            return task.id
+        return None
+
+    def task(self, row: int) -> Task:
+        """The task shown at row, as of the last refresh."""
+        return self._rows[row][0]
+
+    def set_tasks(self, tasks: list[Task], now: datetime) -> None:
+        """Bring the rows in line with tasks, touching only rows that changed."""
+        pending_ids = {task.id for task in tasks}
+        for row in range(len(self._rows) - 1, -1, -1):
+            if self._rows[row][0].id not in pending_ids:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._rows[row]
+                self.endRemoveRows()
+
+        for row, task in enumerate(tasks):
+            entry = (task, task.overdue_at(now))
+            if row < len(self._rows) and self._rows[row][0].id == task.id:
+                old_task, old_overdue = self._rows[row]
+                self._rows[row] = entry
+                if _task_signature(old_task, old_overdue) != _task_signature(*entry):
+                    index = self.index(row)
+                    self.dataChanged.emit(index, index)
+                continue
+
+            source = next(
+                (j for j in range(row + 1, len(self._rows)) if self._rows[j][0].id == task.id),
+                None,
+            )
+            if source is None:
+                self.beginInsertRows(QModelIndex(), row, row)
+                self._rows.insert(row, entry)
+                self.endInsertRows()
+                continue
+
+            self.beginMoveRows(QModelIndex(), source, source, QModelIndex(), row)
+            old_task, old_overdue = self._rows.pop(source)
+            self._rows.insert(row, entry)
+            self.endMoveRows()
+            if _task_signature(old_task, old_overdue) != _task_signature(*entry):
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+
+
 class TasksWindow(QDialog):
     """Window for viewing and managing tasks."""
 
+    # Store changes within this window collapse into one list refresh
+    REFRESH_DELAY_MS = 16
+
     def __init__(self, store: TaskStore, parent=None):
         super().__init__(parent)
         self.store = store
+        # (id, title, priority, due, overdue) per row as last rendered
+        self._rendered: tuple | None = None
 
         self.setWindowTitle("Tasks")
         self.setMinimumWidth(450)
         self.setMinimumHeight(400)
 
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.REFRESH_DELAY_MS)
+        self._refresh_timer.timeout.connect(self._refresh_tasks)
+
         self._setup_ui()
         self._connect_signals()
         self._refresh_tasks()
@@ -42,8 +157,14 @@ class TasksWindow(QDialog):
         # Task list
         layout.addWidget(QLabel("Your Tasks:"))
 
-        self._task_list = QListWidget()
+        self._task_model = TaskListModel(self)
+        self._task_list = QListView()
+        self._task_list.setModel(self._task_model)
         self._task_list.setAlternatingRowColors(True)
+        # Rows are one line each; lay them out in batches as they scroll into view
+        self._task_list.setUniformItemSizes(True)
+        self._task_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self._task_list.setBatchSize(50)
         layout.addWidget(self._task_list)
 
         # Action buttons
@@ -96,78 +217,56 @@ class TasksWindow(QDialog):
 
     def _connect_signals(self) -> None:
         """Connect store signals for auto-refresh."""
-        self.store.task_created.connect(self._refresh_tasks)
-        self.store.task_updated.connect(self._refresh_tasks)
-        self.store.task_completed.connect(self._refresh_tasks)
-        self.store.task_deleted.connect(self._refresh_tasks)
+        self.store.task_created.connect(self._schedule_refresh)
+        self.store.tasks_created.connect(self._schedule_refresh)
+        self.store.task_updated.connect(self._schedule_refresh)
+        self.store.task_completed.connect(self._schedule_refresh)
+        self.store.task_deleted.connect(self._schedule_refresh)
 
         # UI signals
-        self._task_list.itemSelectionChanged.connect(self._update_button_states)
+        self._task_list.selectionModel().currentChanged.connect(self._update_button_states)
 
     def _update_button_states(self) -> None:
         """Update the enabled state of action buttons."""
-        has_selection = self._task_list.currentRow() >= 0
+        has_selection = self._task_list.currentIndex().isValid()
         self._done_btn.setEnabled(has_selection)
         self._edit_btn.setEnabled(has_selection)
         self._delete_btn.setEnabled(has_selection)
 
+    def _schedule_refresh(self) -> None:
+        """Refresh the list once a burst of store changes has settled."""
+        self._refresh_timer.start()
+
     def _refresh_tasks(self) -> None:
         """Refresh the task list."""
-        self._task_list.clear()
-
         tasks = self.store.get_pending_tasks()
+        now = datetime.now()
 
-        for task in tasks:
-            item = QListWidgetItem()
-            item.setData(Qt.ItemDataRole.UserRole, task.id)
-
-            # Build display text
-            text = task.title
-
-            if task.priority == Priority.HIGH:
-                text = f"[HIGH] {text}"
-            elif task.priority == Priority.LOW:
-                text = f"[low] {text}"
-
-            if task.due_date:
-                due_str = task.due_date.strftime("%b %d")
-                text += f"  (due: {due_str})"
-
-            if task.is_overdue:
-                text += " - OVERDUE!"
-
-            item.setText(text)
-
-            # Color coding
-            if task.priority == Priority.HIGH:
-                item.setForeground(Qt.GlobalColor.red)
-            elif task.is_overdue:
-                item.setForeground(Qt.GlobalColor.darkRed)
-
-            self._task_list.addItem(item)
-
+        # Skip the model entirely when nothing shown changed, e.g. a notes edit
+        rendered = tuple(
+            (task.id, *_task_signature(task, task.overdue_at(now))) for task in tasks
+        )
+        if rendered != self._rendered:
+            self._rendered = rendered
+            self._task_model.set_tasks(tasks, now)
         self._update_button_states()
 
-    def _get_selected_task_id(self) -> int | None:
-        """Get the ID of the selected task."""
-        current = self._task_list.currentItem()
-        if current:
-            return current.data(Qt.ItemDataRole.UserRole)
+    def _get_selected_task(self) -> Task | None:
+        """Get the selected task as last loaded from the store."""
+        current = self._task_list.currentIndex()
+        if current.isValid():
+            return self._task_model.task(current.row())
         return None
 
     def _mark_done(self) -> None:
         """Mark the selected task as done."""
-        task_id = self._get_selected_task_id()
-        if task_id:
-            self.store.complete_task(task_id)
+        task = self._get_selected_task()
+        if task:
+            self.store.complete_task(task.id)
 
     def _edit_task(self) -> None:
         """Edit the selected task."""
-        task_id = self._get_selected_task_id()
-        if not task_id:
-            return
-
-        task = self.store.get_task(task_id)
+        task = self._get_selected_task()
         if not task:
             return
 
@@ -180,15 +279,11 @@ class TasksWindow(QDialog):
         )
 
         if ok and new_title.strip():
-            self.store.update_task(task_id, title=new_title.strip())
+            self.store.update_task(task.id, title=new_title.strip())
 
     def _delete_task(self) -> None:
         """Delete the selected task."""
-        task_id = self._get_selected_task_id()
-        if not task_id:
-            return
-
-        task = self.store.get_task(task_id)
+        task = self._get_selected_task()
         if not task:
             return
 
@@ -201,7 +296,7 @@ class TasksWindow(QDialog):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            self.store.delete_task(task_id)
+            self.store.delete_task(task.id)
 
     def _add_task(self) -> None:
         """Add a new task."""
@@ -15,9 +15,13 @@ class TrayIcon(QObject):
     tasks_requested = Signal()
     toggle_listening = Signal()
 
+    # Theme lookup result, shared by every tray icon
+    _icon: QIcon | None = None
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
+        self._listening = False
         self._tray = QSystemTrayIcon()
         self._setup_icon()
         self._setup_menu()
@@ -26,8 +30,9 @@ class TrayIcon(QObject):
     def _setup_icon(self) -> None:
         """Set up the tray icon."""
         # Use a system icon as placeholder
-        icon = QIcon.fromTheme("assistant", QIcon.fromTheme("user-desktop"))
-        self._tray.setIcon(icon)
+        if TrayIcon._icon is None:
+            TrayIcon._icon = QIcon.fromTheme("assistant", QIcon.fromTheme("user-desktop"))
+        self._tray.setIcon(TrayIcon._icon)
         self._tray.setToolTip("Aida - AI Assistant")
 
     def _setup_menu(self) -> None:
@@ -79,6 +84,10 @@ class TrayIcon(QObject):
 
     def set_listening(self, listening: bool) -> None:
         """Update the listening state."""
+        if listening == self._listening:
+            return
+        self._listening = listening
+
         if listening:
             self._listen_action.setText("Stop Listening")
             self._tray.setToolTip("Aida - Listening...")
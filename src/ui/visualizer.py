@@ -1,13 +1,64 @@
 """Audio visualization widget."""
 
-import random
+import time
+import weakref
+
+import numpy as np
 from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import Qt, QTimer, QRectF
-from PySide6.QtGui import QPainter, QColor, QBrush, QPen
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QPainter, QPainterPath, QColor, QBrush, QPen
+
+
+class _AnimationClock:
+    """One timer driving every visible visualizer, at the fastest rate any needs."""
+
+    def __init__(self):
+        self._timer: QTimer | None = None
+        self._widgets: weakref.WeakSet[VisualizerWidget] = weakref.WeakSet()
+
+    def subscribe(self, widget: "VisualizerWidget") -> None:
+        """Start ticking widget."""
+        self._widgets.add(widget)
+        self.reschedule()
+
+    def unsubscribe(self, widget: "VisualizerWidget") -> None:
+        """Stop ticking widget."""
+        self._widgets.discard(widget)
+        self.reschedule()
+
+    def reschedule(self) -> None:
+        """Match the timer to the subscribed widgets' intervals."""
+        if not self._widgets:
+            if self._timer is not None:
+                self._timer.stop()
+            return
+
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.timeout.connect(self._tick)
+        interval = min(widget.tick_interval_ms() for widget in self._widgets)
+        if self._timer.interval() != interval:
+            self._timer.setInterval(interval)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _tick(self) -> None:
+        now = time.monotonic()
+        for widget in list(self._widgets):
+            widget._on_tick(now)
+
+
+_clock = _AnimationClock()
+
 
 class VisualizerWidget(QWidget):
     """Widget that simulates audio visualization."""
 
+    FRAME_INTERVAL_MS = 30  # ~30 FPS
+    IDLE_INTERVAL_MS = 200
+    # Bars that moved less than this since the last paint aren't repainted
+    REPAINT_THRESHOLD = 0.005
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumHeight(60)
@@ -17,15 +68,23 @@ class VisualizerWidget(QWidget):
         self._active = False
         self._mode = "idle"  # idle, listening, speaking
         
-        # Animation
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._update_bars)
-        self._timer.start(30)  # ~30 FPS
+        # Animation, driven by the shared clock while the widget is shown
+        self._last_tick = 0.0
         
         # Bars
         self._num_bars = 20
-        self._bars = [0.1] * self._num_bars
-        self._target_bars = [0.1] * self._num_bars
+        self._bars = np.full(self._num_bars, 0.1)
+        self._target_bars = np.full(self._num_bars, 0.1)
+        self._painted_bars = self._bars.copy()
+        self._rng = np.random.default_rng()
+        # Speaking mode peaks in the center and tapers towards the edges
+        dist = np.abs(np.arange(self._num_bars) - self._num_bars // 2)
+        self._speaking_scale = np.maximum(0.1, 1.0 - dist / (self._num_bars / 2))
+        # Bar x positions and width, recomputed on resize
+        self._bar_gap = 2
+        self._bar_xs: list[float] = []
+        self._bar_width = 0.0
+        self._layout_bars(self.width())
         
         # Colors
         self._idle_color = QColor("#555555")
@@ -34,35 +93,81 @@ class VisualizerWidget(QWidget):
 
     def set_mode(self, mode: str):
         """Set visualization mode: 'idle', 'listening', 'speaking'."""
+        if mode == self._mode:
+            return
         self._mode = mode
+        if self.isVisible():
+            _clock.reschedule()
         self.update()
 
+    def tick_interval_ms(self) -> int:
+        """How often this widget's bars should move."""
+        return self.IDLE_INTERVAL_MS if self._mode == "idle" else self.FRAME_INTERVAL_MS
+
+    def showEvent(self, event):
+        """Animate while visible."""
+        super().showEvent(event)
+        _clock.subscribe(self)
+
+    def hideEvent(self, event):
+        """Stop animating while hidden."""
+        super().hideEvent(event)
+        _clock.unsubscribe(self)
+
+    def _on_tick(self, now: float) -> None:
+        """Advance the bars if this widget's interval has passed."""
+        # Half a frame of slack so timer jitter doesn't skip a whole interval
+        if (now - self._last_tick) * 1000 < self.tick_interval_ms() - self.FRAME_INTERVAL_MS / 2:
+            return
+        self._last_tick = now
+        self._update_bars()
+
     def _update_bars(self):
         """Update bar heights."""
         # Smoothing factor
         alpha = 0.2
-        
-        for i in range(self._num_bars):
-            # Generate target based on mode
-            if self._mode == "idle":
-                # Gentle wave
-                self._target_bars[i] = 0.1 + 0.05 * random.random()
-            elif self._mode == "listening":
-                # High energy, erratic
-                self._target_bars[i] = random.uniform(0.1, 0.8)
-            elif self._mode == "speaking":
-                # Rhythmic, center-focused
-                dist = abs(i - self._num_bars // 2)
-                scale = max(0.1, 1.0 - (dist / (self._num_bars / 2)))
-                self._target_bars[i] = random.uniform(0.2, 0.9) * scale
-
-            # Interpolate
-            self._bars[i] = self._bars[i] * (1 - alpha) + self._target_bars[i] * alpha
-            
-        self.update()
+
+        # Generate targets based on mode, all bars at once
+        bars = self._bars
+        target = self._target_bars
+        mode = self._mode
+        self._rng.random(out=target)
+        if mode == "idle":
+            # Gentle wave
+            target *= 0.05
+            target += 0.1
+        elif mode == "listening":
+            # High energy, erratic
+            target *= 0.7
+            target += 0.1
+        elif mode == "speaking":
+            # Rhythmic, center-focused
+            target *= 0.7
+            target += 0.2
+            target *= self._speaking_scale
+
+        # Interpolate
+        target -= bars
+        target *= alpha
+        bars += target
+
+        if np.abs(bars - self._painted_bars).max() > self.REPAINT_THRESHOLD:
+            self.update()
+
+    def _layout_bars(self, width: int) -> None:
+        """Compute horizontal bar geometry for a widget width."""
+        slot = width / self._num_bars
+        self._bar_xs = (np.arange(self._num_bars) * slot + self._bar_gap / 2).tolist()
+        self._bar_width = slot - self._bar_gap
+
+    def resizeEvent(self, event):
+        """Recompute bar geometry for the new width."""
+        super().resizeEvent(event)
+        self._layout_bars(event.size().width())
 
     def paintEvent(self, event):
         """Draw the visualization."""
+        self._painted_bars[:] = self._bars
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
@@ -80,17 +185,13 @@ class VisualizerWidget(QWidget):
         painter.setBrush(QBrush(color))
         painter.setPen(Qt.PenStyle.NoPen)
         
-        w = self.width()
         h = self.height()
-        bar_width = w / self._num_bars
-        gap = 2
-        
-        for i, val in enumerate(self._bars):
-            # Calculate bar dimensions
-            bar_h = val * h * 0.8
-            x = i * bar_width + gap / 2
-            y = (h - bar_h) / 2 # Center vertically
-            
-            # Draw rounded rect
-            rect = QRectF(x, y, bar_width - gap, bar_h)
-            painter.drawRoundedRect(rect, 4, 4)
+        bar_heights = self._bars * (h * 0.8)
+        bar_ys = (h - bar_heights) / 2  # Center vertically
+
+        # All bars as rounded rects in one path, filled with a single draw call
+        path = QPainterPath()
+        bar_width = self._bar_width
+        for x, y, bar_h in zip(self._bar_xs, bar_ys.tolist(), bar_heights.tolist()):
+            path.addRoundedRect(x, y, bar_width, bar_h, 4, 4)
+        painter.drawPath(path)
@@ -1,11 +1,35 @@
 """Webcam integration for Aida."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import cv2
 import numpy as np
 
 from src.core.config import CameraConfig
 
+try:
+    from turbojpeg import TurboJPEG
+    _turbojpeg = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    # Not installed, or libturbojpeg itself is missing
+    _turbojpeg = None
+
+# Frames sent to the vision model; it downsamples larger images anyway
+VISION_MAX_SIDE = 1024
+VISION_JPEG_QUALITY = 75
+
+# Device indexes list_cameras considers
+MAX_CAMERA_INDEX = 10
+
+# How long capture_frame waits for the first frame after opening
+FIRST_FRAME_TIMEOUT_S = 2.0
+
+# Consecutive failed reads before the grabber gives up on the device; the
+# next capture_frame then reopens it
+MAX_READ_FAILURES = 5
+READ_RETRY_DELAY_S = 0.1
+
 
 class Camera:
     """Webcam capture and processing."""
@@ -14,26 +38,90 @@ class Camera:
         self.config = config
         self.capture: cv2.VideoCapture | None = None
 
+        # Background reader keeping only the newest frame, so the driver's
+        # queue never holds stale frames and reads don't block on the device
+        self._grabber: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._frame_ready = threading.Event()
+        self._lock = threading.Lock()
+        self._latest: np.ndarray | None = None
+
     def open(self) -> bool:
         """Open the camera."""
+        if self.is_open():
+            return True
+
+        # Forget a grabber that gave up on the device
+        self.close()
+
         self.capture = cv2.VideoCapture(self.config.device_id)
 
         if not self.capture.isOpened():
+            self.capture.release()
+            self.capture = None
             return False
 
         self.capture.set(cv2.CAP_PROP_FRAME_WIDTH, self.config.width)
         self.capture.set(cv2.CAP_PROP_FRAME_HEIGHT, self.config.height)
+
+        # Each grabber gets its own stop event, so one that close() could not
+        # join never picks up a later open()
+        self._stop = threading.Event()
+        self._frame_ready.clear()
+        self._grabber = threading.Thread(
+            target=self._grab_loop,
+            args=(self.capture, self._stop),
+            name="camera-grabber",
+            daemon=True,
+        )
+        self._grabber.start()
         return True
 
+    def _grab_loop(self, capture: cv2.VideoCapture, stop: threading.Event) -> None:
+        """Read frames until stopped, keeping the newest one.
+
+        The grabber owns the capture and releases it on exit, so the device
+        is never released while a read() is still in progress.
+        """
+        failures = 0
+        try:
+            while not stop.is_set():
+                ret, frame = capture.read()
+                if stop.is_set():
+                    break
+                if not ret:
+                    failures += 1
+                    if failures >= MAX_READ_FAILURES:
+                        break
+                    stop.wait(READ_RETRY_DELAY_S)
+                    continue
+                failures = 0
+                with self._lock:
+                    self._latest = frame
+                self._frame_ready.set()
+        finally:
+            capture.release()
+            if not stop.is_set():
+                # The device stopped delivering: drop the stale frame and
+                # don't leave capture_frame waiting
+                with self._lock:
+                    self._latest = None
+                self._frame_ready.set()
+
     def close(self) -> None:
         """Close the camera."""
-        if self.capture is not None:
-            self.capture.release()
-            self.capture = None
+        if self._grabber is not None:
+            self._stop.set()
+            self._grabber.join(timeout=FIRST_FRAME_TIMEOUT_S)
+            self._grabber = None
+        self.capture = None
+        with self._lock:
+            self._latest = None
 
     def is_open(self) -> bool:
         """Check if camera is open."""
-        return self.capture is not None and self.capture.isOpened()
+        # The grabber exits, releasing the capture, once the device fails
+        return self._grabber is not None and self._grabber.is_alive()
 
     def capture_frame(self) -> np.ndarray | None:
         """Capture a single frame."""
@@ -41,10 +129,10 @@ class Camera:
             if not self.open():
                 return None
 
-        ret, frame = self.capture.read()
-        if ret:
-            return frame
-        return None
+        self._frame_ready.wait(FIRST_FRAME_TIMEOUT_S)
+        # The grabber stores a new array per frame, so this one is never overwritten
+        with self._lock:
+            return self._latest
 
     def capture_photo(self, output_path: Path | str) -> bool:
         """Capture and save a photo."""
@@ -62,18 +150,53 @@ class Camera:
         if frame is None:
             return None
 
-        _, buffer = cv2.imencode(".jpg", frame)
-        return base64.b64encode(buffer).decode("utf-8")
+        height, width = frame.shape[:2]
+        scale = VISION_MAX_SIDE / max(height, width)
+        if scale < 1:
+            frame = cv2.resize(
+                frame,
+                (round(width * scale), round(height * scale)),
+                interpolation=cv2.INTER_AREA,
+            )
+
+        if _turbojpeg is not None:
+            buffer = _turbojpeg.encode(frame, quality=VISION_JPEG_QUALITY)
+        else:
+            _, buffer = cv2.imencode(
+                ".jpg",
+                frame,
+                [cv2.IMWRITE_JPEG_QUALITY, VISION_JPEG_QUALITY, cv2.IMWRITE_JPEG_OPTIMIZE, 1],
+            )
+        return base64.b64encode(buffer).decode("ascii")
+
+    @staticmethod
+    def _probe_camera(index: int) -> bool:
+        """Whether a camera index can be opened."""
+        cap = cv2.VideoCapture(index)
+        try:
+            return cap.isOpened()
+        finally:
+            cap.release()
 
     def list_cameras(self) -> list[int]:
         """List available camera devices."""
-        available = []
-        for i in range(10):
-            cap = cv2.VideoCapture(i)
-            if cap.isOpened():
-                available.append(i)
-                cap.release()
-        return available
+        dev = Path("/dev")
+        if dev.is_dir():
+            # V4L2: only indexes with a device node can open, skip the rest
+            candidates = sorted(
+                int(node.name[5:])
+                for node in dev.glob("video*")
+                if node.name[5:].isdigit() and int(node.name[5:]) < MAX_CAMERA_INDEX
+            )
+        else:
+            candidates = list(range(MAX_CAMERA_INDEX))
+        if not candidates:
+            return []
+
+        # A missing or busy device can block for a while; probe them side by side
+        with ThreadPoolExecutor(max_workers=len(candidates)) as pool:
+            opened = pool.map(self._probe_camera, candidates)
+            return [index for index, ok in zip(candidates, opened) if ok]
 
     def __enter__(self):
         self.open()
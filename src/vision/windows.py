@@ -1,6 +1,8 @@
 """Window management and screenshot capture for Aida."""
 
 import base64
+import functools
+import shutil
 import subprocess
 from dataclasses import dataclass
 from datetime import datetime
@@ -18,29 +20,75 @@ class Window:
     is_active: bool = False
 
 
+@functools.cache
+def _has_tool(tool: str) -> bool:
+    """Check if a system tool is on PATH; fixed for the process lifetime."""
+    return shutil.which(tool) is not None
+
+
 class WindowManager:
     """Manage windows and capture screenshots."""
 
     def __init__(self):
-        self._has_spectacle = self._check_tool("spectacle")
-        self._has_xdotool = self._check_tool("xdotool")
-        self._has_maim = self._check_tool("maim")
-        self._has_scrot = self._check_tool("scrot")
-
-    def _check_tool(self, tool: str) -> bool:
-        """Check if a system tool is available."""
+        self._has_spectacle = _has_tool("spectacle")
+        self._has_xdotool = _has_tool("xdotool")
+        self._has_wmctrl = _has_tool("wmctrl")
+        self._has_maim = _has_tool("maim")
+        self._has_scrot = _has_tool("scrot")
+
+    def _get_active_window_id(self) -> str:
+        """Decimal id of the focused window, or "" if unknown."""
+        if not self._has_xdotool:
+            return ""
+        result = subprocess.run(
+            ["xdotool", "getactivewindow"],
+            capture_output=True,
+            text=True,
+        )
+        return result.stdout.strip()
+
+    def _list_windows_wmctrl(self) -> list[Window]:
+        """List windows with one wmctrl call instead of xdotool per window."""
         try:
-            subprocess.run(
-                ["which", tool],
+            result = subprocess.run(
+                ["wmctrl", "-lp"],
                 capture_output=True,
+                text=True,
                 check=True,
             )
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        except subprocess.CalledProcessError:
+            return []
+
+        active_id = self._get_active_window_id()
+        windows = []
+        # Lines are: <hex id> <desktop> <pid> <host> <title>
+        for line in result.stdout.splitlines():
+            parts = line.split(None, 4)
+            if len(parts) < 5:
+                continue
+            hex_id, _, pid_str, _, name = parts
+            name = name.strip()
+
+            # Skip empty names and desktop
+            if not name or name in ("Desktop", "Plasma"):
+                continue
+
+            # Same decimal ids as xdotool reports
+            wid = str(int(hex_id, 16))
+            pid = int(pid_str) if pid_str.isdigit() and pid_str != "0" else None
+            windows.append(Window(
+                id=wid,
+                name=name,
+                pid=pid,
+                is_active=(wid == active_id),
+            ))
+
+        return windows
 
     def list_windows(self) -> list[Window]:
         """List all open windows."""
+        if self._has_wmctrl:
+            return self._list_windows_wmctrl()
         if not self._has_xdotool:
             return []
 
@@ -153,24 +201,33 @@ class WindowManager:
         except subprocess.CalledProcessError:
             return False
 
+    def _capture_to_stdout(self, command: list[str]) -> str:
+        """Run a capture tool that writes the PNG to stdout, return as base64."""
+        result = subprocess.run(command, check=True, capture_output=True)
+        return base64.b64encode(result.stdout).decode("ascii")
+
+    def _read_capture(self, output_path: Path) -> str:
+        """Read a captured image file as base64 and remove it."""
+        raw = output_path.read_bytes()
+        output_path.unlink()
+        return base64.b64encode(raw).decode("ascii")
+
     def capture_desktop(self) -> str | None:
         """Capture full desktop screenshot, return as base64."""
-        output_path = Path(f"/tmp/aida_desktop_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png")
-
         try:
             if self._has_spectacle:
+                output_path = Path(f"/tmp/aida_desktop_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png")
                 subprocess.run(
                     ["spectacle", "-b", "-n", "-o", str(output_path)],
                     check=True,
                     capture_output=True,
                 )
             elif self._has_maim:
-                subprocess.run(
-                    ["maim", str(output_path)],
-                    check=True,
-                    capture_output=True,
-                )
+                # No file argument: maim writes the image to stdout
+                return self._capture_to_stdout(["maim"])
             elif self._has_scrot:
+                # Older scrot releases treat "-" as a file name, so use a file
+                output_path = Path(f"/tmp/aida_desktop_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png")
                 subprocess.run(
                     ["scrot", str(output_path)],
                     check=True,
@@ -179,22 +236,14 @@ class WindowManager:
             else:
                 return None
 
-            # Read and encode as base64
-            with open(output_path, "rb") as f:
-                image_data = base64.b64encode(f.read()).decode("utf-8")
-
-            # Clean up temp file
-            output_path.unlink()
-
-            return image_data
+            # Spectacle and scrot write to a file
+            return self._read_capture(output_path)
 
         except subprocess.CalledProcessError:
             return None
 
     def capture_window(self, window_id: str | None = None) -> str | None:
         """Capture a specific window or active window, return as base64."""
-        output_path = Path(f"/tmp/aida_window_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png")
-
         try:
             if window_id is None:
                 # Get active window
@@ -212,6 +261,7 @@ class WindowManager:
 
             if self._has_spectacle:
                 # Spectacle -a captures active window
+                output_path = Path(f"/tmp/aida_window_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png")
                 subprocess.run(
                     ["spectacle", "-b", "-n", "-a", "-o", str(output_path)],
                     check=True,
@@ -220,22 +270,12 @@ class WindowManager:
             elif self._has_maim:
                 if not window_id:
                      return None
-                subprocess.run(
-                    ["maim", "-i", window_id, str(output_path)],
-                    check=True,
-                    capture_output=True,
-                )
+                return self._capture_to_stdout(["maim", "-i", window_id])
             else:
                 return None
 
-            # Read and encode as base64
-            with open(output_path, "rb") as f:
-                image_data = base64.b64encode(f.read()).decode("utf-8")
-
-            # Clean up temp file
-            output_path.unlink()
-
-            return image_data
+            # Spectacle can only write to a file
+            return self._read_capture(output_path)
 
         except subprocess.CalledProcessError:
             return None
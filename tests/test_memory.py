@@ -0,0 +1,106 @@
+import hashlib
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.memory.database import MemoryDatabase
+from src.memory.facts import UserFactsStore
+
+
+def test_search_facts_non_ascii_case():
+    """Test fact search folds case for non-ASCII letters like Æ and Ø."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = MemoryDatabase(Path(tmpdir) / "test.db")
+        facts = UserFactsStore(db)
+
+        facts.set_fact("personal", "location", "TROMSØ")
+        facts.set_fact("personal", "name", "Ærlig")
+        facts.set_fact("preferences", "likes", "100% kaffe")
+
+        assert [f.value for f in facts.search_facts("tromsø")["personal"]] == ["TROMSØ"]
+        assert [f.value for f in facts.search_facts("ærl")["personal"]] == ["Ærlig"]
+        assert list(facts.search_facts("LOCATION")) == ["personal"]
+        # Wildcard characters in the query are matched literally
+        assert list(facts.search_facts("100%")) == ["preferences"]
+        assert facts.search_facts("_") == {}
+
+        db.close()
+
+
+class _HashEncoder:
+    """Deterministic stand-in for the sentence-transformer model."""
+
+    def encode(self, texts, **kwargs):
+        single = isinstance(texts, str)
+        vectors = []
+        for text in [texts] if single else texts:
+            seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:4], "little")
+            vector = np.random.default_rng(seed).standard_normal(384)
+            vectors.append(vector / np.linalg.norm(vector))
+        array = np.asarray(vectors, dtype=np.float32)
+        return array[0] if single else array
+
+
+def test_repeated_text_is_searchable_in_each_session():
+    """Test identical messages in two sessions are each found in their session."""
+    pytest.importorskip("faiss")
+    from src.memory.manager import MemoryManager
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = MemoryManager(data_dir=Path(tmpdir), cache_dir=Path(tmpdir) / "cache")
+        manager.embeddings._model = _HashEncoder()
+        conversations = manager.conversations
+
+        first = manager.start_session()
+        second = manager.start_session()
+        items = []
+        for session_id in (first, first, second):
+            message = conversations.add_message(session_id, "user", "Water the plants")
+            items.append((message.id, session_id, message.content))
+
+        manager._process_embedding_queue(items)
+
+        for session_id in (first, second):
+            hits = manager.embeddings.search_in_session("Water the plants", session_id)
+            assert [hit.session_id for hit in hits] == [session_id]
+
+        # The repeat within a session shares that session's vector
+        embedding_ids = [
+            message.embedding_id
+            for session_id in (first, second)
+            for message in conversations.get_messages(session_id)
+        ]
+        assert embedding_ids[0] == embedding_ids[1] != embedding_ids[2]
+
+        manager.cleanup()
+
+
+@pytest.mark.parametrize("search_parameters", [True, False])
+def test_search_in_session(monkeypatch, search_parameters):
+    """Test session search, with and without faiss search-time ID filters."""
+    faiss = pytest.importorskip("faiss")
+    from src.memory.embeddings import EmbeddingStore
+
+    if not search_parameters:
+        monkeypatch.delattr(faiss, "SearchParameters")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = MemoryDatabase(Path(tmpdir) / "test.db")
+        store = EmbeddingStore(db, data_dir=Path(tmpdir) / "embeddings")
+        store._model = _HashEncoder()
+
+        store.add_embeddings([
+            (1, "a", "Water the plants", None),
+            (2, "b", "Water the plants", None),
+            (3, "a", "Buy milk", None),
+        ])
+
+        hits = store.search_in_session("Water the plants", "b", min_score=0.5)
+        assert [(hit.message_id, hit.session_id) for hit in hits] == [(2, "b")]
+        assert store.search_in_session("Buy milk", "b", min_score=0.5) == []
+        assert store.search_in_session("Buy milk", "missing") == []
+
+        store.cleanup()
+        db.close()
@@ -1,9 +1,10 @@
+import sqlite3
 import tempfile
 from pathlib import Path
 
-from src.memory.database import MemoryDatabase
+from src.memory.database import SCHEMA, TASK_SCHEMA, MemoryDatabase
 from src.tasks.store import TaskStore
-from src.tasks.models import Priority
+from src.tasks.models import Priority, TaskStatus
 
 def test_create_task_with_string_priority():
     """Test creating a task with string priority (regression test)."""
@@ -27,3 +28,158 @@ def test_create_task_with_string_priority():
         assert task_enum.priority == Priority.LOW
 
         db.close()
+
+
+def test_migrate_v2_database_is_idempotent():
+    """Test upgrading a v2 database, then re-running the migration steps."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+
+        # A version 2 database, with the one-row-per-version history old
+        # releases wrote
+        conn = sqlite3.connect(db_path)
+        conn.executescript(SCHEMA)
+        conn.executescript(TASK_SCHEMA)
+        conn.execute("INSERT INTO schema_version (version) VALUES (1), (2)")
+        conn.execute("INSERT INTO tasks (title, priority) VALUES ('Old task', 'high')")
+        conn.commit()
+        conn.close()
+
+        db = MemoryDatabase(db_path)
+        db.close()
+        db = MemoryDatabase(db_path)
+
+        # Force the full migration path, as if another process raced us
+        db._peek_schema_version = lambda: 0
+        db._init_schema()
+        db.execute("DELETE FROM schema_version WHERE version > 4")
+        db._init_schema()
+
+        row = db.fetchone("SELECT priority_rank FROM tasks WHERE title = 'Old task'")
+        assert row["priority_rank"] == 1
+        assert db.fetchone("SELECT MAX(version) FROM schema_version")[0] == 7
+
+        store = TaskStore(db)
+        assert [task.title for task in store.get_pending_tasks()] == ["Old task"]
+
+        db.close()
+
+
+def test_search_tasks():
+    """Test task search matches word prefixes in titles and descriptions."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = MemoryDatabase(Path(tmpdir) / "test.db")
+        store = TaskStore(db)
+
+        store.create_task(title="Buy milk", description="Low fat")
+        store.create_task(title="Call the plumber")
+        store.create_task(title="Bake bread", description="Buy yeast first")
+
+        assert {task.title for task in store.search_tasks("buy")} == {"Buy milk", "Bake bread"}
+        assert [task.title for task in store.search_tasks("plumb")] == ["Call the plumber"]
+        assert [task.title for task in store.search_tasks("milk fat")] == ["Buy milk"]
+        assert store.search_tasks("groceries") == []
+
+        db.close()
+
+
+def test_task_stats_match_task_lists():
+    """Test get_task_stats agrees with the per-list queries it replaced."""
+    from datetime import datetime, timedelta
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = MemoryDatabase(Path(tmpdir) / "test.db")
+        store = TaskStore(db)
+        now = datetime.now()
+
+        store.create_task(title="Overdue", due_date=now - timedelta(hours=2))
+        store.create_task(title="Due soon", due_date=now + timedelta(hours=3))
+        store.create_task(title="Due later", due_date=now + timedelta(days=5))
+        store.create_task(title="No due date")
+        done = store.create_task(title="Done", due_date=now - timedelta(hours=1))
+        store.complete_task(done.id)
+
+        stats = store.get_task_stats()
+
+        assert stats == {
+            "total": store.get_task_count(),
+            "pending": len(store.get_pending_tasks()),
+            "completed": store.get_task_count(TaskStatus.COMPLETED),
+            "overdue": len(store.get_overdue_tasks()),
+            "due_soon": len(store.get_tasks_due_soon()),
+        }
+        assert stats == {
+            "total": 5, "pending": 4, "completed": 1, "overdue": 1, "due_soon": 2,
+        }
+
+        db.close()
+
+
+def test_parse_add_command_titles():
+    """Test time and priority phrases are stripped from parsed titles."""
+    from datetime import datetime
+
+    from src.tasks.voice_patterns import TaskVoiceParser
+
+    parser = TaskVoiceParser()
+    now = datetime(2026, 10, 16, 12, 0)
+
+    cases = {
+        "add task buy milk tomorrow high priority": "buy milk",
+        "remind me to call mom in 2 hours": "call mom",
+        "add task read book not important": "read book",
+        "add task water plants urgent": "water plants",
+        "legg til vaske bilen i morgen viktig": "vaske bilen",
+    }
+    for message, title in cases.items():
+        cmd = parser.parse(message, now=now)
+        assert cmd.action == "add"
+        assert cmd.title == title, message
+
+
+def test_cached_reads_return_independent_tasks():
+    """Test changing a Task from a cached read doesn't affect later reads."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = MemoryDatabase(Path(tmpdir) / "test.db")
+        store = TaskStore(db)
+        store.create_task(title="Buy milk")
+
+        first = store.get_pending_tasks()
+        first[0].status = TaskStatus.COMPLETED
+        first[0].title = "Changed"
+        first.clear()
+
+        again = store.get_pending_tasks()
+        assert [(task.title, task.status) for task in again] == [("Buy milk", TaskStatus.PENDING)]
+        assert store.find_task_by_title("Buy milk") is not store.find_task_by_title("Buy milk")
+
+        db.close()
+
+
+def test_ha_sync_stops_worker_threads():
+    """Test an HA sync leaves no worker threads running afterwards."""
+    import threading
+
+    from src.tasks.ha_sync import HomeAssistantSync
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = MemoryDatabase(Path(tmpdir) / "test.db")
+        store = TaskStore(db)
+        store.create_task(title="Local item", ha_list_name="Handleliste")
+
+        ha_lists = {"Dag til dag": ["Call mom"], "Handleliste": ["Milk"]}
+        sync = HomeAssistantSync(
+            store,
+            get_items_func=lambda todo_list, status: [{"summary": s} for s in ha_lists[todo_list]],
+            add_item_func=lambda name, item: ha_lists[name].append(item),
+            complete_item_func=lambda name, item: None,
+        )
+
+        stats = sync.sync_all_lists()
+
+        assert stats["pulled"] == 2
+        assert stats["errors"] == 0
+        assert "Local item" in ha_lists["Handleliste"]
+        assert not [t for t in threading.enumerate() if t.name.startswith("ha-sync")]
+
+        db.close()